@@ -0,0 +1,214 @@
+"""
+Script for benchmarking the simulation hot paths with seeded shoes (and process startup time), and flagging regressions
+against a stored baseline.
+
+Run from the repository root:
+
+    $ python -m benchmarks.run                  # Run, write results JSON and compare against the baseline
+    $ python -m benchmarks.run --save-baseline  # Run and store the results as the new baseline
+
+The baseline is deliberately machine-local (and git-ignored): timings only compare meaningfully on the same hardware, so
+save a baseline on your machine (e.g. on the main branch) before comparing a change against it.
+"""
+
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from argparse import ArgumentParser
+from collections import OrderedDict
+
+from blackjack.configuration import get_simulation_configuration
+from blackjack.game_setup import setup_game
+from blackjack.models.hand import GamblerHand
+from blackjack.models.shoe import Shoe
+from blackjack.simulation.seeding import game_rng
+from blackjack.strategies.default_static_strategy import DefaultStaticStrategy
+
+
+DIRECTORY = os.path.dirname(os.path.realpath(__file__))
+ROOT_DIRECTORY = os.path.dirname(DIRECTORY)
+BASELINE_PATH = os.path.join(DIRECTORY, 'baseline.json')
+RESULTS_PATH = os.path.join(DIRECTORY, 'results.json')
+
+SEED = 1234
+NUMBER_OF_DECKS = 8
+
+
+def best_time(func, repeats):
+    """Run a function several times and return the best (least noisy) wall time in seconds."""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def result(value, unit, higher_is_better=True):
+    """Format a benchmark result."""
+    return {'value': value, 'unit': unit, 'higher_is_better': higher_is_better}
+
+
+# Benchmarks
+
+def bench_shoe_deal_card(repeats, num_cards=500000):
+    """Throughput of dealing cards from a seeded Shoe (including the reshuffles of exhausted piles)."""
+    shoe = Shoe(NUMBER_OF_DECKS, rng=random.Random(SEED))
+
+    def deal():
+        for _ in range(num_cards):
+            shoe.deal_card()
+
+    return result(num_cards / best_time(deal, repeats), 'cards/s')
+
+
+def bench_shoe_reset_card_pile(repeats, num_shuffles=500):
+    """Throughput of reshuffling a seeded Shoe."""
+    shoe = Shoe(NUMBER_OF_DECKS, rng=random.Random(SEED))
+
+    def reshuffle():
+        for _ in range(num_shuffles):
+            shoe.reset_card_pile()
+
+    return result(num_shuffles / best_time(reshuffle, repeats), 'shuffles/s')
+
+
+def seeded_hands(num_hands):
+    """Get two and three card GamblerHands dealt from a seeded Shoe."""
+    shoe = Shoe(NUMBER_OF_DECKS, rng=random.Random(SEED))
+    return [GamblerHand(cards=shoe.deal_n_cards(2 + i % 2)) for i in range(num_hands)]
+
+
+def bench_hand_possible_totals(repeats, num_hands=10000, calls_per_hand=20):
+    """Throughput of `Hand.possible_totals()`."""
+    hands = seeded_hands(num_hands)
+
+    def total():
+        for hand in hands:
+            for _ in range(calls_per_hand):
+                hand.possible_totals()
+
+    return result(num_hands * calls_per_hand / best_time(total, repeats), 'calls/s')
+
+
+def bench_get_hand_action(repeats, num_hands=20000):
+    """Latency of `BaseStaticStrategy.get_hand_action()` (with every option available, as on a fresh hand)."""
+    strategy = DefaultStaticStrategy()
+    hands = [hand for hand in seeded_hands(num_hands) if hand.final_total() < 21]
+    upcards = Shoe(NUMBER_OF_DECKS, rng=random.Random(SEED + 1)).deal_n_cards(len(hands))
+    options = OrderedDict([('h', 'Hit'), ('s', 'Stand'), ('d', 'Double'), ('x', 'Split')])
+
+    def decide():
+        for hand, upcard in zip(hands, upcards):
+            strategy.get_hand_action(hand, options, upcard)
+
+    return result(best_time(decide, repeats) / len(hands) * 1e6, 'us/call', higher_is_better=False)
+
+
+def bench_game_controller_play(repeats, num_games=20, max_turns=1000):
+    """Throughput of playing seeded games with `GameController.play()` (headless)."""
+    configuration = get_simulation_configuration(1e9, 100.0, NUMBER_OF_DECKS, DefaultStaticStrategy, max_turns)
+
+    def play():
+        for game_index in range(num_games):
+            setup_game(configuration, rng=game_rng(SEED, game_index)).play()
+
+    return result(num_games * max_turns / best_time(play, repeats), 'hands/s')
+
+
+def bench_simulate(repeats, concurrency, num_games=400):
+    """End-to-end wall time of the `simulate.py` script (with plots rendered off screen)."""
+    command = [
+        sys.executable, 'simulate.py', '--games', str(num_games), '--concurrency', str(concurrency),
+        '--decks', str(NUMBER_OF_DECKS), '--seed', str(SEED)
+    ]
+    environment = dict(os.environ, MPLBACKEND='Agg')
+
+    def simulate():
+        subprocess.run(command, cwd=ROOT_DIRECTORY, env=environment, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    return result(best_time(simulate, repeats), 's', higher_is_better=False)
+
+
+def bench_startup(repeats, arguments):
+    """Wall time of starting a Python process that runs the given arguments (i.e. import time, for short commands)."""
+    command = [sys.executable] + arguments
+
+    def start():
+        subprocess.run(command, cwd=ROOT_DIRECTORY, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    return result(best_time(start, repeats), 's', higher_is_better=False)
+
+
+def run_benchmarks(repeats, concurrency_levels):
+    """Run all benchmarks and return their results by name."""
+    benchmarks = [
+        ('shoe_deal_card', lambda: bench_shoe_deal_card(repeats)),
+        ('shoe_reset_card_pile', lambda: bench_shoe_reset_card_pile(repeats)),
+        ('hand_possible_totals', lambda: bench_hand_possible_totals(repeats)),
+        ('strategy_get_hand_action', lambda: bench_get_hand_action(repeats)),
+        ('game_controller_play', lambda: bench_game_controller_play(repeats)),
+        ('startup_worker_imports', lambda: bench_startup(repeats, ['-c', 'import blackjack.simulation.jobs'])),
+        ('startup_simulate_help', lambda: bench_startup(repeats, ['simulate.py', '--help']))
+    ]
+    for concurrency in concurrency_levels:
+        benchmarks.append((f"simulate_concurrency_{concurrency}", lambda c=concurrency: bench_simulate(repeats, c)))
+
+    results = OrderedDict()
+    for name, benchmark in benchmarks:
+        results[name] = benchmark()
+        print(f"{name}: {results[name]['value']:,.3f} {results[name]['unit']}")
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Compare results against a baseline. Return the names of benchmarks that regressed by more than the threshold."""
+    regressions = []
+    for name, current in results.items():
+        if name not in baseline:
+            continue
+        previous = baseline[name]['value']
+        change = (current['value'] - previous) / previous
+        if not current['higher_is_better']:
+            change = -change  # Positive change is always an improvement
+
+        flag = 'REGRESSION' if change < -threshold else 'ok'
+        print(f"{name}: {change:+.1%} vs baseline ({flag})")
+        if change < -threshold:
+            regressions.append(name)
+    return regressions
+
+
+if __name__ == '__main__':
+
+    # Command line args
+    parser = ArgumentParser()
+    parser.add_argument('-c', '--concurrency', help='Concurrency levels to time simulate.py at', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('-o', '--output', help='Path to write the results JSON to', default=RESULTS_PATH)
+    parser.add_argument('-r', '--repeats', help='Number of times to repeat each benchmark (the best time is kept)', type=int, default=3)
+    parser.add_argument('-s', '--save-baseline', help='Store the results as the new baseline', action='store_true')
+    parser.add_argument('-t', '--threshold', help='Relative slowdown vs the baseline to flag as a regression', type=float, default=0.1)
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.repeats, args.concurrency)
+
+    with open(args.output, 'w') as results_file:
+        json.dump(results, results_file, indent=2)
+
+    if args.save_baseline:
+        with open(BASELINE_PATH, 'w') as baseline_file:
+            json.dump(results, baseline_file, indent=2)
+        print(f"\nSaved baseline to {BASELINE_PATH}")
+
+    elif os.path.exists(BASELINE_PATH):
+        with open(BASELINE_PATH) as baseline_file:
+            baseline = json.load(baseline_file)
+        print()
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+    else:
+        print(f"\nNo baseline found at {BASELINE_PATH}, so nothing was compared. Run with --save-baseline to store one.")
@@ -0,0 +1,112 @@
+"""
+Exact probabilities of the dealer's final outcome, for a given upcard and remaining shoe composition.
+
+Compositions are tuples of 10 card counts indexed by card value - 1 (i.e. Aces first, all 10-valued cards last).
+Outcome probabilities are tuples ordered like OUTCOMES.
+
+Results are memoized in bounded LRU caches, so a warm lookup takes about a microsecond. The sub-millisecond budget for
+calling this per decision only holds on those cache hits: an uncached composition works through every sequence of dealer
+draws, which takes about 1.5ms on average (from ~0.2ms with a 10 up to ~4ms with an Ace up, for an 8-deck shoe).
+"""
+from functools import lru_cache
+
+
+OUTCOMES = ('17', '18', '19', '20', '21', 'Bust', 'Blackjack')
+BUST = OUTCOMES.index('Bust')
+BLACKJACK = OUTCOMES.index('Blackjack')
+
+# Most memoized results kept of dealer hand states (~360 bytes each, so ~24MB when full, which holds every state of an
+# 8-deck strategy solve) and of whole compositions. The least recently used are dropped past that.
+FINAL_OUTCOMES_CACHE_SIZE = 2 ** 16
+DEALER_OUTCOMES_CACHE_SIZE = 4096
+
+
+def shoe_composition(number_of_decks):
+    """Get the composition of a full shoe (4 of each value per deck, except 16 ten-valued cards)."""
+    return (4 * number_of_decks,) * 9 + (16 * number_of_decks,)
+
+
+def remove_cards(composition, *values):
+    """Get a composition with cards (by value, Aces counted as 1) removed."""
+    counts = list(composition)
+    for value in values:
+        if counts[value - 1] == 0:
+            raise ValueError(f"No card of value {value} left in composition {composition}")
+        counts[value - 1] -= 1
+    return tuple(counts)
+
+
+def _outcome(index):
+    """Get the (certain) outcome probabilities of a single outcome."""
+    probabilities = [0.0] * len(OUTCOMES)
+    probabilities[index] = 1.0
+    return tuple(probabilities)
+
+
+@lru_cache(maxsize=FINAL_OUTCOMES_CACHE_SIZE)
+def _final_outcomes(hard_total, has_ace, composition):
+    """Get the outcome probabilities of a dealer hand (of 2+ cards) drawing from a composition, memoized by state."""
+    # Count an Ace as 11 if it doesn't bust the hand (same as `Hand.final_total()`).
+    soft = has_ace and hard_total + 10 <= 21
+    total = hard_total + 10 if soft else hard_total
+
+    # Dealer stands at 17 and above, except on a soft 17 (same as `GameController.play_dealer_turn()`).
+    if total > 21:
+        return _outcome(BUST)
+    if total > 17 or (total == 17 and not soft):
+        return _outcome(OUTCOMES.index(str(total)))
+
+    # Otherwise the dealer hits: weigh the outcomes of drawing each card value by its probability.
+    remaining = sum(composition)
+    if remaining == 0:
+        raise ValueError('Shoe composition exhausted')
+
+    probabilities = [0.0] * len(OUTCOMES)
+    for index, count in enumerate(composition):
+        if count:
+            value = index + 1
+            next_composition = composition[:index] + (count - 1,) + composition[index + 1:]
+            outcomes = _final_outcomes(hard_total + value, has_ace or value == 1, next_composition)
+            weight = count / remaining
+            for outcome, probability in enumerate(outcomes):
+                probabilities[outcome] += weight * probability
+    return tuple(probabilities)
+
+
+@lru_cache(maxsize=DEALER_OUTCOMES_CACHE_SIZE)
+def dealer_outcome_probabilities(upcard, composition, peeked=False):
+    """
+    Get the exact probabilities of the dealer's final outcome (ordered like OUTCOMES). Fast when cached (see above).
+
+    upcard - Value of the dealer's upcard (Aces counted as 1)
+    composition - Cards left in the shoe (not including the upcard), which the hole card and any hits are drawn from
+    peeked - Condition on the dealer not having blackjack (as when a gambler plays their hand after the dealer checks)
+    """
+    # Draw the hole card, which completes a blackjack if it makes 21 with the upcard.
+    blackjack_value = {1: 10, 10: 1}.get(upcard)
+    remaining = sum(composition)
+    if peeked and blackjack_value:
+        remaining -= composition[blackjack_value - 1]
+    if remaining == 0:
+        raise ValueError('Shoe composition exhausted')
+
+    probabilities = [0.0] * len(OUTCOMES)
+    for index, count in enumerate(composition):
+        value = index + 1
+        if not count or (peeked and value == blackjack_value):
+            continue
+        weight = count / remaining
+        if value == blackjack_value:
+            probabilities[BLACKJACK] += weight
+            continue
+        next_composition = composition[:index] + (count - 1,) + composition[index + 1:]
+        outcomes = _final_outcomes(upcard + value, upcard == 1 or value == 1, next_composition)
+        for outcome, probability in enumerate(outcomes):
+            probabilities[outcome] += weight * probability
+    return tuple(probabilities)
+
+
+def clear_cache():
+    """Clear memoized results (e.g. after working through many shoe compositions)."""
+    _final_outcomes.cache_clear()
+    dealer_outcome_probabilities.cache_clear()
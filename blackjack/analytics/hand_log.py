@@ -0,0 +1,81 @@
+import os
+
+import numpy as np
+
+from blackjack.models.hand import ACTION_FLAGS
+
+
+# Fixed record layout of a played gambler hand
+HAND_DTYPE = np.dtype([
+    ('game', np.int64),      # Game number within the simulation
+    ('turn', np.int32),      # Turn number within the game
+    ('hand', np.int8),       # Hand number within the turn (> 1 for hands split off the dealt hand)
+    ('card_1', np.int8),     # First two cards of the hand as card codes (see `card_code()`)
+    ('card_2', np.int8),
+    ('upcard', np.int8),     # Dealer's upcard as a card code
+    ('actions', np.uint8),   # Bit flags of the actions taken on the hand (see ACTION_FLAGS)
+    ('wager', np.float64),
+    ('insurance', np.float64),
+    ('outcome', np.int8),    # See OUTCOME_CODES
+    ('net', np.float64)      # Net winnings of the hand, including insurance
+])
+
+OUTCOME_CODES = {'Win': 1, 'Loss': 2, 'Push': 3, 'Even Money': 4, 'Insurance Win': 5}
+
+
+class HandRecorder:
+    """
+    Records a structured row per played gambler hand into a preallocated buffer, and flushes full buffers in bulk
+    to numbered `.npz` files (each holding a `hands` array of HAND_DTYPE records).
+    """
+
+    def __init__(self, directory, name, capacity=65536):
+        self.directory = directory
+        self.name = name  # Unique file name prefix (e.g. per worker job)
+        self.buffer = np.empty(capacity, dtype=HAND_DTYPE)
+        self.size = 0
+        self.parts = 0
+        self.game = 0
+
+    def start_game(self, game):
+        """Set the game number for subsequently recorded hands."""
+        self.game = game
+
+    def record(self, turn, hand, upcard):
+        """Record a settled GamblerHand."""
+        if self.size == len(self.buffer):
+            self.flush()
+
+        self.buffer[self.size] = (
+            self.game,
+            turn,
+            hand.hand_number,
+            hand.cards[0].code,
+            hand.cards[1].code,
+            upcard.code,
+            hand.actions,
+            hand.wager,
+            hand.insurance,
+            OUTCOME_CODES[hand.outcome],
+            hand.earnings - hand.wager - hand.insurance
+        )
+        self.size += 1
+
+    def flush(self):
+        """Write the buffered records to the next numbered file and empty the buffer."""
+        if self.size == 0:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        np.savez(os.path.join(self.directory, f"hands-{self.name}-{self.parts:04d}.npz"), hands=self.buffer[:self.size])
+        self.parts += 1
+        self.size = 0
+
+
+def load_hand_log(directory):
+    """Load all hand records in a directory into a single structured array."""
+    paths = sorted(path for path in os.listdir(directory) if path.startswith('hands-') and path.endswith('.npz'))
+    parts = []
+    for path in paths:
+        with np.load(os.path.join(directory, path)) as npz:
+            parts.append(npz['hands'])
+    return np.concatenate(parts) if parts else np.empty(0, dtype=HAND_DTYPE)
@@ -1,7 +1,10 @@
+from array import array
+
+
 class MetricTracker:
     """Class for tracking game metrics for analytics purposes."""
     
-    def __init__(self):
+    def __init__(self, bankroll_stride=1):
         # Metrics
         self.wins = 0
         self.losses = 0
@@ -10,9 +13,20 @@ class MetricTracker:
         self.insurance_losses = 0
         self.gambler_blackjacks = 0
         self.dealer_blackjacks = 0
+
+        # Number of turns played (i.e. bankrolls tracked after the initial one)
+        self.turns = 0
+
+        # Total amount wagered (hand wagers, including doubles and splits, and insurance wagers)
+        self.amount_wagered = 0.0
         
-        # Bankroll over time
-        self.bankroll_progression = []
+        # Bankroll over time: the initial and final bankrolls, and a progression of every `bankroll_stride`-th tracked
+        # bankroll (turns 0, stride, 2 * stride ...), or none if the stride is 0. The progression is a typed array of
+        # doubles, taking 8 bytes per bankroll (rather than a boxed float each) and pickling as a raw buffer.
+        self.bankroll_stride = bankroll_stride
+        self.bankroll_progression = array('d')
+        self.initial_bankroll = None
+        self.final_bankroll = None
 
     def _increment_metric(self, metric):
         """Increment the desired metric (privately)."""
@@ -57,14 +71,23 @@ class MetricTracker:
         if hand.lost_insurance:
             self._increment_metric('insurance losses')
 
+        # Amount wagered
+        self.amount_wagered += hand.wager + hand.insurance
+
     def process_dealer_hand(self, hand):
         """Track metrics for a played DealerHand."""
         if hand.status == 'Blackjack':
             self._increment_metric('dealer blackjacks')
 
     def append_bankroll(self, bankroll):
-        """Append a bankroll amount to the list of bankrolls tracked."""
-        self.bankroll_progression.append(bankroll)
+        """Track the initial bankroll, or the bankroll after a turn (appended to the progression if it falls on the stride)."""
+        if self.initial_bankroll is None:
+            self.initial_bankroll = bankroll
+        else:
+            self._increment_metric('turns')
+        if self.bankroll_stride and self.turns % self.bankroll_stride == 0:
+            self.bankroll_progression.append(bankroll)
+        self.final_bankroll = bankroll
 
     def serialize_metrics(self):
         """Get a dictionary representation of tracked metrics."""
@@ -76,5 +99,33 @@ class MetricTracker:
             'insurance_losses': self.insurance_losses,
             'gambler_blackjacks': self.gambler_blackjacks,
             'dealer_blackjacks': self.dealer_blackjacks,
+            'amount_wagered': self.amount_wagered,
+            'turns': self.turns,
+            'initial_bankroll': self.initial_bankroll,
+            'final_bankroll': self.final_bankroll,
+            'bankroll_stride': self.bankroll_stride,
             'bankroll_progression': self.bankroll_progression
         }
+
+    def summarize_metrics(self):
+        """
+        Get a compact dictionary of tracked metrics: the bankroll progression is reduced to its first and last amounts,
+        unless one is being kept (a non-zero stride), in which case it's included along with its stride.
+        """
+        summary = {
+            'wins': self.wins,
+            'losses': self.losses,
+            'pushes': self.pushes,
+            'insurance_wins': self.insurance_wins,
+            'insurance_losses': self.insurance_losses,
+            'gambler_blackjacks': self.gambler_blackjacks,
+            'dealer_blackjacks': self.dealer_blackjacks,
+            'amount_wagered': self.amount_wagered,
+            'turns': self.turns,
+            'initial_bankroll': self.initial_bankroll,
+            'final_bankroll': self.final_bankroll
+        }
+        if self.bankroll_stride:
+            summary['bankroll_stride'] = self.bankroll_stride
+            summary['bankroll_progression'] = self.bankroll_progression
+        return summary
@@ -1,8 +1,7 @@
-from statistics import mean
+from array import array
 from textwrap import dedent
 
-import matplotlib.pyplot as plt
-
+from blackjack.analytics.streaming_stats import QuantileSketch, RatioStats, RunningStats
 from blackjack.display_utils import money_format, pct_format, zero_division_pct
 
 
@@ -16,41 +15,86 @@ def slice_label(percent, all_vals):
 
 
 class MultiGameAnalyzer:
-    """Class for running basic analytics on tracked metrics for a multiple games."""
+    """
+    Class for running basic analytics on tracked metrics for a multiple games.
+    Games are aggregated incrementally as their results arrive, in constant memory (unless their bankroll progressions
+    are kept, e.g. for a TrajectoryAnalyzer, which take memory in proportion to the number of games).
+    """
 
-    def __init__(self, metric_trackers):
-        # All games have the same initial bankroll. Grab it from the first game.
-        self.initial_bankroll = metric_trackers[0].bankroll_progression[0]
+    def __init__(self, game_summaries=(), keep_progressions=False):
+        """
+        game_summaries - Compact metric summaries of each game (see `MetricTracker.summarize_metrics()`), if already available
+        keep_progressions - Whether to keep the games' bankroll progressions (otherwise they're dropped once aggregated)
+        """
+        self.keep_progressions = keep_progressions
 
-        (self.wins, self.losses, self.pushes, self.insurance_wins, self.insurance_losses,
-         self.gambler_blackjacks, self.dealer_blackjacks, self.final_bankrolls) = self._aggregate_metrics(metric_trackers)
+        # All games have the same initial bankroll. It's grabbed from the first game.
+        self.initial_bankroll = None
 
-    @staticmethod
-    def _aggregate_metrics(metric_trackers):
         # Gross metric counts
-        wins = 0
-        losses = 0
-        pushes = 0
-        insurance_wins = 0
-        insurance_losses = 0
-        gambler_blackjacks = 0
-        dealer_blackjacks = 0
-
-        # Final bankrolls
-        final_bankrolls = []
-
-        # Process each MetricTracker
-        for mt in metric_trackers:
-            wins += mt.wins
-            losses += mt.losses
-            pushes += mt.pushes
-            insurance_wins += mt.insurance_wins
-            insurance_losses += mt.insurance_losses
-            gambler_blackjacks += mt.gambler_blackjacks
-            dealer_blackjacks += mt.dealer_blackjacks
-            final_bankrolls.append(mt.bankroll_progression[-1])
-
-        return wins, losses, pushes, insurance_wins, insurance_losses, gambler_blackjacks, dealer_blackjacks, final_bankrolls
+        self.wins = 0
+        self.losses = 0
+        self.pushes = 0
+        self.insurance_wins = 0
+        self.insurance_losses = 0
+        self.gambler_blackjacks = 0
+        self.dealer_blackjacks = 0
+
+        # Final bankrolls (running statistics and a bounded sketch of the distribution)
+        self.final_bankroll_stats = RunningStats()
+        self.final_bankroll_sketch = QuantileSketch()
+
+        # House edge: money lost over money wagered, with a confidence interval from the spread across games
+        self.house_edge_stats = RatioStats()
+
+        # Bankroll progressions of the games that tracked one (see `MetricTracker.bankroll_stride`), concatenated into a
+        # single typed array. Game i's progression is bankroll_progressions[progression_offsets[i]:progression_offsets[i + 1]],
+        # and its number of turns and final bankroll (which is only in the progression if the game ended on the stride) are
+        # progression_turns[i] and progression_final_bankrolls[i].
+        self.bankroll_stride = None
+        self.bankroll_progressions = array('d')
+        self.progression_offsets = array('q', [0])
+        self.progression_turns = array('q')
+        self.progression_final_bankrolls = array('d')
+
+        self.add_games(game_summaries)
+
+    def add_game(self, summary):
+        """Aggregate the summary of a game."""
+        if self.initial_bankroll is None:
+            self.initial_bankroll = summary['initial_bankroll']
+
+        self.wins += summary['wins']
+        self.losses += summary['losses']
+        self.pushes += summary['pushes']
+        self.insurance_wins += summary['insurance_wins']
+        self.insurance_losses += summary['insurance_losses']
+        self.gambler_blackjacks += summary['gambler_blackjacks']
+        self.dealer_blackjacks += summary['dealer_blackjacks']
+        self.final_bankroll_stats.add(summary['final_bankroll'])
+        self.final_bankroll_sketch.add(summary['final_bankroll'])
+        self.house_edge_stats.add(summary['initial_bankroll'] - summary['final_bankroll'], summary['amount_wagered'])
+
+        if self.keep_progressions and 'bankroll_progression' in summary:
+            self.bankroll_stride = summary['bankroll_stride']
+            self.bankroll_progressions.extend(summary['bankroll_progression'])
+            self.progression_offsets.append(len(self.bankroll_progressions))
+            self.progression_turns.append(summary['turns'])
+            self.progression_final_bankrolls.append(summary['final_bankroll'])
+
+    def add_games(self, game_summaries):
+        """Aggregate the summaries of several games (e.g. as they arrive from a subprocess)."""
+        for summary in game_summaries:
+            self.add_game(summary)
+
+    @property
+    def num_progressions(self):
+        """Number of games with a tracked bankroll progression."""
+        return len(self.progression_offsets) - 1
+
+    def get_bankroll_progression(self, index):
+        """Get the bankroll progression of the index-th game that tracked one (a memoryview, rather than a copy)."""
+        return memoryview(self.bankroll_progressions)[self.progression_offsets[index]:self.progression_offsets[index + 1]]
 
     def print_summary(self):
         """Print a simple summary of analyzed results."""
@@ -72,9 +116,14 @@ class MultiGameAnalyzer:
         ins_loss_pct = zero_division_pct(self.insurance_losses, total_insurance)
 
         # --- Bankroll ---
-        winnings_gross_avg = mean(self.final_bankrolls) - self.initial_bankroll
+        winnings_gross_avg = self.final_bankroll_stats.mean - self.initial_bankroll
         winnings_pct_avg = zero_division_pct(winnings_gross_avg, self.initial_bankroll)
 
+        # --- House Edge ---
+        amount_wagered_avg = self.house_edge_stats.denominator_mean
+        house_edge_pct = self.house_edge_stats.ratio() * 100.0
+        house_edge_ci_pct = self.house_edge_stats.confidence_half_width() * 100.0
+
         # Return the formatted summary string
         print(dedent(f"""\
             --- Hand Outcomes ---
@@ -104,19 +153,28 @@ class MultiGameAnalyzer:
             
             Avg Winnings: {money_format(winnings_gross_avg)} ({pct_format(winnings_pct_avg)})
 
-            Max Bankroll: {money_format(max(self.final_bankrolls))}
-            Min Bankroll: {money_format(min(self.final_bankrolls))}
-            Avg Bankroll: {money_format(mean(self.final_bankrolls))}
+            Max Bankroll: {money_format(self.final_bankroll_stats.maximum)}
+            Min Bankroll: {money_format(self.final_bankroll_stats.minimum)}
+            Avg Bankroll: {money_format(self.final_bankroll_stats.mean)}
+
+            --- House Edge ---
+
+            Avg Amount Wagered: {money_format(amount_wagered_avg)}
+            House Edge: {house_edge_pct:+.3f}% (95% CI: ±{house_edge_ci_pct:.3f}%)
             """)
         )
 
     def create_plots(self):
         """Create charts summarizing the tracked metric data."""
+        # matplotlib is slow to import, so it's only imported once plots are created
+        import matplotlib.pyplot as plt
+
         # Create a figure to hold the plots (called "axes")
         fig, (ax1, ax2) = plt.subplots(2, 1)  # 2 rows 1 column of axes (i.e. stacked plots)
 
-        # Axes 1: Final Bankroll Distribution (Histogram)
-        ax1.hist(self.final_bankrolls)
+        # Axes 1: Final Bankroll Distribution (Histogram, from the weighted items of the sketch)
+        final_bankrolls, weights = zip(*self.final_bankroll_sketch.weighted_values())
+        ax1.hist(final_bankrolls, weights=weights)
         ax1.set_xlabel('Final Bankroll ($)')
         ax1.set_ylabel('Count')
         ax1.set_title('Final Bankrolls')
@@ -135,7 +193,6 @@ class MultiGameAnalyzer:
         ax2.legend(wedges, labels, title="Outcomes")
         ax2.set_title('Hand Outcomes')
         ax2.axis('equal')
-
-        # Avoid plot label overlap
-        plt.tight_layout()
+        # Avoid plot label overlap, and show this figure along with any others created (e.g. a TrajectoryAnalyzer's)
+        fig.tight_layout()
         plt.show()
@@ -0,0 +1,68 @@
+from math import sqrt
+
+from blackjack.analytics.streaming_stats import RatioStats, RunningStats
+from blackjack.display_utils import money_format
+
+
+class PairedComparison:
+    """
+    Class for comparing strategies that played the same games (identical shoes, i.e. common random numbers).
+    Each strategy is compared to the first (the baseline) by the per-game differences in net winnings. As the
+    luck of the shuffle is shared, the differences vary far less than the winnings of independently played games.
+    """
+
+    def __init__(self, strategy_names):
+        self.strategy_names = list(strategy_names)
+        self.baseline = self.strategy_names[0]
+
+        # Net winnings and house edge of each strategy, and the paired differences from the baseline
+        self.net_stats = {name: RunningStats() for name in self.strategy_names}
+        self.house_edge_stats = {name: RatioStats() for name in self.strategy_names}
+        self.difference_stats = {name: RunningStats() for name in self.strategy_names[1:]}
+
+    def add_game(self, summaries):
+        """Aggregate the summaries of a game played by each strategy ({strategy name: summary})."""
+        nets = {}
+        for name in self.strategy_names:
+            summary = summaries[name]
+            nets[name] = summary['final_bankroll'] - summary['initial_bankroll']
+            self.net_stats[name].add(nets[name])
+            self.house_edge_stats[name].add(-nets[name], summary['amount_wagered'])
+
+        for name, stats in self.difference_stats.items():
+            stats.add(nets[name] - nets[self.baseline])
+
+    def add_games(self, game_summaries):
+        """Aggregate the summaries of several games (e.g. as they arrive from a subprocess)."""
+        for summaries in game_summaries:
+            self.add_game(summaries)
+
+    def print_summary(self):
+        """Print each strategy's results, and its paired differences from the baseline with standard errors."""
+        count = self.net_stats[self.baseline].count
+
+        print('--- Strategies ---\n')
+        print(f"{'Strategy':<14}{'Avg Net':>14}{'House Edge':>13}{'95% CI':>11}")
+        for name in self.strategy_names:
+            house_edge = self.house_edge_stats[name]
+            print(
+                f"{name:<14}{money_format(self.net_stats[name].mean):>14}"
+                f"{house_edge.ratio() * 100:>+12.3f}%{house_edge.confidence_half_width() * 100:>9.3f}%"
+            )
+
+        if not self.difference_stats:
+            return
+
+        # Standard errors of the mean difference: paired (from the differences themselves), and what independent
+        # runs of the same number of games would give (from each strategy's own variance).
+        print(f"\n--- Paired Differences vs '{self.baseline}' ({count} games) ---\n")
+        print(f"{'Strategy':<14}{'Avg Diff':>14}{'Std Error':>14}{'Independent SE':>16}{'Efficiency':>13}")
+        for name, stats in self.difference_stats.items():
+            paired_se = stats.std() / sqrt(count)
+            independent_se = sqrt((self.net_stats[name].variance() + self.net_stats[self.baseline].variance()) / count)
+            variance_ratio = f"{(independent_se / paired_se) ** 2:,.1f}x" if paired_se else 'n/a'
+            print(
+                f"{name:<14}{money_format(stats.mean):>14}{money_format(paired_se):>14}"
+                f"{money_format(independent_se):>16}{variance_ratio:>13}"
+            )
+        print()
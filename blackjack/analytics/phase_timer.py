@@ -0,0 +1,61 @@
+from functools import wraps
+from time import perf_counter
+
+
+# Names of the GameController methods for each phase of a turn, in the order they're played
+PHASES = (
+    'check_gambler_wager',
+    'deal',
+    'play_pre_turn',
+    'play_gambler_turn',
+    'play_dealer_turn',
+    'settle_up',
+    'track_metrics',
+    'finalize_turn'
+)
+
+
+class PhaseTimer:
+    """
+    Accumulates the wall time and number of calls of each phase of a game's turns.
+    Timers can be shared by many games, and merged (e.g. across subprocesses) with `merge()`.
+    Note that `finalize_turn` includes the time of `track_metrics`, which it calls.
+    """
+
+    def __init__(self):
+        self.seconds = dict.fromkeys(PHASES, 0.0)
+        self.calls = dict.fromkeys(PHASES, 0)
+
+    def timed(self, phase, method):
+        """Wrap a (bound) method so that each call is timed as a phase."""
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.seconds[phase] += perf_counter() - start
+                self.calls[phase] += 1
+        return wrapper
+
+    def merge(self, other):
+        """Add the timings of another PhaseTimer to this one."""
+        for phase in PHASES:
+            self.seconds[phase] += other.seconds[phase]
+            self.calls[phase] += other.calls[phase]
+
+    def total_calls(self):
+        """Get the total number of timed calls across phases."""
+        return sum(self.calls.values())
+
+    def print_summary(self):
+        """Print the accumulated time, calls and time per call of each phase."""
+        # `finalize_turn` already includes `track_metrics`, so don't count it twice towards the total.
+        total_seconds = sum(self.seconds.values()) - self.seconds['track_metrics']
+
+        print(f"{'Phase':<22}{'Seconds':>10}{'% Time':>9}{'Calls':>12}{'us/Call':>10}")
+        for phase in PHASES:
+            seconds, calls = self.seconds[phase], self.calls[phase]
+            percent = seconds / total_seconds * 100 if total_seconds else 0.0
+            per_call = seconds / calls * 1e6 if calls else 0.0
+            print(f"{phase:<22}{seconds:>10.3f}{percent:>8.1f}%{calls:>12,}{per_call:>10.2f}")
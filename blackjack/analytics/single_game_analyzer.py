@@ -1,8 +1,7 @@
-from statistics import mean
+from array import array
+from math import fsum
 from textwrap import dedent
 
-import matplotlib.pyplot as plt
-
 from blackjack.display_utils import money_format, pct_format, zero_division_pct
 
 
@@ -26,6 +25,11 @@ class SingleGameAnalyzer:
                  insurance_losses=0,
                  gambler_blackjacks=0,
                  dealer_blackjacks=0,
+                 amount_wagered=0.0,
+                 turns=0,
+                 initial_bankroll=None,
+                 final_bankroll=None,
+                 bankroll_stride=1,
                  bankroll_progression=None
                 ):
         self.wins = wins
@@ -35,7 +39,14 @@ class SingleGameAnalyzer:
         self.insurance_losses = insurance_losses
         self.gambler_blackjacks = gambler_blackjacks
         self.dealer_blackjacks = dealer_blackjacks
-        self.bankroll_progression = bankroll_progression or []
+        self.amount_wagered = amount_wagered
+        self.turns = turns
+        self.bankroll_stride = bankroll_stride
+        self.bankroll_progression = bankroll_progression if bankroll_progression is not None else array('d')
+
+        # The initial and final bankrolls default to the ends of the progression
+        self.initial_bankroll = initial_bankroll if initial_bankroll is not None else self.bankroll_progression[0]
+        self.final_bankroll = final_bankroll if final_bankroll is not None else self.bankroll_progression[-1]
 
     def print_summary(self):
         """Print a simple summary of analyzed results."""
@@ -57,8 +68,14 @@ class SingleGameAnalyzer:
         ins_loss_pct = zero_division_pct(self.insurance_losses, total_insurance)
 
         # --- Bankroll ---
-        winnings_gross = self.bankroll_progression[-1] - self.bankroll_progression[0]
-        winnings_pct = zero_division_pct(winnings_gross, self.bankroll_progression[0])
+        winnings_gross = self.final_bankroll - self.initial_bankroll
+        winnings_pct = zero_division_pct(winnings_gross, self.initial_bankroll)
+
+        # Bankroll extremes and average over the tracked progression (or just the initial and final bankrolls)
+        bankrolls = self.bankroll_progression or (self.initial_bankroll, self.final_bankroll)
+
+        # --- House Edge ---
+        house_edge_pct = zero_division_pct(-winnings_gross, self.amount_wagered)
 
         # Return the formatted summary string
         print(dedent(f"""\
@@ -87,21 +104,31 @@ class SingleGameAnalyzer:
 
             --- Bankroll ---
             
+            Turns Played: {self.turns}
             Winnings: {money_format(winnings_gross)} ({pct_format(winnings_pct)})
 
-            Max Bankroll: {money_format(max(self.bankroll_progression))}
-            Min Bankroll: {money_format(min(self.bankroll_progression))}
-            Avg Bankroll: {money_format(mean(self.bankroll_progression))}
+            Max Bankroll: {money_format(max(bankrolls))}
+            Min Bankroll: {money_format(min(bankrolls))}
+            Avg Bankroll: {money_format(fsum(bankrolls) / len(bankrolls))}
+
+            --- House Edge ---
+
+            Amount Wagered: {money_format(self.amount_wagered)}
+            House Edge: {house_edge_pct:+.3f}%
             """)
         )
 
     def create_plots(self):
         """Create charts summarizing the tracked metric data."""
+        # matplotlib is slow to import, so it's only imported once plots are created
+        import matplotlib.pyplot as plt
+
         # Create a figure to hold the plots (called "axes")
         fig, (ax1, ax2) = plt.subplots(2, 1)  # 2 rows 1 column of axes (i.e. stacked plots)
 
-        # Axes 1: Bankroll vs. Turn Number (line chart)
-        ax1.plot(self.bankroll_progression)
+        # Axes 1: Bankroll vs. Turn Number (line chart, with a point every `bankroll_stride` turns)
+        turn_numbers = [index * self.bankroll_stride for index in range(len(self.bankroll_progression))]
+        ax1.plot(turn_numbers, self.bankroll_progression)
         ax1.set_xlabel('Turn Number')
         ax1.set_ylabel('Bankroll ($)')
         ax1.set_title('Bankroll vs. Turn Number')
@@ -0,0 +1,131 @@
+from math import sqrt
+
+
+class RunningStats:
+    """Running count, mean, variance (Welford's algorithm), minimum and maximum of a stream of values, in constant memory."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.minimum = None
+        self.maximum = None
+        self._sum_of_squares = 0.0  # Sum of squared differences from the running mean
+
+    def add(self, value):
+        """Add a value to the stream."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._sum_of_squares += delta * (value - self.mean)
+
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+
+    def variance(self):
+        """Get the sample variance of the values (0 for fewer than 2 values)."""
+        return self._sum_of_squares / (self.count - 1) if self.count > 1 else 0.0
+
+    def std(self):
+        """Get the sample standard deviation of the values."""
+        return sqrt(self.variance())
+
+
+class RatioStats:
+    """
+    Running ratio of the totals of two paired streams of values (e.g. money lost over money wagered, per game),
+    with its standard error by the delta method. Means and co-moments are updated with Welford's algorithm.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.numerator_mean = 0.0
+        self.denominator_mean = 0.0
+        self._numerator_sum_of_squares = 0.0    # Sum of squared differences from the running means,
+        self._denominator_sum_of_squares = 0.0  # and of the products of both differences
+        self._sum_of_products = 0.0
+
+    def add(self, numerator, denominator):
+        """Add a pair of values to the streams."""
+        self.count += 1
+        numerator_delta = numerator - self.numerator_mean
+        denominator_delta = denominator - self.denominator_mean
+        self.numerator_mean += numerator_delta / self.count
+        self.denominator_mean += denominator_delta / self.count
+        self._numerator_sum_of_squares += numerator_delta * (numerator - self.numerator_mean)
+        self._denominator_sum_of_squares += denominator_delta * (denominator - self.denominator_mean)
+        self._sum_of_products += numerator_delta * (denominator - self.denominator_mean)
+
+    def ratio(self):
+        """Get the ratio of the totals (0 if the denominators total 0)."""
+        return self.numerator_mean / self.denominator_mean if self.denominator_mean else 0.0
+
+    def standard_error(self):
+        """Get the standard error of the ratio (infinite for fewer than 2 pairs)."""
+        if self.count < 2 or not self.denominator_mean:
+            return float('inf')
+        ratio = self.ratio()
+        residual_variance = (
+            self._numerator_sum_of_squares - 2 * ratio * self._sum_of_products + ratio ** 2 * self._denominator_sum_of_squares
+        ) / (self.count - 1)
+        return sqrt(max(residual_variance, 0.0) / self.count) / abs(self.denominator_mean)
+
+    def confidence_half_width(self, z=1.96):
+        """Get the half-width of the (95% by default) confidence interval of the ratio."""
+        return z * self.standard_error()
+
+
+class QuantileSketch:
+    """
+    Bounded-memory sketch of a stream of values for approximate quantiles and histograms.
+
+    Values are kept in levels of at most `capacity` items, where an item at level `n` stands for 2^n values. When a
+    level fills up it is sorted and every other item is promoted to the next level, so memory grows only with the
+    logarithm of the stream length. Compaction alternates deterministically, so the same stream gives the same sketch.
+    """
+
+    def __init__(self, capacity=256):
+        self.capacity = capacity - capacity % 2  # Compaction halves a full level, so keep it even
+        self.count = 0
+        self.levels = [[]]
+        self._offsets = [0]
+
+    def add(self, value):
+        """Add a value to the stream."""
+        self.count += 1
+        self.levels[0].append(value)
+
+        level = 0
+        while len(self.levels[level]) >= self.capacity:
+            self._compact(level)
+            level += 1
+
+    def _compact(self, level):
+        """Promote every other item (in sorted order) of a full level to the next level."""
+        if level + 1 == len(self.levels):
+            self.levels.append([])
+            self._offsets.append(0)
+
+        offset = self._offsets[level]
+        self._offsets[level] ^= 1
+        self.levels[level + 1].extend(sorted(self.levels[level])[offset::2])
+        self.levels[level] = []
+
+    def weighted_values(self):
+        """Get the sketch's items as (value, weight) pairs, sorted by value."""
+        return sorted((value, 2 ** level) for level, items in enumerate(self.levels) for value in items)
+
+    def quantile(self, q):
+        """Get the approximate q-quantile (0 <= q <= 1) of the values."""
+        weighted_values = self.weighted_values()
+        if not weighted_values:
+            raise ValueError('No values in sketch')
+
+        target = q * sum(weight for _, weight in weighted_values)
+        cumulative_weight = 0
+        for value, weight in weighted_values:
+            cumulative_weight += weight
+            if cumulative_weight >= target:
+                return value
+        return weighted_values[-1][0]
@@ -0,0 +1,189 @@
+from textwrap import dedent
+
+import numpy as np
+
+from blackjack.display_utils import money_format
+
+
+# Percentiles of the bankroll bands, time to ruin and max drawdowns
+PERCENTILES = (5, 25, 50, 75, 95)
+
+# Number of checkpoints (evenly spaced turns) in the printed summary, and of sample trajectories plotted
+NUM_CHECKPOINTS = 4
+NUM_SAMPLES = 20
+
+# Number of games (rows) per block when computing drawdowns, bounding the scratch memory to a block's running peaks
+DRAWDOWN_BLOCK_SIZE = 4096
+
+
+def percentile_label(percentile):
+    """Label a percentile (e.g. --> 95th, Median)."""
+    return 'Median' if percentile == 50 else f"{percentile}th"
+
+
+class TrajectoryAnalyzer:
+    """
+    Class for running risk analytics on the bankroll trajectories of many games: the probability of ruin by each turn,
+    the time to ruin, the distribution of maximum drawdowns, and percentile bands of the bankroll over time.
+
+    Trajectories are a 2-D matrix with a row per game and a column per tracked turn (every `stride` turns), which every
+    metric is computed from with whole-matrix NumPy operations. A game's row is padded with its final bankroll after it
+    ended, so a ruined game stays ruined. Only the analytics (and a few sample rows) are kept, not the matrix itself.
+    """
+
+    def __init__(self, trajectories, stride):
+        """
+        trajectories - Matrix of the bankroll of each game (row) at each tracked turn (column), which is used as
+                       scratch space (i.e. its values are overwritten)
+        stride - Number of turns between the columns
+        """
+        self.num_games, num_columns = trajectories.shape
+        if self.num_games == 0 or num_columns == 0:
+            raise ValueError('There are no bankroll trajectories to analyze')
+        self.stride = stride
+        self.turns = np.arange(num_columns) * stride
+        self.samples = trajectories[:NUM_SAMPLES].copy()
+
+        # Ruin: the first column each game's bankroll is gone in (argmax finds the first True, or 0 if there's none)
+        ruined = trajectories <= 0
+        first_ruined = ruined.argmax(axis=1)
+        first_ruined = first_ruined[ruined[np.arange(self.num_games), first_ruined]]
+        del ruined
+        self.num_ruined = first_ruined.size
+        self.ruin_turns = self.turns[first_ruined]
+        self.ruin_probabilities = np.cumsum(np.bincount(first_ruined, minlength=num_columns)) / self.num_games
+
+        # Max drawdowns: the largest drop from a running peak (computed in blocks of games, in place of their running peaks)
+        self.max_drawdowns = np.empty(self.num_games)
+        for start in range(0, self.num_games, DRAWDOWN_BLOCK_SIZE):
+            block = trajectories[start:start + DRAWDOWN_BLOCK_SIZE]
+            drawdowns = np.maximum.accumulate(block, axis=1)
+            drawdowns -= block
+            drawdowns.max(axis=1, out=self.max_drawdowns[start:start + DRAWDOWN_BLOCK_SIZE])
+
+        # Bankroll percentile bands (one row per percentile), partitioning the trajectories in place
+        self.bands = np.percentile(trajectories, PERCENTILES, axis=0, overwrite_input=True)
+
+    @classmethod
+    def from_analyzer(cls, analyzer):
+        """
+        Analyze the bankroll progressions kept by a MultiGameAnalyzer (see `MultiGameAnalyzer.bankroll_progressions`).
+        The trajectory matrix is filled from the concatenated progressions in one masked assignment, without copying them.
+        """
+        if analyzer.num_progressions == 0:
+            raise ValueError('There are no bankroll progressions to analyze (they must be tracked and kept)')
+
+        stride = analyzer.bankroll_stride
+        progressions = np.frombuffer(analyzer.bankroll_progressions, dtype=np.float64)
+        offsets = np.frombuffer(analyzer.progression_offsets, dtype=np.int64)
+        turns = np.frombuffer(analyzer.progression_turns, dtype=np.int64)
+        final_bankrolls = np.frombuffer(analyzer.progression_final_bankrolls, dtype=np.float64)
+        lengths = np.diff(offsets)
+
+        # Games that didn't end on the stride get a column for their final bankroll (at the next stride), so a game of
+        # `turns` turns spans columns 0 to ceil(turns / stride)
+        num_columns = int((-(-turns // stride)).max()) + 1
+
+        # Pad every row with its final bankroll, then fill in the progressions (a boolean mask is assigned in row order)
+        trajectories = np.empty((lengths.size, num_columns))
+        trajectories[:] = final_bankrolls[:, np.newaxis]
+        trajectories[np.arange(num_columns) < lengths[:, np.newaxis]] = progressions
+        return cls(trajectories, stride)
+
+    def checkpoints(self):
+        """Get the columns of evenly spaced turns to summarize (the last being the last tracked turn)."""
+        return np.unique(np.linspace(0, self.turns.size - 1, NUM_CHECKPOINTS + 1).round().astype(int)[1:])
+
+    def print_summary(self):
+        """Print a simple summary of analyzed results."""
+        # --- Risk of Ruin ---
+        ruined_pct = self.num_ruined / self.num_games * 100.0
+        ruin_by_turn = '\n'.join(
+            f"Ruin by Turn {self.turns[column]}: {self.ruin_probabilities[column] * 100.0:.2f}%" for column in self.checkpoints()
+        )
+        if self.num_ruined:
+            ruin_turn_percentiles = np.percentile(self.ruin_turns, PERCENTILES)
+            time_to_ruin = '  '.join(
+                f"{percentile_label(percentile)}: {turn:.0f}" for percentile, turn in zip(PERCENTILES, ruin_turn_percentiles)
+            )
+        else:
+            time_to_ruin = 'N/A'
+
+        # --- Drawdowns ---
+        drawdown_percentiles = np.percentile(self.max_drawdowns, PERCENTILES)
+        drawdowns = '\n'.join(
+            f"{percentile_label(percentile)} Max Drawdown: {money_format(drawdown)}"
+            for percentile, drawdown in zip(PERCENTILES, drawdown_percentiles)
+        )
+
+        # --- Bankroll Bands ---
+        columns = ['Turn', *(percentile_label(percentile) for percentile in PERCENTILES)]
+        rows = [
+            [str(self.turns[column]), *(money_format(band[column]) for band in self.bands)]
+            for column in [0, *self.checkpoints()]
+        ]
+        widths = [max(len(column), *(len(row[index]) for row in rows)) for index, column in enumerate(columns)]
+        bands = '\n'.join(
+            '  '.join(value.rjust(width) for value, width in zip(row, widths)) for row in [columns, *rows]
+        )
+
+        # Print the formatted summary string (the tables are joined in after dedenting, so they keep their alignment)
+        print(dedent(f"""\
+            --- Risk of Ruin ---
+
+            Games: {self.num_games} (bankrolls tracked every {self.stride} turns)
+            Ruined: {self.num_ruined} ({ruined_pct:.2f}%)
+
+            {{ruin_by_turn}}
+
+            Time to Ruin (turns): {time_to_ruin}
+
+            --- Drawdowns ---
+
+            Avg Max Drawdown: {money_format(self.max_drawdowns.mean())}
+            {{drawdowns}}
+            Largest Max Drawdown: {money_format(self.max_drawdowns.max())}
+
+            --- Bankroll Percentiles ---
+
+            {{bands}}
+            """).format(ruin_by_turn=ruin_by_turn, drawdowns=drawdowns, bands=bands)
+        )
+
+    def create_plots(self, show=True):
+        """Create charts summarizing the analyzed trajectories (unless shown, they're shown with the next figures shown)."""
+        # matplotlib is slow to import, so it's only imported once plots are created
+        import matplotlib.pyplot as plt
+
+        # Create a figure to hold the plots (called "axes")
+        fig, (ax1, ax2, ax3) = plt.subplots(3, 1)  # 3 rows 1 column of axes (i.e. stacked plots)
+
+        # Axes 1: Bankroll Percentile Bands vs. Turn Number (shaded bands around the median, over sample trajectories)
+        for sample in self.samples:
+            ax1.plot(self.turns, sample, color='grey', linewidth=0.5, alpha=0.5)
+        middle = len(PERCENTILES) // 2
+        for index in range(middle):
+            ax1.fill_between(self.turns, self.bands[index], self.bands[-index - 1], color='tab:blue', alpha=0.2,
+                             label=f"{percentile_label(PERCENTILES[index])}-{percentile_label(PERCENTILES[-index - 1])}")
+        ax1.plot(self.turns, self.bands[middle], color='tab:blue', label=percentile_label(PERCENTILES[middle]))
+        ax1.legend(title='Percentiles')
+        ax1.set_xlabel('Turn Number')
+        ax1.set_ylabel('Bankroll ($)')
+        ax1.set_title('Bankroll Percentiles vs. Turn Number')
+
+        # Axes 2: Probability of Ruin vs. Turn Number (line chart)
+        ax2.plot(self.turns, self.ruin_probabilities * 100.0)
+        ax2.set_xlabel('Turn Number')
+        ax2.set_ylabel('Ruined (%)')
+        ax2.set_title('Probability of Ruin by Turn Number')
+
+        # Axes 3: Max Drawdown Distribution (Histogram)
+        ax3.hist(self.max_drawdowns, bins=50)
+        ax3.set_xlabel('Max Drawdown ($)')
+        ax3.set_ylabel('Count')
+        ax3.set_title('Max Drawdowns')
+
+        # Avoid plot label overlap
+        fig.tight_layout()
+        if show:
+            plt.show()
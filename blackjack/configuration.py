@@ -1,10 +1,26 @@
 from blackjack.display_utils import header
+from blackjack.strategies.counting_strategy import CountingStrategy
+from blackjack.strategies.default_static_strategy import DefaultStaticStrategy
+from blackjack.strategies.insurance_static_strategy import InsuranceStaticStrategy
+from blackjack.strategies.remote_strategy import RemoteStrategy
 from blackjack.strategies.user_input_strategy import UserInputStrategy
 from blackjack.user_input import float_response, get_user_input, int_response
 
 
-def get_interactive_configuration(default):
-    """Get game configuration data for the interactive game mode."""
+# Strategies that can be simulated, by name (used by the simulate.py and sweep.py scripts).
+# Note that the first strategy is the baseline when comparing strategies
+STRATEGY_MAP = {
+    'default': DefaultStaticStrategy,
+    'counting': CountingStrategy,
+    'insurance': InsuranceStaticStrategy
+}
+
+
+def get_interactive_configuration(default, penetration=1.0):
+    """
+    Get game configuration data for the interactive game mode.
+    Penetration is the fraction of the shoe dealt before it's reshuffled between turns (1.0 deals out the whole shoe).
+    """
     if default:
         # Default values
         name = 'Gambler'
@@ -27,18 +43,28 @@ def get_interactive_configuration(default):
             'auto_wager': auto_wager
         },
         'shoe': {
-            'number_of_decks': number_of_decks
+            'number_of_decks': number_of_decks,
+            'penetration': penetration
         },
         'gameplay': {
             'strategy': UserInputStrategy,
             'verbose': True,
             'max_turns': None
+        },
+        'analytics': {
+            'bankroll_stride': 1  # Chart the bankroll after every turn
         }
     }
 
 
-def get_simulation_configuration(bankroll, auto_wager, number_of_decks, strategy, max_turns):
-    """Get game configuration data for the simulation game mode."""
+def get_simulation_configuration(bankroll, auto_wager, number_of_decks, strategy, max_turns, penetration=1.0, seats=1,
+                                 bankroll_stride=0):
+    """
+    Get game configuration data for the simulation game mode.
+    Penetration is the fraction of the shoe dealt before it's reshuffled between turns (1.0 deals out the whole shoe).
+    Seats is the number of gamblers (each playing the strategy) at the table, sharing the dealer and shoe.
+    Bankroll stride is the number of turns between each game's tracked bankrolls (0 only tracks the initial and final ones).
+    """
     return {
         'gambler': {
             'name': 'Gambler',
@@ -46,11 +72,38 @@ def get_simulation_configuration(bankroll, auto_wager, number_of_decks, strategy
             'auto_wager': auto_wager
         },
         'shoe': {
-            'number_of_decks': number_of_decks
+            'number_of_decks': number_of_decks,
+            'penetration': penetration
         },
         'gameplay': {
             'strategy': strategy,
             'verbose': False,
             'max_turns': max_turns
+        },
+        'table': {
+            'seats': seats
+        },
+        'analytics': {
+            'bankroll_stride': bankroll_stride
+        }
+    }
+
+
+def get_server_configuration(bankroll, auto_wager, number_of_decks, max_turns=None, penetration=0.75):
+    """Get game configuration data for each remote client's game in the server game mode."""
+    return {
+        'gambler': {
+            'name': 'Gambler',
+            'bankroll': bankroll,
+            'auto_wager': auto_wager
+        },
+        'shoe': {
+            'number_of_decks': number_of_decks,
+            'penetration': penetration
+        },
+        'gameplay': {
+            'strategy': RemoteStrategy,
+            'verbose': False,
+            'max_turns': max_turns
         }
     }
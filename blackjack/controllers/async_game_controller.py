@@ -0,0 +1,141 @@
+import asyncio
+
+from blackjack.controllers.game_controller import GameController
+from blackjack.exc import InsufficientBankrollError
+
+
+async def ignore(message):
+    """Default notification callback, which discards the message."""
+
+
+class AsyncGameController(GameController):
+    """
+    GameController whose game flow is a coroutine, so that many games can be played concurrently on one event loop.
+
+    The strategy's decision methods are coroutines (e.g. RemoteStrategy's, which await a client's responses), and the
+    dealer's play is paced with non-blocking sleeps rather than blocking ones. Otherwise, turns are played with the same
+    (synchronous) steps as the GameController's. Games are always headless: instead of being rendered, the state of the
+    table is passed to the `notify` coroutine function as JSON-serializable messages (e.g. to send to the client).
+    """
+
+    def __init__(self, gambler, dealer, shoe, strategy, max_turns=None, pace=0.0, notify=ignore):
+        # The client is sent the bankroll every turn, so no bankroll progression is kept
+        super().__init__(gambler, dealer, shoe, strategy, verbose=False, max_turns=max_turns, bankroll_stride=0)
+
+        # Seconds to pause before each of the dealer's plays (for the gambler to follow along), and the notification callback
+        self.pace = pace
+        self.notify = notify
+
+    async def play(self):
+        """Main game loop that controls entire game flow (see `GameController.play()`)."""
+        # Track the starting bankroll
+        self.metric_tracker.append_bankroll(self.gambler.bankroll)
+
+        # Play the game to completion
+        while self.play_condition():
+            self.turn += 1
+
+            # Reshuffle the shoe between turns once the cut card has been reached.
+            if self.shoe.past_cut_card():
+                self.shoe.reset_card_pile()
+
+            await self.check_gambler_wager()
+            if self.gambler.auto_wager == 0:  # If they cashed out, don't play the turn. The game is over.
+                break
+
+            self.deal()
+            await self.play_pre_turn()
+            await self.play_gambler_turn()
+            await self.play_dealer_turn()
+            self.settle_up()
+            await self.finalize_turn()
+
+        await self.finalize_game()
+
+    async def check_gambler_wager(self):
+        """Pre-turn vetting of the gambler's wager (see `GameController.check_gambler_wager()`)."""
+        self.vet_auto_wager()
+        if await self.strategy.wants_to_change_wager():
+            await self.set_new_auto_wager()
+
+    async def set_new_auto_wager(self):
+        """Set a new auto-wager amount, asking again until it's one the gambler's bankroll covers."""
+        self.gambler.zero_auto_wager()
+
+        while True:
+            new_auto_wager = await self.strategy.get_new_auto_wager()
+            try:
+                self.gambler.set_new_auto_wager(new_auto_wager)
+                return
+            except InsufficientBankrollError as err:
+                await self.notify({'type': 'error', 'message': f"{err}. Please try again."})
+
+    async def play_pre_turn(self):
+        """Carry out pre-turn flow for blackjacks and insurance."""
+        offer = self.get_pre_turn_offer()
+        if offer == 'Even Money':
+            accepted = await self.strategy.wants_even_money()
+        elif offer == 'Insurance':
+            accepted = await self.strategy.wants_insurance()
+        else:
+            accepted = False
+
+        self.resolve_pre_turn(accepted)
+
+    async def play_gambler_turn(self):
+        """Play the gambler's turn, meaning play all of the gambler's hands to completion."""
+        # Use a while loop due to the fact that self.hands can grow while iterating (via splitting)
+        while any(hand.status == 'Pending' for hand in self.gambler.hands):
+            hand = next(hand for hand in self.gambler.hands if hand.status == 'Pending')  # Grab the next unplayed hand
+            await self.play_gambler_hand(hand)
+
+    async def play_gambler_hand(self, hand):
+        """Play a gambler hand."""
+        self.set_hand_status(hand, 'Playing')
+
+        while hand.status == 'Playing':
+            options = self.get_next_hand_options(hand)
+            if options is None:
+                break
+
+            action = await self.strategy.get_hand_action(hand, options, self.dealer.up_card())
+            self.take_hand_action(hand, action)
+
+    async def play_dealer_turn(self):
+        """Play the dealer's turn (if necessary)."""
+        if self.has_active_hands():
+            await self.play_dealer_hand()
+
+    async def play_dealer_hand(self):
+        """Play the dealer's hand to completion. When paced, the dealer's hand is sent to `notify` after each play."""
+        hand = self.dealer.hand
+        self.set_hand_status(hand, 'Playing')
+
+        while hand.status == 'Playing':
+            if self.pace:
+                await asyncio.sleep(self.pace)
+
+            self.play_dealer_step(hand)
+
+            if self.pace:
+                await self.notify({'type': 'dealer', 'dealer': hand.serialize(hide=False)})
+
+    async def finalize_turn(self):
+        """Notify the results of the turn, and clear the table for the next turn."""
+        await self.notify({
+            'type': 'turn',
+            'turn': self.turn,
+            'dealer': self.dealer.hand.serialize(hide=False),
+            'hands': [hand.serialize() for hand in self.gambler.hands],
+            'bankroll': self.gambler.bankroll
+        })
+        self.clear_table()
+
+    async def finalize_game(self):
+        """Notify that the game is over, with a summary of its tracked metrics."""
+        await self.notify({
+            'type': 'game_over',
+            'turns': self.turn,
+            'bankroll': self.gambler.bankroll,
+            'summary': self.metric_tracker.summarize_metrics()
+        })
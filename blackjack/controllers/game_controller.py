@@ -1,14 +1,24 @@
 from collections import OrderedDict
+from functools import wraps
 from time import sleep
 
 from blackjack.analytics.metric_tracker import MetricTracker
+from blackjack.analytics.phase_timer import PHASES
 from blackjack.exc import InsufficientBankrollError
-from blackjack.models.hand import DealerHand, GamblerHand
+from blackjack.models.hand import ACTION_FLAGS, DealerHand, GamblerHand
 from blackjack.display_utils import clear, header, money_format, pct_format
 
 
+# Names of the methods decorated with `render_after`
+RENDERED_METHODS = ('add_activity', 'hit_hand', 'split_hand', 'set_hand_status', 'set_hand_outcome')
+
+
 def render_after(instance_method):
-    """Decorator for calling the `render()` instance method after calling an instance method."""
+    """
+    Decorator for calling the `render()` instance method after calling an instance method.
+    The undecorated method remains available as `__wrapped__` (used to bypass rendering entirely when not verbose).
+    """
+    @wraps(instance_method)
     def wrapper(self, *args, **kwargs):
         instance_method(self, *args, **kwargs)
         if self.verbose:
@@ -18,14 +28,16 @@ def render_after(instance_method):
 
 class GameController:
 
-    def __init__(self, gambler, dealer, shoe, strategy, verbose=True, max_turns=None):
+    def __init__(self, gambler, dealer, shoe, strategy, verbose=True, max_turns=None, hand_recorder=None, phase_timer=None,
+                 bankroll_stride=1):
         # Configured models from game setup
         self.gambler = gambler
         self.dealer = dealer
         self.shoe = shoe
 
-        # Strategy to employ for in-game decision making
+        # Strategy to employ for in-game decision making (given access to the game's models, e.g. to count cards)
         self.strategy = strategy
+        self.strategy.attach(gambler, shoe)
 
         # Turn activity log
         self.activity = []
@@ -39,8 +51,46 @@ class GameController:
         self.turn = 0
         self.max_turns = max_turns
 
-        # Metric tracking (for analytics)
-        self.metric_tracker = MetricTracker()
+        # Metric tracking (for analytics, keeping every `bankroll_stride`-th bankroll), and optional recording of every played hand
+        self.metric_tracker = MetricTracker(bankroll_stride=bankroll_stride)
+        self.hand_recorder = hand_recorder
+
+        # Optional timing of each phase of the turn (nothing is wrapped, so there's no cost, unless a PhaseTimer is given)
+        self.phase_timer = phase_timer
+
+        # Headless mode: take rendering off the hot path entirely when not verbose
+        if not self.verbose:
+            self._bypass_rendering()
+        if self.phase_timer is not None:
+            self._time_phases()
+
+    def __getstate__(self):
+        """
+        Pickle the controller without the methods bound by `_bypass_rendering()` and `_time_phases()`
+        (bound methods don't survive pickling).
+        """
+        state = self.__dict__.copy()
+        for name in RENDERED_METHODS + PHASES:
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state):
+        """Restore a pickled controller, re-bypassing rendering and re-timing phases if applicable."""
+        self.__dict__.update(state)
+        if not self.verbose:
+            self._bypass_rendering()
+        if self.phase_timer is not None:
+            self._time_phases()
+
+    def _bypass_rendering(self):
+        """Bind the undecorated versions of the `render_after` methods to this instance, skipping the render check."""
+        for name in RENDERED_METHODS:
+            setattr(self, name, getattr(type(self), name).__wrapped__.__get__(self))
+
+    def _time_phases(self):
+        """Bind versions of the turn phase methods to this instance that accumulate their timings in the PhaseTimer."""
+        for name in PHASES:
+            setattr(self, name, self.phase_timer.timed(name, getattr(self, name)))
 
     def play(self):
         """Main game loop that controls entire game flow."""
@@ -54,7 +104,14 @@ class GameController:
             self.turn += 1
 
             # Initialize the activity log for the turn
-            self.add_activity(f"Turn #{self.turn}")
+            if self.verbose:
+                self.add_activity(f"Turn #{self.turn}")
+
+            # Reshuffle the shoe between turns once the cut card has been reached.
+            if self.shoe.past_cut_card():
+                self.shoe.reset_card_pile()
+                if self.verbose:
+                    self.add_activity('Cut card reached. Reshuffling the shoe.')
 
             # Vet the gambler's auto-wager against their bankroll, and ask if they would like to change their wager or cash out.
             self.check_gambler_wager()
@@ -108,15 +165,19 @@ class GameController:
         1. Check whether the gambler has enough bankroll to place their auto-wager. If not, set to remaining bankroll.
         2. Ask the gambler if they'd like to change their auto-wager or cash out. Allow them to do so.
         """
-        # If the gambler doesn't have sufficient bankroll to place their auto-wager, set their auto-wager to their remaining bankroll.
-        if not self.gambler.can_place_auto_wager():
-            self.gambler.set_new_auto_wager(self.gambler.bankroll)
-            self.add_activity(f"Insufficient bankroll to place current auto-wager. Setting auto-wager to remaining bankroll.")
+        self.vet_auto_wager()
 
         # Check whether the user wants to change their auto-wager or cash out.
         if self.strategy.wants_to_change_wager():
             self.set_new_auto_wager()
 
+    def vet_auto_wager(self):
+        """Check whether the gambler has enough bankroll to place their auto-wager. If not, set it to their remaining bankroll."""
+        if not self.gambler.can_place_auto_wager():
+            self.gambler.set_new_auto_wager(self.gambler.bankroll)
+            if self.verbose:
+                self.add_activity(f"Insufficient bankroll to place current auto-wager. Setting auto-wager to remaining bankroll.")
+
     def set_new_auto_wager(self):
         """Set a new auto-wager amount."""
         # Set the gambler's auto_wager to $0.00.
@@ -137,8 +198,9 @@ class GameController:
 
     def deal(self):
         """Deal cards from the Shoe to both the gambler and the dealer to form their initial hands."""
-        # Deal 4 cards from the shoe
-        card_1, card_2, card_3, card_4 = self.shoe.deal_n_cards(4)
+        # Deal 4 cards from the shoe (the last being the dealer's hole card, dealt face down)
+        card_1, card_2, card_3 = self.shoe.deal_n_cards(3)
+        card_4 = self.shoe.deal_card(face_down=True)
 
         # Create the Hands from the dealt cards.
         # Deal like they do a casinos --> one card to each player at a time, starting with the gambler.
@@ -149,21 +211,55 @@ class GameController:
         self.gambler.place_auto_wager()
 
         # Log it
-        self.add_activity('Dealing hands.')
+        if self.verbose:
+            self.add_activity('Dealing hands.')
 
     def play_pre_turn(self):
         """Carry out pre-turn flow for blackjacks and insurance."""
+        # Ask the gambler about any side offer they're facing, then resolve the pre-turn with their answer.
+        offer = self.get_pre_turn_offer()
+        if offer == 'Even Money':
+            accepted = self.strategy.wants_even_money()
+        elif offer == 'Insurance':
+            accepted = self.strategy.wants_insurance()
+        else:
+            accepted = False
+
+        self.resolve_pre_turn(accepted)
+
+    def get_pre_turn_offer(self):
+        """
+        Get the side offer the gambler is facing before their turn, logging the dealt blackjack and Ace checks:
+        'Even Money' (a blackjack against an Ace), 'Insurance' (anything else against an Ace, if affordable) or None.
+        """
+        # Log whether the gambler has blackjack (whether the dealer does isn't displayed to the gambler yet).
+        gambler_has_blackjack = self.gambler.first_hand().is_blackjack()
+        if gambler_has_blackjack and self.verbose:
+            self.add_activity(f"{self.gambler.name} has blackjack.")
+
+        # Side offers only come into play if the dealer's upcard is an ace
+        if not self.dealer.is_showing_ace():
+            return None
+
+        if self.verbose:
+            self.add_activity('Dealer is showing an Ace.')
+
+        if gambler_has_blackjack:
+            return 'Even Money'
+        elif self.gambler.can_place_insurance_wager():
+            return 'Insurance'
+        else:
+            return None
+
+    def resolve_pre_turn(self, accepted):
+        """Resolve the pre-turn flow for blackjacks and insurance, given whether the gambler accepted their side offer (if any)."""
         # --- BLACKJACK CHECKING FOR PRE-TURN FLOW --- #
 
         # Grab the gambler's dealt hand for pre-turn processing.
         gambler_hand = self.gambler.first_hand()
 
-        # Check if the gambler has blackjack. Log it if so.
+        # Check if the gambler or dealer has blackjack.
         gambler_has_blackjack = gambler_hand.is_blackjack()
-        if gambler_has_blackjack:
-            self.add_activity(f"{self.gambler.name} has blackjack.")
-
-        # Check if the dealer has blackjack, but don't display it to the gambler yet.
         dealer_has_blackjack = self.dealer.hand.is_blackjack()
 
         # --- DEALER ACE PRE-TURN FLOW --- #
@@ -171,32 +267,32 @@ class GameController:
         # Insurance comes into play if the dealer's upcard is an ace
         if self.dealer.is_showing_ace():
 
-            # Log it.
-            self.add_activity('Dealer is showing an Ace.')
-
             # If the gambler has blackjack, they can either take even money or let it ride.
             if gambler_has_blackjack:
 
-                if self.strategy.wants_even_money():
+                if accepted:
                     # Pay out even money (meaning 1:1 hand wager).
                     self.set_hand_outcome(gambler_hand, 'Even Money')
-                    self.add_activity(f"{self.gambler.name} took even money.")
+                    if self.verbose:
+                        self.add_activity(f"{self.gambler.name} took even money.")
                 else:
                     if dealer_has_blackjack:
                         # Both players have blackjack. Gambler reclaims their wager and that's all.
                         self.set_hand_outcome(gambler_hand, 'Push')
-                        self.add_activity('Dealer has blackjack.', 'Hand is a push.')
+                        if self.verbose:
+                            self.add_activity('Dealer has blackjack.', 'Hand is a push.')
                     else:
                         # Dealer does not have blackjack. Gambler has won a blackjack (which pays 3:2)
                         self.set_hand_outcome(gambler_hand, 'Win')
-                        self.add_activity('Dealer does not have blackjack.', f"{self.gambler.name} wins 3:2.")
+                        if self.verbose:
+                            self.add_activity('Dealer does not have blackjack.', f"{self.gambler.name} wins 3:2.")
 
             # If the gambler does not have blackjack they can buy insurance.
             else:
                 # Gambler must have sufficient bankroll to place an insurance bet.
                 gambler_can_afford_insurance = self.gambler.can_place_insurance_wager()
 
-                if gambler_can_afford_insurance and self.strategy.wants_insurance():
+                if accepted:
 
                     # Insurnace is a side bet that is half their wager, and pays 2:1 if dealer has blackjack.
                     self.gambler.place_insurance_wager()
@@ -205,24 +301,29 @@ class GameController:
                     if dealer_has_blackjack:
                         self.hide_dealer = False  # Show the dealer's blackjack.
                         self.set_hand_outcome(gambler_hand, 'Insurance Win')
-                        self.add_activity('Dealer has blackjack.', f"{self.gambler.name}'s insurnace wager wins 2:1 (hand wager loses).")
+                        if self.verbose:
+                            self.add_activity('Dealer has blackjack.', f"{self.gambler.name}'s insurnace wager wins 2:1 (hand wager loses).")
                     else:
                         gambler_hand.lost_insurance = True
-                        self.add_activity('Dealer does not have blackjack.', f"{self.gambler.name}'s insurance wager loses.")
+                        if self.verbose:
+                            self.add_activity('Dealer does not have blackjack.', f"{self.gambler.name}'s insurance wager loses.")
 
                 # If the gambler does not (or cannot) place an insurance bet, they lose if the dealer has blackjack. Otherwise, hand continues.
                 else:
                     # Message for players who were not offered the option to place an insurance bet to due insufficient bankroll.
                     if not gambler_can_afford_insurance:
-                        self.add_activity('Insufficient bankroll to place insurance wager.')
+                        if self.verbose:
+                            self.add_activity('Insufficient bankroll to place insurance wager.')
 
                     # The turn is over if the dealer has blackjack. Otherwise, continue on to playing the hand.
                     if dealer_has_blackjack:
                         self.hide_dealer = False
-                        self.add_activity('Dealer has blackjack.', f"{self.gambler.name} loses the hand.")
+                        if self.verbose:
+                            self.add_activity('Dealer has blackjack.', f"{self.gambler.name} loses the hand.")
                         self.set_hand_outcome(gambler_hand, 'Loss')
                     else:
-                        self.add_activity('Dealer does not have blackjack.')
+                        if self.verbose:
+                            self.add_activity('Dealer does not have blackjack.')
 
         # --- DEALER FACE CARD PRE-TURN FLOW --- #
 
@@ -230,27 +331,33 @@ class GameController:
         elif self.dealer.is_showing_face_card():
 
             # Log the blackjack check.
-            self.add_activity('Checking if the dealer has blackjack.')
+            if self.verbose:
+                self.add_activity('Checking if the dealer has blackjack.')
 
             # If the dealer has blackjack, it's a push if the player also has blackjack. Otherwise, the player loses.
             if dealer_has_blackjack:
 
                 self.hide_dealer = False
-                self.add_activity('Dealer has blackjack.')
+                if self.verbose:
+                    self.add_activity('Dealer has blackjack.')
 
                 if gambler_has_blackjack:
-                    self.add_activity('Hand is a push.')
+                    if self.verbose:
+                        self.add_activity('Hand is a push.')
                     self.set_hand_outcome(gambler_hand, 'Push')
                 else:
-                    self.add_activity(f"{self.gambler.name} loses the hand.")
+                    if self.verbose:
+                        self.add_activity(f"{self.gambler.name} loses the hand.")
                     self.set_hand_outcome(gambler_hand, 'Loss')
 
             # If dealer doesn't have blackjack, the player wins if they have blackjack. Otherwise, play the turn.
             else:
-                self.add_activity('Dealer does not have blackjack.')
+                if self.verbose:
+                    self.add_activity('Dealer does not have blackjack.')
                 
                 if gambler_has_blackjack:
-                    self.add_activity(f"{self.gambler.name} wins 3:2.")
+                    if self.verbose:
+                        self.add_activity(f"{self.gambler.name} wins 3:2.")
                     self.set_hand_outcome(gambler_hand, 'Win')
 
         # --- REGULAR PRE-TURN FLOW --- #
@@ -259,17 +366,19 @@ class GameController:
         # If the player has blackjack here, payout 3:2 and the hand is over. Otherwise, continue with playing the hand.
         else:
             if gambler_has_blackjack:
-                self.add_activity(f"{self.gambler.name} wins 3:2.")
+                if self.verbose:
+                    self.add_activity(f"{self.gambler.name} wins 3:2.")
                 self.set_hand_outcome(gambler_hand, 'Win')
 
     def play_gambler_turn(self):
         """Play the gambler's turn, meaning play all of the gambler's hands to completion."""
         # Log a message that the turn is being played, or there's no need to play it.
-        if any(hand.status == 'Pending' for hand in self.gambler.hands):
-            message = f"Playing {self.gambler.name}'s turn."
-        else:
-            message = f"No turn to play for {self.gambler.name}."
-        self.add_activity(message)
+        if self.verbose:
+            if any(hand.status == 'Pending' for hand in self.gambler.hands):
+                message = f"Playing {self.gambler.name}'s turn."
+            else:
+                message = f"No turn to play for {self.gambler.name}."
+            self.add_activity(message)
         
         # Use a while loop due to the fact that self.hands can grow while iterating (via splitting)
         while any(hand.status == 'Pending' for hand in self.gambler.hands):
@@ -283,51 +392,65 @@ class GameController:
 
         while hand.status == 'Playing':
 
-            # Handle single-card hands that result from splitting
-            if len(hand.cards) == 1:
-                
-                # Hit the hand automatically to make it complete.
-                self.hit_hand(hand)
+            # Get the possible options for hand action to take (if the hand is still being played).
+            options = self.get_next_hand_options(hand)
+            if options is None:
+                break
+
+            # Get the gambler's action (e.g. 'Hit', 'Stand', etc.), and take it.
+            action = self.strategy.get_hand_action(hand, options, self.dealer.up_card())
+            self.take_hand_action(hand, action)
 
-                # Check if the hand is blackjack. If it is, it's an automatic win (we know dealer doesn't have blackjack)
-                if hand.is_blackjack():
-                    self.set_hand_status(hand, 'Blackjack')
-                    self.set_hand_outcome(hand, 'Win')
-                    break
+    def get_next_hand_options(self, hand):
+        """
+        Get the options for the next action on a hand being played, first completing single-card hands that result from
+        splitting. Returns None if completing the hand finished it (blackjacks and split Aces).
+        """
+        # Handle single-card hands that result from splitting
+        if len(hand.cards) == 1:
 
-                # Split Aces only get 1 more card by rule. If they're not a blackjack mark them as stood.
-                if hand.cards[0].is_ace():
-                    if hand.status != 'Blackjack':
-                        self.set_hand_status(hand, 'Stood')
-                    break
+            # Hit the hand automatically to make it complete.
+            self.hit_hand(hand)
 
-            # Get the possible options for hand action to take.
-            options = self.get_hand_options(hand)
+            # Check if the hand is blackjack. If it is, it's an automatic win (we know dealer doesn't have blackjack)
+            if hand.is_blackjack():
+                self.set_hand_status(hand, 'Blackjack')
+                self.set_hand_outcome(hand, 'Win')
+                return None
 
-            # Get the gambler's action (e.g. 'Hit', 'Stand', etc.)
-            action = self.strategy.get_hand_action(hand, options, self.dealer.up_card())
+            # Split Aces only get 1 more card by rule. If they're not a blackjack mark them as stood.
+            if hand.cards[0].is_ace():
+                self.set_hand_status(hand, 'Stood')
+                return None
 
-            if action == 'Hit':
-                self.hit_hand(hand)  # Deal another card and keep playing the hand.
+        return self.get_hand_options(hand)
 
-            elif action == 'Stand':
-                self.set_hand_status(hand, 'Stood')  # Do nothing, hand is played.
+    def take_hand_action(self, hand, action):
+        """Take the gambler's action (e.g. 'Hit', 'Stand', etc.) on a hand being played."""
+        if self.hand_recorder is not None:
+            hand.actions |= ACTION_FLAGS[action]
 
-            elif action == 'Double':
-                self.double_hand(hand)  # Double the wager and deal another card. Hand is played.
+        if action == 'Hit':
+            self.hit_hand(hand)  # Deal another card and keep playing the hand.
 
-            elif action == 'Split':
-                self.split_hand(hand)  # Put the second card into a new hand and keep playing this hand.
+        elif action == 'Stand':
+            self.set_hand_status(hand, 'Stood')  # Do nothing, hand is played.
 
-            else:
-                raise Exception('Unhandled response.')  # Should never get here
+        elif action == 'Double':
+            self.double_hand(hand)  # Double the wager and deal another card. Hand is played.
 
-            # If the hand is 21 or busted, the hand is done being played.
-            if hand.is_21():
-                self.set_hand_status(hand, 'Stood')
-            elif hand.is_busted():
-                self.set_hand_status(hand, 'Busted')
-                self.set_hand_outcome(hand, 'Loss')
+        elif action == 'Split':
+            self.split_hand(hand)  # Put the second card into a new hand and keep playing this hand.
+
+        else:
+            raise Exception('Unhandled response.')  # Should never get here
+
+        # If the hand is 21 or busted, the hand is done being played.
+        if hand.is_21():
+            self.set_hand_status(hand, 'Stood')
+        elif hand.is_busted():
+            self.set_hand_status(hand, 'Busted')
+            self.set_hand_outcome(hand, 'Loss')
 
     def get_hand_options(self, hand):
         """Get the options (available actions) that can be taken on a hand."""
@@ -348,12 +471,12 @@ class GameController:
     def hit_hand(self, hand):
         """Add a card to a hand from the shoe."""
         card = self.shoe.deal_card()  # Deal a card
-        hand.cards.append(card)  # Add the card to the hand
+        hand.add_card(card)  # Add the card to the hand
 
     @render_after
     def split_hand(self, hand):
         """Split a hand."""
-        split_card = hand.cards.pop(1)  # Pop the second card off the hand to make a new hand
+        split_card = hand.pop_card(1)  # Pop the second card off the hand to make a new hand
         new_hand = GamblerHand(cards=[split_card], hand_number=len(self.gambler.hands) + 1)  # TODO: Do away with hand_number
         self.gambler.place_hand_wager(hand.wager, new_hand)  # Place the same wager on the new hand
         self.gambler.hands.append(new_hand)  # Add the hand to the gambler's list of hands
@@ -383,11 +506,23 @@ class GameController:
         self.dealer_playing = True
 
         # The dealer's turn need only be played if there are gambler hands that are still active
-        if not any(hand.status in ('Doubled', 'Stood') for hand in self.gambler.hands):
+        if not self.has_active_hands():
             self.dealer_playing = False
             return
 
-        self.add_activity("Playing the Dealer's turn.")
+        self.play_dealer_hand()
+
+        # Mark the dealer's turn as finished.
+        self.dealer_playing = False
+
+    def has_active_hands(self):
+        """Check whether any of the gambler's hands are still active (standing against the dealer's hand)."""
+        return any(hand.status in ('Doubled', 'Stood') for hand in self.gambler.hands)
+
+    def play_dealer_hand(self):
+        """Play the dealer's hand to completion (the dealer hits under 17 and on a soft 17)."""
+        if self.verbose:
+            self.add_activity("Playing the Dealer's turn.")
 
         # Grab the dealer's lone hand to be played
         hand = self.dealer.hand
@@ -401,23 +536,24 @@ class GameController:
             if self.verbose:
                 sleep(1)
 
-            # Get the hand total.
-            total = hand.final_total()
+            self.play_dealer_step(hand)
 
-            # Dealer hits under 17 and must hit a soft 17.
-            if total < 17 or (total == 17 and hand.is_soft()):
-                self.hit_hand(hand)
-            
-            # Dealer stands at 17 and above.
-            else:
-                self.set_hand_status(hand, 'Stood')
+    def play_dealer_step(self, hand):
+        """Play a single hit or stand of the dealer's hand."""
+        # Get the hand total.
+        total = hand.final_total()
 
-            # If the hand is busted dealer is done playing.
-            if hand.is_busted():
-                self.set_hand_status(hand, 'Busted')
+        # Dealer hits under 17 and must hit a soft 17.
+        if total < 17 or (total == 17 and hand.is_soft()):
+            self.hit_hand(hand)
 
-        # Mark the dealer's turn as finished.
-        self.dealer_playing = False
+        # Dealer stands at 17 and above.
+        else:
+            self.set_hand_status(hand, 'Stood')
+
+        # If the hand is busted dealer is done playing.
+        if hand.is_busted():
+            self.set_hand_status(hand, 'Busted')
 
     def pay_out_hand(self, hand, payout_type):
         """Pay out hand winnings, including wager reclaim."""
@@ -451,29 +587,31 @@ class GameController:
             assert odds, 'Must specify odds for wager and insurance payouts!'
             antecedent, consequent = map(int, odds.split(':'))
         
-        # Determine the payout amount by the payout_type (and odds if applicable)
+        # Determine the payout amount by the payout_type (and odds if applicable).
+        # Messages are templates that are only formatted if they'll be displayed.
         if payout_type == 'winning_wager':
             amount = hand.wager * antecedent / consequent
-            message = f"Adding winning hand payout of {money_format(amount)} to bankroll."
+            message = 'Adding winning hand payout of {} to bankroll.'
         
         elif payout_type == 'wager_reclaim':
             amount = hand.wager
-            message = f"Reclaiming hand wager of {money_format(amount)}."
+            message = 'Reclaiming hand wager of {}.'
         
         elif payout_type == 'winning_insurance':
             amount = hand.insurance * antecedent / consequent
-            message = f"Adding winning insurance payout of {money_format(amount)} to bankroll."
+            message = 'Adding winning insurance payout of {} to bankroll.'
         
         elif payout_type == 'insurance_reclaim':
             amount = hand.insurance
-            message = f"Reclaiming insurance wager of {money_format(amount)}."
+            message = 'Reclaiming insurance wager of {}.'
 
         else:
             raise ValueError(f"Invalid payout type: '{payout_type}'")
 
         hand.earnings += amount
         self.gambler.payout(amount)
-        self.add_activity(f"Hand {hand.hand_number}: {message}")
+        if self.verbose:
+            self.add_activity(f"Hand {hand.hand_number}: {message.format(money_format(amount))}")
 
     def determine_hand_outcome(self, hand, dealer_hand):
         """Determine a hand's outcome against a dealer hand if it is not yet known."""
@@ -520,7 +658,8 @@ class GameController:
             self.pay_out_hand(hand, 'insurance')
 
         elif hand.outcome == 'Loss':
-            self.add_activity(f"Hand {hand.hand_number}: Forfeiting hand wager of {money_format(hand.wager)}.")
+            if self.verbose:
+                self.add_activity(f"Hand {hand.hand_number}: Forfeiting hand wager of {money_format(hand.wager)}.")
 
         else:
             raise ValueError(f"Unhandled hand outcome: {hand.outcome}")
@@ -539,6 +678,11 @@ class GameController:
         # Track dealer hand metrics
         self.metric_tracker.process_dealer_hand(self.dealer.hand)
 
+        # Record each of the gambler's hands if applicable
+        if self.hand_recorder is not None:
+            for hand in self.gambler.hands:
+                self.hand_recorder.record(self.turn, hand, self.dealer.up_card())
+
         # Track gambler's bankroll through time
         self.metric_tracker.append_bankroll(self.gambler.bankroll)
 
@@ -547,12 +691,24 @@ class GameController:
         # Render the final status of the turn if applicable.
         if self.verbose:
             self.render()
-        
+
+        self.clear_table()
+
+        # Pause exectution until the user wants to proceed if applicable.
+        if self.verbose:
+            input('Push ENTER to proceed => ')
+
+    def clear_table(self):
+        """Track the turn's metrics, and clear the table for the next turn."""
         # Update tracked metrics
         self.track_metrics()
 
-        # Reset the activity log for the next turn.
-        self.activity = []
+        # Every card on the table has been seen by the end of the turn (including the dealer's hole card).
+        self.shoe.reveal_cards()
+
+        # Reset the activity log for the next turn (it's never written to when not verbose).
+        if self.verbose:
+            self.activity = []
 
         # Discard both the gambler and the dealer's hands.
         self.gambler.discard_hands()
@@ -561,10 +717,6 @@ class GameController:
         # Reset hide_dealer for the next turn.
         self.hide_dealer = True
 
-        # Pause exectution until the user wants to proceed if applicable.
-        if self.verbose:
-            input('Push ENTER to proceed => ')
-
     def finalize_game(self):
         """Wrap up the game, rendering analytics and creating graphs if necessary."""
         # Render game over message if applicable
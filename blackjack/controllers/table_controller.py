@@ -0,0 +1,94 @@
+from blackjack.models.hand import DealerHand, GamblerHand
+
+
+class TableController:
+    """
+    Plays a table of several seats against one dealer, dealing from a shared Shoe.
+
+    Each seat is a GameController with its own gambler and strategy (and metric tracking), sharing the table's Dealer
+    and Shoe. Seats play their own part of each round (wagers, pre-turn flow, their hands and settling up), while the
+    table deals the round and plays the dealer's hand once for all seats. Only headless (not verbose) play is supported.
+    """
+
+    def __init__(self, seats, dealer, shoe, max_turns=None):
+        if any(seat.dealer is not dealer or seat.shoe is not shoe for seat in seats):
+            raise ValueError('All seats must share the table\'s dealer and shoe')
+        if any(seat.verbose for seat in seats):
+            raise ValueError('Tables only support headless (not verbose) seats')
+
+        self.seats = seats
+        self.dealer = dealer
+        self.shoe = shoe
+
+        # Keep track of number of rounds played (and the max number of rounds to play if applicable)
+        self.turn = 0
+        self.max_turns = max_turns
+
+    def active_seats(self):
+        """Get the seats with a turn to play in the next round."""
+        return [seat for seat in self.seats if seat.play_condition()]
+
+    def play(self):
+        """Main table loop that plays rounds until no seat has a turn to play."""
+        # Track the starting bankrolls
+        for seat in self.seats:
+            seat.metric_tracker.append_bankroll(seat.gambler.bankroll)
+
+        seats = self.active_seats()
+        while seats:
+            self.turn += 1
+
+            # Reshuffle the shoe between rounds once the cut card has been reached.
+            if self.shoe.past_cut_card():
+                self.shoe.reset_card_pile()
+
+            # Vet each gambler's auto-wager. Seats whose gamblers cash out sit the round out (and are finished).
+            for seat in seats:
+                seat.turn += 1
+                seat.check_gambler_wager()
+            seats = [seat for seat in seats if seat.gambler.auto_wager != 0]
+
+            if seats:
+                self.deal(seats)
+                for seat in seats:
+                    seat.play_pre_turn()
+                for seat in seats:
+                    seat.play_gambler_turn()
+                self.play_dealer_turn(seats)
+                for seat in seats:
+                    seat.settle_up()
+                self.finalize_round(seats)
+
+            seats = self.active_seats()
+
+    def deal(self, seats):
+        """Deal the initial hands of every seat and the dealer, and place each gambler's auto-wager."""
+        # Deal like they do at casinos --> one card to each seat in turn then the dealer, twice. The dealer's second card is face down.
+        first_cards = self.shoe.deal_n_cards(len(seats))
+        up_card = self.shoe.deal_card()
+        second_cards = self.shoe.deal_n_cards(len(seats))
+        hole_card = self.shoe.deal_card(face_down=True)
+
+        for seat, first_card, second_card in zip(seats, first_cards, second_cards):
+            seat.gambler.hands.append(GamblerHand(cards=[first_card, second_card]))
+            seat.gambler.place_auto_wager()
+        self.dealer.hand = DealerHand(cards=[up_card, hole_card])
+
+    def play_dealer_turn(self, seats):
+        """Play the dealer's hand once for the whole table, if any seat has a hand still standing against it."""
+        if any(seat.has_active_hands() for seat in seats):
+            seats[0].play_dealer_hand()
+
+    def finalize_round(self, seats):
+        """Track each seat's metrics and clear the table for the next round."""
+        for seat in seats:
+            seat.track_metrics()
+            seat.gambler.discard_hands()
+
+        # Every card on the table has been seen by the end of the round (including the dealer's hole card).
+        self.shoe.reveal_cards()
+        self.dealer.discard_hand()
+
+    def summarize_metrics(self):
+        """Get a compact summary of each seat's tracked metrics (see `MetricTracker.summarize_metrics()`)."""
+        return [seat.metric_tracker.summarize_metrics() for seat in self.seats]
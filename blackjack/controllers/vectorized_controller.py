@@ -0,0 +1,471 @@
+from array import array
+
+import numpy as np
+
+from blackjack.analytics.metric_tracker import MetricTracker
+from blackjack.models.card import Card
+from blackjack.models.deck import Deck
+from blackjack.strategies.base_static_strategy import BaseStaticStrategy
+from blackjack.strategies.counting_strategy import CountingStrategy
+from blackjack.strategies.strategy_table import DOUBLE, HIT, SHAPE, SPLIT, STAND
+
+
+# Hard value of each card rank (indexed like `Card.RANKS`, Aces counted as 1)
+RANK_VALUES = np.array([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10], dtype=np.int16)
+
+# Hand statuses as integer codes (UNUSED marks hand slots that don't hold a hand this turn)
+UNUSED, PENDING, PLAYING, STOOD, DOUBLED, BUSTED, BLACKJACK, PLAYED = range(8)
+
+# Hand outcomes as integer codes
+NO_OUTCOME, WIN, LOSS, PUSH, EVEN_MONEY, INSURANCE_WIN = range(6)
+
+
+class VectorizedGameController:
+    """
+    Plays many independent games of blackjack in lockstep, with the state of every game held in NumPy arrays.
+    Each game (a "lane") follows the same rules as GameController with a StaticStrategy, but decisions are
+    made for all lanes at once via array lookups into the strategy's compiled StrategyTable. Only strategies that never
+    change their wager, and don't depend on the cards dealt (e.g. by counting them), are supported.
+    """
+
+    def __init__(self, configuration, num_games, seed_sequences=None):
+        # Extract values from the configuration (same format as `setup_game`)
+        bankroll = configuration['gambler']['bankroll']
+        auto_wager = configuration['gambler']['auto_wager']
+        number_of_decks = configuration['shoe']['number_of_decks']
+        penetration = configuration['shoe']['penetration']
+        strategy = configuration['gameplay']['strategy']()
+        self.max_turns = configuration['gameplay']['max_turns']
+        self.bankroll_stride = configuration['analytics']['bankroll_stride']
+
+        if configuration['table']['seats'] != 1:
+            raise ValueError('Vectorized play only supports a single seat')
+
+        # Static decisions are evaluated once, as they can't change during the game
+        if not isinstance(strategy, BaseStaticStrategy) or isinstance(strategy, CountingStrategy) or strategy.wants_to_change_wager():
+            raise ValueError(f"Unsupported strategy for vectorized play: {type(strategy).__name__}")
+        self.wants_insurance = bool(strategy.wants_insurance())
+        self.wants_even_money = bool(strategy.wants_even_money())
+        self.actions = np.frombuffer(strategy.table.codes, dtype=np.int8).reshape(SHAPE)  # Shared, not copied
+
+        # Shoes: one row of card ranks per game, each with its own RNG and dealing cursor
+        self.num_games = num_games
+        ranks = np.array(Deck.CODES, dtype=np.int8) % len(Card.RANKS)
+        self.shoes = np.tile(np.tile(ranks, number_of_decks), (num_games, 1))
+        self.shoe_size = self.shoes.shape[1]
+        if not 0 < penetration <= 1:
+            raise ValueError(f"Penetration must be greater than 0 and at most 1, got {penetration}")
+        self.cut_card = max(1, int(self.shoe_size * penetration))  # Same position as `Shoe.cut_card`
+        self.cursors = np.zeros(num_games, dtype=np.int64)
+        seed_sequences = seed_sequences or np.random.SeedSequence().spawn(num_games)
+        self.rngs = [np.random.default_rng(seed_sequence) for seed_sequence in seed_sequences]
+        for lane in range(num_games):
+            self._shuffle(lane)
+
+        # Gambler state
+        self.bankrolls = np.full(num_games, bankroll, dtype=np.float64)
+        self.auto_wagers = np.full(num_games, auto_wager, dtype=np.float64)
+        self.turns = np.zeros(num_games, dtype=np.int64)
+
+        # Gambler hands: one row per game, one column per hand slot (grown as hands are split)
+        self.hand_capacity = 0
+        self.hard_totals = np.zeros((num_games, 0), dtype=np.int16)  # Totals counting Aces as 1
+        self.num_aces = np.zeros((num_games, 0), dtype=np.int16)
+        self.num_cards = np.zeros((num_games, 0), dtype=np.int16)
+        self.first_ranks = np.zeros((num_games, 0), dtype=np.int8)
+        self.second_ranks = np.zeros((num_games, 0), dtype=np.int8)
+        self.wagers = np.zeros((num_games, 0), dtype=np.float64)
+        self.statuses = np.zeros((num_games, 0), dtype=np.int8)
+        self.outcomes = np.zeros((num_games, 0), dtype=np.int8)
+        self._grow_hands(4)
+        self.num_hands = np.zeros(num_games, dtype=np.int64)
+        self.current_hands = np.zeros(num_games, dtype=np.int64)
+        self.insurance = np.zeros(num_games, dtype=np.float64)
+        self.lost_insurance = np.zeros(num_games, dtype=bool)
+
+        # Dealer hands: one per game
+        self.dealer_hard_totals = np.zeros(num_games, dtype=np.int16)
+        self.dealer_num_aces = np.zeros(num_games, dtype=np.int16)
+        self.dealer_upcards = np.zeros(num_games, dtype=np.int8)
+        self.dealer_busted = np.zeros(num_games, dtype=bool)
+
+        # Metric tracking (per game)
+        self.wins = np.zeros(num_games, dtype=np.int64)
+        self.losses = np.zeros(num_games, dtype=np.int64)
+        self.pushes = np.zeros(num_games, dtype=np.int64)
+        self.insurance_wins = np.zeros(num_games, dtype=np.int64)
+        self.insurance_losses = np.zeros(num_games, dtype=np.int64)
+        self.gambler_blackjacks = np.zeros(num_games, dtype=np.int64)
+        self.dealer_blackjacks = np.zeros(num_games, dtype=np.int64)
+        self.amount_wagered = np.zeros(num_games, dtype=np.float64)
+        self.initial_bankrolls = self.bankrolls.copy()
+        self.rounds = 0
+
+        # Bankrolls of all games after every `bankroll_stride`-th round (none are kept if the stride is 0)
+        self.bankroll_history = [self.bankrolls.copy()] if self.bankroll_stride else []
+
+    def _grow_hands(self, extra):
+        """Add hand slots to every game to make room for split hands."""
+        for name in ('hard_totals', 'num_aces', 'num_cards', 'first_ranks', 'second_ranks', 'wagers', 'statuses', 'outcomes'):
+            current = getattr(self, name)
+            setattr(self, name, np.concatenate([current, np.zeros((self.num_games, extra), dtype=current.dtype)], axis=1))
+        self.hand_capacity += extra
+
+    def _shuffle(self, lane):
+        """Shuffle a game's shoe in place and reset its dealing cursor."""
+        self.rngs[lane].shuffle(self.shoes[lane])
+        self.cursors[lane] = 0
+
+    def _draw(self, lanes):
+        """Deal one card (rank) to each of the given games, reshuffling exhausted shoes."""
+        for lane in lanes[self.cursors[lanes] == self.shoe_size]:
+            self._shuffle(lane)
+        ranks = self.shoes[lanes, self.cursors[lanes]]
+        self.cursors[lanes] += 1
+        return ranks
+
+    def _add_cards(self, lanes, hands, ranks):
+        """Add a card to a gambler hand of each of the given games."""
+        self.hard_totals[lanes, hands] += RANK_VALUES[ranks]
+        self.num_aces[lanes, hands] += ranks == 0
+        self.num_cards[lanes, hands] += 1
+
+    def _totals(self, lanes, hands):
+        """Get the final totals and soft flags of a gambler hand of each of the given games."""
+        hard = self.hard_totals[lanes, hands]
+        soft = (self.num_aces[lanes, hands] > 0) & (hard + 10 <= 21)
+        return np.where(soft, hard + 10, hard), soft
+
+    def _dealer_totals(self, lanes):
+        """Get the final totals and soft flags of the dealer hands of the given games."""
+        hard = self.dealer_hard_totals[lanes]
+        soft = (self.dealer_num_aces[lanes] > 0) & (hard + 10 <= 21)
+        return np.where(soft, hard + 10, hard), soft
+
+    def active_lanes(self):
+        """Get the indexes of games that still have a turn to play."""
+        active = (self.bankrolls > 0) & (self.auto_wagers > 0)
+        if self.max_turns:
+            active &= self.turns < self.max_turns
+        return np.flatnonzero(active)
+
+    def play(self):
+        """Main loop that plays every game to completion, one turn of all games at a time."""
+        lanes = self.active_lanes()
+        while lanes.size:
+            self.turns[lanes] += 1
+            self.reshuffle_past_cut_card(lanes)
+            self.check_gambler_wagers(lanes)
+            self.deal(lanes)
+            self.play_pre_turn(lanes)
+            self.play_gambler_turns(lanes)
+            self.play_dealer_turns(lanes)
+            self.settle_up(lanes)
+            self.track_metrics(lanes)
+            lanes = self.active_lanes()
+
+    def reshuffle_past_cut_card(self, lanes):
+        """Reshuffle the shoes of games that have reached the cut card, between turns."""
+        for lane in lanes[self.cursors[lanes] >= self.cut_card]:
+            self._shuffle(lane)
+
+    def check_gambler_wagers(self, lanes):
+        """If a gambler doesn't have sufficient bankroll to place their auto-wager, set it to their remaining bankroll."""
+        short = lanes[self.auto_wagers[lanes] > self.bankrolls[lanes]]
+        self.auto_wagers[short] = self.bankrolls[short]
+
+    def deal(self, lanes):
+        """Deal the initial gambler and dealer hands of each game, and place the gambler's auto-wager."""
+        # Deal like they do at casinos --> one card to each player at a time, starting with the gambler.
+        card_1, card_2, card_3, card_4 = (self._draw(lanes) for _ in range(4))
+
+        # Reset all hand slots and set up the dealt gambler hand in the first one
+        self.statuses[lanes] = UNUSED
+        self.outcomes[lanes] = NO_OUTCOME
+        self.wagers[lanes] = 0
+        self.hard_totals[lanes, 0] = RANK_VALUES[card_1] + RANK_VALUES[card_3]
+        self.num_aces[lanes, 0] = (card_1 == 0).astype(np.int16) + (card_3 == 0)
+        self.num_cards[lanes, 0] = 2
+        self.first_ranks[lanes, 0] = card_1
+        self.second_ranks[lanes, 0] = card_3
+        self.statuses[lanes, 0] = PENDING
+        self.num_hands[lanes] = 1
+        self.insurance[lanes] = 0
+        self.lost_insurance[lanes] = False
+
+        # Dealer hand
+        self.dealer_hard_totals[lanes] = RANK_VALUES[card_2] + RANK_VALUES[card_4]
+        self.dealer_num_aces[lanes] = (card_2 == 0).astype(np.int16) + (card_4 == 0)
+        self.dealer_upcards[lanes] = card_2
+        self.dealer_busted[lanes] = False
+
+        # Place the auto-wager on the hand
+        self.wagers[lanes, 0] = self.auto_wagers[lanes]
+        self.bankrolls[lanes] -= self.auto_wagers[lanes]
+
+    def play_pre_turn(self, lanes):
+        """Carry out pre-turn flow for blackjacks and insurance."""
+        totals, _ = self._totals(lanes, 0)
+        gambler_blackjack = totals == 21
+        dealer_totals, _ = self._dealer_totals(lanes)
+        dealer_blackjack = dealer_totals == 21
+        showing_ace = self.dealer_upcards[lanes] == 0
+
+        # Dealt blackjacks are marked as such when the hands are created
+        self.statuses[lanes[gambler_blackjack], 0] = BLACKJACK
+        self.dealer_blackjacks[lanes[dealer_blackjack]] += 1
+
+        # Gambler blackjacks: even money against an Ace, otherwise a push against a dealer blackjack or a 3:2 win.
+        even_money = gambler_blackjack & showing_ace & self.wants_even_money
+        outcomes = np.full(lanes.size, NO_OUTCOME, dtype=np.int8)
+        outcomes[even_money] = EVEN_MONEY
+        outcomes[gambler_blackjack & ~even_money & dealer_blackjack] = PUSH
+        outcomes[gambler_blackjack & ~even_money & ~dealer_blackjack] = WIN
+
+        # Insurance is offered against an Ace if the gambler doesn't have blackjack (and can afford it).
+        if self.wants_insurance:
+            insurance = self.wagers[lanes, 0] / 2
+            insured = ~gambler_blackjack & showing_ace & (insurance <= self.bankrolls[lanes])
+            self.bankrolls[lanes[insured]] -= insurance[insured]
+            self.insurance[lanes[insured]] = insurance[insured]
+            self.lost_insurance[lanes[insured & ~dealer_blackjack]] = True
+        else:
+            insured = np.zeros(lanes.size, dtype=bool)
+
+        # Without blackjack, the hand is over if the dealer has blackjack (dealer can only have it showing an Ace or face card).
+        outcomes[~gambler_blackjack & dealer_blackjack & insured] = INSURANCE_WIN
+        outcomes[~gambler_blackjack & dealer_blackjack & ~insured] = LOSS
+
+        # Set the outcomes, marking pending hands as played
+        resolved = outcomes != NO_OUTCOME
+        self.outcomes[lanes[resolved], 0] = outcomes[resolved]
+        played = resolved & ~gambler_blackjack
+        self.statuses[lanes[played], 0] = PLAYED
+
+    def play_gambler_turns(self, lanes):
+        """Play all gambler hands of the given games to completion, one action on one hand per game at a time."""
+        playing = lanes[self.statuses[lanes, 0] == PENDING]
+        self.current_hands[playing] = 0
+        self.statuses[playing, 0] = PLAYING
+
+        while playing.size:
+            hands = self.current_hands[playing]
+            finished = np.zeros(playing.size, dtype=bool)
+
+            # Handle single-card hands that result from splitting by hitting them automatically.
+            single = self.num_cards[playing, hands] == 1
+            if single.any():
+                single_lanes, single_hands = playing[single], hands[single]
+                ranks = self._draw(single_lanes)
+                self._add_cards(single_lanes, single_hands, ranks)
+                self.second_ranks[single_lanes, single_hands] = ranks
+
+                # Blackjack is an automatic win. Split Aces only get 1 more card by rule.
+                totals, _ = self._totals(single_lanes, single_hands)
+                blackjack = totals == 21
+                self.statuses[single_lanes[blackjack], single_hands[blackjack]] = BLACKJACK
+                self.outcomes[single_lanes[blackjack], single_hands[blackjack]] = WIN
+                split_aces = ~blackjack & (self.first_ranks[single_lanes, single_hands] == 0)
+                self.statuses[single_lanes[split_aces], single_hands[split_aces]] = STOOD
+                finished[single] = blackjack | split_aces
+
+            # Look up the action for every hand still being played
+            deciding = ~finished
+            self._apply_actions(playing[deciding], hands[deciding])
+
+            # Move on to the next hand of games whose current hand is done being played.
+            done = self.statuses[playing, hands] != PLAYING
+            done_lanes = playing[done]
+            self.current_hands[done_lanes] += 1
+            more = self.current_hands[done_lanes] < self.num_hands[done_lanes]
+            self.statuses[done_lanes[more], self.current_hands[done_lanes[more]]] = PLAYING
+            playing = np.concatenate([playing[~done], done_lanes[more]])
+
+    def _apply_actions(self, lanes, hands):
+        """Decide and carry out one action on a hand of each of the given games."""
+        totals, soft = self._totals(lanes, hands)
+        upcards = RANK_VALUES[self.dealer_upcards[lanes]]
+        wagers = self.wagers[lanes, hands]
+        two_cards = self.num_cards[lanes, hands] == 2
+        affordable = wagers <= self.bankrolls[lanes]
+
+        # Look up actions (splitting if it's an option and the strategy says so). Hit in place of a double that isn't an option.
+        first_ranks = self.first_ranks[lanes, hands]
+        can_split = two_cards & affordable & (first_ranks == self.second_ranks[lanes, hands])
+        pairs = np.where(can_split, RANK_VALUES[first_ranks], 0)
+        actions = self.actions[pairs, soft.astype(np.int8), totals, upcards]
+        actions[(actions == DOUBLE) & ~(two_cards & affordable)] = HIT
+
+        # Hit: deal another card and keep playing the hand.
+        hit = actions == HIT
+        self._add_cards(lanes[hit], hands[hit], self._draw(lanes[hit]))
+
+        # Stand: hand is played.
+        stand = actions == STAND
+        self.statuses[lanes[stand], hands[stand]] = STOOD
+
+        # Double: double the wager and deal another card. Hand is played.
+        double = actions == DOUBLE
+        double_lanes, double_hands = lanes[double], hands[double]
+        self.bankrolls[double_lanes] -= wagers[double]
+        self.wagers[double_lanes, double_hands] += wagers[double]
+        self._add_cards(double_lanes, double_hands, self._draw(double_lanes))
+        self.statuses[double_lanes, double_hands] = DOUBLED
+
+        # Split: put the second card into a new hand (with the same wager) and keep playing this hand.
+        split = actions == SPLIT
+        if split.any():
+            self._split(lanes[split], hands[split], wagers[split])
+
+        # If the hand is 21 or busted, the hand is done being played.
+        totals, _ = self._totals(lanes, hands)
+        self.statuses[lanes[totals == 21], hands[totals == 21]] = STOOD
+        busted = totals > 21
+        self.statuses[lanes[busted], hands[busted]] = BUSTED
+        self.outcomes[lanes[busted], hands[busted]] = LOSS
+
+    def _split(self, lanes, hands, wagers):
+        """Split a hand of each of the given games."""
+        if self.num_hands[lanes].max() == self.hand_capacity:
+            self._grow_hands(self.hand_capacity)
+
+        # Take the second card off the hand
+        split_ranks = self.second_ranks[lanes, hands]
+        self.hard_totals[lanes, hands] -= RANK_VALUES[split_ranks]
+        self.num_aces[lanes, hands] -= split_ranks == 0
+        self.num_cards[lanes, hands] = 1
+
+        # Make a new hand from it, placing the same wager
+        new_hands = self.num_hands[lanes]
+        self.hard_totals[lanes, new_hands] = RANK_VALUES[split_ranks]
+        self.num_aces[lanes, new_hands] = split_ranks == 0
+        self.num_cards[lanes, new_hands] = 1
+        self.first_ranks[lanes, new_hands] = split_ranks
+        self.wagers[lanes, new_hands] = wagers
+        self.statuses[lanes, new_hands] = PENDING
+        self.bankrolls[lanes] -= wagers
+        self.num_hands[lanes] += 1
+
+    def play_dealer_turns(self, lanes):
+        """Play the dealer's turn of each game that has gambler hands still active."""
+        active = (self.statuses[lanes] == STOOD) | (self.statuses[lanes] == DOUBLED)
+        playing = lanes[active.any(axis=1)]
+
+        while playing.size:
+            # Dealer hits under 17 and must hit a soft 17. Dealer stands at 17 and above.
+            totals, soft = self._dealer_totals(playing)
+            playing = playing[(totals < 17) | ((totals == 17) & soft)]
+            ranks = self._draw(playing)
+            self.dealer_hard_totals[playing] += RANK_VALUES[ranks]
+            self.dealer_num_aces[playing] += ranks == 0
+
+            # If the hand is busted dealer is done playing.
+            totals, _ = self._dealer_totals(playing)
+            busted = totals > 21
+            self.dealer_busted[playing[busted]] = True
+            playing = playing[~busted]
+
+    def settle_up(self, lanes):
+        """Determine the outcome of every unsettled hand against the dealer's hand, and pay out winnings."""
+        dealer_totals, _ = self._dealer_totals(lanes)
+        dealer_busted = self.dealer_busted[lanes]
+
+        for hand in range(self.hand_capacity):
+            in_play = hand < self.num_hands[lanes]
+            if not in_play.any():
+                break
+
+            # Determine the outcome of hands that aren't settled yet (busted hands are already losses).
+            outcomes = self.outcomes[lanes, hand]
+            totals, _ = self._totals(lanes, hand)
+            unsettled = in_play & (outcomes == NO_OUTCOME)
+            outcomes[unsettled & dealer_busted] = WIN
+            outcomes[unsettled & ~dealer_busted & (totals > dealer_totals)] = WIN
+            outcomes[unsettled & ~dealer_busted & (totals == dealer_totals)] = PUSH
+            outcomes[unsettled & ~dealer_busted & (totals < dealer_totals)] = LOSS
+            self.outcomes[lanes, hand] = outcomes
+
+            # Pay out wins 1:1 (3:2 for blackjacks) and even money, reclaim pushes, and pay insurance 2:1.
+            wagers = self.wagers[lanes, hand]
+            blackjack = self.statuses[lanes, hand] == BLACKJACK
+            payouts = np.zeros(lanes.size, dtype=np.float64)
+            payouts[(outcomes == WIN) & blackjack] = 2.5 * wagers[(outcomes == WIN) & blackjack]
+            payouts[(outcomes == WIN) & ~blackjack] = 2 * wagers[(outcomes == WIN) & ~blackjack]
+            payouts[outcomes == EVEN_MONEY] = 2 * wagers[outcomes == EVEN_MONEY]
+            payouts[outcomes == PUSH] = wagers[outcomes == PUSH]
+            payouts[outcomes == INSURANCE_WIN] = 3 * self.insurance[lanes[outcomes == INSURANCE_WIN]]
+            self.bankrolls[lanes] += payouts
+
+    def track_metrics(self, lanes):
+        """Update the tracked metrics with the current turn's data."""
+        statuses = self.statuses[lanes]
+        outcomes = self.outcomes[lanes]
+        self.gambler_blackjacks[lanes] += (statuses == BLACKJACK).sum(axis=1)
+        self.wins[lanes] += ((outcomes == WIN) | (outcomes == EVEN_MONEY)).sum(axis=1)
+        self.losses[lanes] += (outcomes == LOSS).sum(axis=1)
+        self.pushes[lanes] += (outcomes == PUSH).sum(axis=1)
+        self.insurance_wins[lanes] += (outcomes == INSURANCE_WIN).sum(axis=1)
+        self.insurance_losses[lanes] += self.lost_insurance[lanes]
+        self.amount_wagered[lanes] += self.wagers[lanes].sum(axis=1) + self.insurance[lanes]
+
+        # Track the bankrolls of games that played this turn (NaN for the rest), on the stride. A game's turns are the
+        # rounds it played, as games only ever drop out.
+        self.rounds += 1
+        if self.bankroll_stride and self.rounds % self.bankroll_stride == 0:
+            bankrolls = np.full(self.num_games, np.nan)
+            bankrolls[lanes] = self.bankrolls[lanes]
+            self.bankroll_history.append(bankrolls)
+
+    def metric_trackers(self):
+        """Get a MetricTracker per game, as GameController would have tracked them."""
+        progressions = self.bankroll_progressions()
+        trackers = []
+        for lane in range(self.num_games):
+            tracker = MetricTracker(bankroll_stride=self.bankroll_stride)
+            tracker.wins = int(self.wins[lane])
+            tracker.losses = int(self.losses[lane])
+            tracker.pushes = int(self.pushes[lane])
+            tracker.insurance_wins = int(self.insurance_wins[lane])
+            tracker.insurance_losses = int(self.insurance_losses[lane])
+            tracker.gambler_blackjacks = int(self.gambler_blackjacks[lane])
+            tracker.dealer_blackjacks = int(self.dealer_blackjacks[lane])
+            tracker.amount_wagered = float(self.amount_wagered[lane])
+            tracker.turns = int(self.turns[lane])
+            tracker.initial_bankroll = float(self.initial_bankrolls[lane])
+            tracker.final_bankroll = float(self.bankrolls[lane])
+            tracker.bankroll_progression = progressions[lane]
+            trackers.append(tracker)
+        return trackers
+
+    def bankroll_progressions(self):
+        """Get each game's tracked bankroll progression, as a typed array (see `MetricTracker.bankroll_progression`)."""
+        progressions = [array('d') for _ in range(self.num_games)]
+        if self.bankroll_stride:
+            history = np.vstack(self.bankroll_history)
+            for lane, progression in enumerate(progressions):
+                progression.frombytes(history[:self.turns[lane] // self.bankroll_stride + 1, lane].tobytes())
+        return progressions
+
+    def summarize_metrics(self):
+        """Get a compact summary of tracked metrics per game, as MetricTracker.summarize_metrics() would."""
+        summaries = [
+            {
+                'wins': int(self.wins[lane]),
+                'losses': int(self.losses[lane]),
+                'pushes': int(self.pushes[lane]),
+                'insurance_wins': int(self.insurance_wins[lane]),
+                'insurance_losses': int(self.insurance_losses[lane]),
+                'gambler_blackjacks': int(self.gambler_blackjacks[lane]),
+                'dealer_blackjacks': int(self.dealer_blackjacks[lane]),
+                'amount_wagered': float(self.amount_wagered[lane]),
+                'turns': int(self.turns[lane]),
+                'initial_bankroll': float(self.initial_bankrolls[lane]),
+                'final_bankroll': float(self.bankrolls[lane])
+            }
+            for lane in range(self.num_games)
+        ]
+        if self.bankroll_stride:
+            for summary, progression in zip(summaries, self.bankroll_progressions()):
+                summary['bankroll_stride'] = self.bankroll_stride
+                summary['bankroll_progression'] = progression
+        return summaries
@@ -11,3 +11,8 @@ class InsufficientBankrollError(Error):
 class OverdraftError(Error):
     """Custom exception to raise when a player's bankroll attempts to go below zero."""
     pass
+
+
+class SessionError(Error):
+    """Custom exception to raise when a remote game session can't continue (e.g. the client disconnected)."""
+    pass
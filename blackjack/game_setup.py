@@ -1,26 +1,71 @@
 
 from blackjack.controllers.game_controller import GameController
+from blackjack.controllers.table_controller import TableController
 from blackjack.models.dealer import Dealer
 from blackjack.models.gambler import Gambler
 from blackjack.models.shoe import Shoe
 
 
-def setup_game(config):
-    """Set up the GameController class that runs the game from a configuration dictionary."""
+def setup_game(config, rng=None, hand_recorder=None, phase_timer=None, shoe=None):
+    """
+    Set up the GameController class that runs the game from a configuration dictionary.
+    Optionally, pass a random number generator (e.g. a seeded `random.Random`) for shuffling the Shoe,
+    a HandRecorder to record every played hand with, and a PhaseTimer to time each phase of the game's turns with.
+    A Shoe from a previous game (with the configured number of decks and penetration) can be passed to be reset and reused.
+    """
     # Extract values from configuration. Note that this dict could grow and be stored/loaded from a
     # different source, so doing this to keep configuration flexible.
     name = config['gambler']['name']
     bankroll = config['gambler']['bankroll']
     auto_wager = config['gambler']['auto_wager']
     number_of_decks = config['shoe']['number_of_decks']
+    penetration = config['shoe']['penetration']
     strategy = config['gameplay']['strategy']
     verbose = config['gameplay']['verbose']
     max_turns = config['gameplay']['max_turns']
+    bankroll_stride = config['analytics']['bankroll_stride']
 
     # Create core components of the game: A Gambler, a Dealer, and a Shoe of cards.
     gambler = Gambler(name, bankroll=bankroll, auto_wager=auto_wager)
     dealer = Dealer()
-    shoe = Shoe(number_of_decks)
+    if shoe is None:
+        shoe = Shoe(number_of_decks, rng=rng, penetration=penetration)
+    else:
+        shoe.reset(rng)
 
     # Instantiate and return the central controller of the game.
-    return GameController(gambler, dealer, shoe, strategy(), verbose=verbose, max_turns=max_turns)
+    return GameController(gambler, dealer, shoe, strategy(), verbose=verbose, max_turns=max_turns, hand_recorder=hand_recorder,
+                          phase_timer=phase_timer, bankroll_stride=bankroll_stride)
+
+
+def setup_table(config, rng=None, shoe=None):
+    """
+    Set up a TableController with `config['table']['seats']` seats from a configuration dictionary. Every seat gets its
+    own Gambler (with the configured bankroll and auto-wager) and instance of the configured strategy, and shares the
+    table's Dealer and Shoe. The RNG and reusable Shoe options are the same as `setup_game()`'s.
+    """
+    name = config['gambler']['name']
+    bankroll = config['gambler']['bankroll']
+    auto_wager = config['gambler']['auto_wager']
+    number_of_decks = config['shoe']['number_of_decks']
+    penetration = config['shoe']['penetration']
+    strategy = config['gameplay']['strategy']
+    verbose = config['gameplay']['verbose']
+    max_turns = config['gameplay']['max_turns']
+    num_seats = config['table']['seats']
+    bankroll_stride = config['analytics']['bankroll_stride']
+
+    # Create the shared components of the table: A Dealer and a Shoe of cards.
+    dealer = Dealer()
+    if shoe is None:
+        shoe = Shoe(number_of_decks, rng=rng, penetration=penetration)
+    else:
+        shoe.reset(rng)
+
+    # Create a GameController for each seat, with its own Gambler and strategy.
+    seats = [
+        GameController(Gambler(f"{name} {seat + 1}", bankroll=bankroll, auto_wager=auto_wager), dealer, shoe, strategy(),
+                       verbose=verbose, max_turns=max_turns, bankroll_stride=bankroll_stride)
+        for seat in range(num_seats)
+    ]
+    return TableController(seats, dealer, shoe, max_turns=max_turns)
@@ -21,6 +21,8 @@ class Card:
         self.suit = suit
         self.name = name
         self.value = value
+        self.hard_value = 1 if name == 'Ace' else value  # Value with Aces counted as 1
+        self.code = card_code(Card.SUITS.index(suit), [rank for rank, _ in Card.RANKS].index(name))
 
     def __str__(self):
         return f"{self.name} of {self.suit}"
@@ -28,6 +30,11 @@ class Card:
     def __repr__(self):
         return self.__str__()
 
+    @staticmethod
+    def from_code(code):
+        """Get the shared Card instance for an integer card code (see `card_code()`)."""
+        return FLYWEIGHTS[code]
+
     def is_ace(self):
         """Check whether the card is an ace."""
         return self.name == 'Ace'
@@ -39,3 +46,16 @@ class Card:
     def csv_format(self):
         """String representation of the card for Strategy CSVs."""
         return 'A' if self.is_ace() else str(self.value)
+
+
+def card_code(suit_index, rank_index):
+    """
+    Encode a card as a small integer (0-51) from its indexes into `Card.SUITS` and `Card.RANKS`.
+    Codes are compact enough to be stored in a signed char array (typecode 'b').
+    """
+    return suit_index * len(Card.RANKS) + rank_index
+
+
+# Shared Card instances ("flyweights") for every card code. Cards are immutable in practice, so a shoe
+# of any size only needs these 52 objects, materialized by code when something needs a Card.
+FLYWEIGHTS = tuple(Card(suit, name, value) for suit in Card.SUITS for name, value in Card.RANKS)
@@ -0,0 +1,48 @@
+from blackjack.models.card import Card
+
+
+# Count weights of each rank, ordered like `Card.RANKS` (Ace, 2-10, Jack, Queen, King)
+HI_LO = (-1, 1, 1, 1, 1, 1, 0, 0, 0, -1, -1, -1, -1)
+
+
+class CardCounter:
+    """
+    Running count of the cards dealt from a Shoe, kept up to date incrementally as each card is dealt (see `Shoe.deal_card_code()`).
+    Cards dealt face down (the dealer's hole card) aren't counted until they're revealed.
+    """
+
+    def __init__(self, weights=HI_LO):
+        if len(weights) != len(Card.RANKS):
+            raise ValueError(f"Expected {len(Card.RANKS)} rank weights, got {len(weights)}")
+        self.weights = tuple(weights)
+
+        # Weight of every card code, so counting a card is a single lookup (codes are `suit_index * 13 + rank_index`)
+        self.code_weights = tuple(self.weights[code % len(Card.RANKS)] for code in range(len(Card.SUITS) * len(Card.RANKS)))
+
+        self.running_count = 0
+        self.hidden_codes = []
+
+    def reset(self):
+        """Reset the count (when the shoe is reshuffled)."""
+        self.running_count = 0
+        self.hidden_codes = []
+
+    def count(self, code):
+        """Count a dealt card by its code."""
+        self.running_count += self.code_weights[code]
+
+    def hide(self, code):
+        """Hold back a card dealt face down from the count until it's revealed."""
+        self.hidden_codes.append(code)
+
+    def reveal(self):
+        """Count the cards dealt face down."""
+        for code in self.hidden_codes:
+            self.running_count += self.code_weights[code]
+        self.hidden_codes = []
+
+    def true_count(self, cards_remaining):
+        """Get the running count per deck left to be dealt (0 once the shoe is exhausted and due for a reshuffle)."""
+        if cards_remaining == 0:
+            return 0.0
+        return self.running_count * len(Card.SUITS) * len(Card.RANKS) / cards_remaining
@@ -1,16 +1,16 @@
-from blackjack.models.card import Card
+from array import array
+
+from blackjack.models.card import Card, card_code
 
 
 class Deck:
 
+    # Integer codes for all 52 cards of a deck (see `card_code()`).
+    CODES = array('b', (card_code(s, r) for s in range(len(Card.SUITS)) for r in range(len(Card.RANKS))))
+
     def __init__(self):
-        self.cards = self._build_deck()
+        self.codes = array('b', self.CODES)
 
-    @staticmethod
-    def _build_deck():
-        """Create a full deck of all 52 cards."""
-        cards = []
-        for suit in Card.SUITS:
-            for name, value in Card.RANKS:
-                cards.append(Card(suit, name, value))
-        return cards
+    def cards(self):
+        """Get all cards of the deck as (shared) Card instances."""
+        return [Card.from_code(code) for code in self.codes]
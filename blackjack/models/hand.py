@@ -1,50 +1,75 @@
 from blackjack.display_utils import money_format
 
 
+# Bit flags of the actions taken on a gambler hand (see `GamblerHand.actions`)
+ACTION_FLAGS = {'Hit': 1, 'Stand': 2, 'Double': 4, 'Split': 8}
+
+
 class Hand:
 
     def __init__(self, cards=None, status='Pending'):
-        self.cards = cards or []  # Card order matters for consistent display
+        # Cards are a tuple, only changed by `add_card()` and `pop_card()` so the running totals stay in sync with them.
+        # Card order matters for consistent display.
+        self._cards = tuple(cards) if cards else ()
         self.status = status
 
+        # Running totals, kept up to date as cards are added and popped (see `add_card()` and `pop_card()`)
+        self.hard_total = sum(card.hard_value for card in self._cards)  # Total with all Aces counted as 1
+        self.num_aces = sum(1 for card in self._cards if card.is_ace())
+
         if self.is_blackjack():
             self.status = 'Blackjack'
 
+    @property
+    def cards(self):
+        """The cards in the hand (read-only: add and pop cards with `add_card()` and `pop_card()`)."""
+        return self._cards
+
     def __str__(self):
-        return ' | '.join(str(card) for card in self.cards)
+        return ' | '.join(str(card) for card in self._cards)
 
     def __repr__(self):
         return self.__str__()
 
+    def add_card(self, card):
+        """Add a card to the hand, updating the running totals."""
+        self._cards += (card,)
+        self.hard_total += card.hard_value
+        if card.is_ace():
+            self.num_aces += 1
+
+    def pop_card(self, index=-1):
+        """Remove a card from the hand (by position) and return it, updating the running totals."""
+        cards = list(self._cards)
+        card = cards.pop(index)
+        self._cards = tuple(cards)
+        self.hard_total -= card.hard_value
+        if card.is_ace():
+            self.num_aces -= 1
+        return card
+
     def possible_totals(self):
         """Sum the cards in the hand. Return 2 totals, due to the dual value of Aces."""
-        # Get the number of aces in the hand
-        num_aces = self.get_num_aces_in_hand()
-
-        # Get the total for all non-ace cards first, as this is constant
-        non_ace_total = sum(card.value for card in self.cards if card.name != 'Ace')
-
         # If there are no aces in the hand, there is only one possible total. Return it.
-        if num_aces == 0:
-            return non_ace_total, None
+        if self.num_aces == 0:
+            return self.hard_total, None
 
         # If there are aces in the hand, extra logic is needed:
         # - Each ace can have 2 possible values (1 or 11). 
         # - However, only one ace *per hand* can logically be 11 in order to *possibly* stay under a total of 22.
         # - Thus, there will always be 2 *possibly non-busting* hand totals if there is at least one ace in the hand.
-        high_total = non_ace_total + 11 + num_aces - 1
-        low_total = non_ace_total + num_aces
+        high_total = self.hard_total + 10
 
         # If the high_total is already busting, only return the low_total (to be vetted for busting later)
         if high_total > 21:
-            return low_total, None
+            return self.hard_total, None
         # Otherwise, return both totals
         else:
-            return low_total, high_total
+            return self.hard_total, high_total
 
     def get_num_aces_in_hand(self):
         """Get the number of Aces in the hand."""
-        return sum(1 for card in self.cards if card.is_ace())
+        return self.num_aces
 
     def format_possible_totals(self):
         """Get human readable string representing the hand total(s) to display."""
@@ -61,8 +86,9 @@ class Hand:
 
     def final_total(self):
         """Get the singular hand total for determining the outcome (high total if it exists, otherwise low total)."""
-        low_total, high_total = self.possible_totals()
-        return high_total or low_total
+        if self.is_soft():
+            return self.hard_total + 10
+        return self.hard_total
 
     def get_total_to_display(self):
         """Get the hand total to display contingent on hand status."""
@@ -78,7 +104,7 @@ class Hand:
 
     def is_blackjack(self):
         """Check whether the hand is blackjack."""
-        return self.is_21() and len(self.cards) == 2
+        return self.is_21() and len(self._cards) == 2
 
     def is_busted(self):
         """Check whether the hand is busted."""
@@ -86,8 +112,7 @@ class Hand:
 
     def is_soft(self):
         """Check whether a hand is 'soft', meaning has an Ace counted as 11."""
-        _, high_total = self.possible_totals()
-        return bool(high_total)
+        return self.num_aces > 0 and self.hard_total <= 11
 
 
 class GamblerHand(Hand):
@@ -103,6 +128,7 @@ class GamblerHand(Hand):
         self.outcome = None
         self.earnings = 0
         self.lost_insurance = False
+        self.actions = 0  # Bit flags of actions taken (see ACTION_FLAGS, only tracked when hands are being recorded)
 
     def pretty_format(self):
         """Get a string representation of the hand formatted to be printed."""
@@ -123,6 +149,20 @@ class GamblerHand(Hand):
         
         return '\n\t'.join(lines)
 
+    def serialize(self):
+        """Get a JSON-serializable representation of the hand (e.g. to send to a remote client)."""
+        return {
+            'hand_number': self.hand_number,
+            'cards': [str(card) for card in self._cards],
+            'total': self.final_total(),
+            'soft': self.is_soft(),
+            'wager': self.wager,
+            'insurance': self.insurance,
+            'status': self.status,
+            'outcome': self.outcome,
+            'net': self.earnings - self.wager - self.insurance
+        }
+
     def is_splittable(self):
         """
         Check whether the hand is splittable. 
@@ -130,7 +170,7 @@ class GamblerHand(Hand):
         1) Hand is made up of two cards.
         2) The name of the two cards matches (e.g. King-King, Five-Five, etc.)
         """
-        return len(self.cards) == 2 and self.cards[0].name == self.cards[1].name
+        return len(self._cards) == 2 and self._cards[0].name == self._cards[1].name
 
     def is_doubleable(self):
         """
@@ -138,13 +178,13 @@ class GamblerHand(Hand):
         Requirements:
         1) Hand is made up of two cards.
         """
-        return len(self.cards) == 2
+        return len(self._cards) == 2
 
 
 class DealerHand(Hand):
 
     def up_card(self):
-        return self.cards[0]
+        return self._cards[0]
 
     def pretty_format(self, hide=True):
         """Get a string representation of the hand formatted to be printed."""
@@ -165,3 +205,12 @@ class DealerHand(Hand):
             status
         ]
         return '\n\t'.join(lines)
+
+    def serialize(self, hide=True):
+        """Get a JSON-serializable representation of the hand. If `hide` is True, only the up card is shown."""
+        if hide:
+            up_card = self.up_card()
+            total = 11 if up_card.is_ace() else up_card.value
+            return {'cards': [str(up_card)], 'total': total, 'soft': up_card.is_ace(), 'status': 'Pending'}
+
+        return {'cards': [str(card) for card in self._cards], 'total': self.final_total(), 'soft': self.is_soft(), 'status': self.status}
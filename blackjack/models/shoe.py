@@ -1,43 +1,96 @@
 import random
 
+from blackjack.models.card import Card
 from blackjack.models.deck import Deck
 
 
 class Shoe:
 
-    def __init__(self, num_decks):
-        # Create the decks of cards.
-        self.decks = [Deck() for _ in range(num_decks)]
+    def __init__(self, num_decks, rng=None, penetration=1.0):
+        self.num_decks = num_decks
 
-        # List to hold the cards to be dealt, in the order in which they'll be dealt.
-        self.card_pile = []
+        # Random number generator for shuffling (e.g. a seeded `random.Random`). Defaults to the `random` module.
+        self.rng = rng or random
+
+        # Preallocated buffer of integer card codes, in the order in which they'll be dealt. It is shuffled
+        # in place and dealt by advancing a cursor, so no cards are (re)allocated over the life of the shoe.
+        self.card_pile = Deck.CODES * num_decks
+        self.cursor = 0
+        self._canonical_pile = Deck.CODES * num_decks  # Unshuffled order, for `reset()`
+
+        # Position of the cut card: the fraction of the pile (penetration) dealt before the shoe is due for a reshuffle
+        # between turns. The pile is still reshuffled mid-turn if it runs out.
+        if not 0 < penetration <= 1:
+            raise ValueError(f"Penetration must be greater than 0 and at most 1, got {penetration}")
+        self.cut_card = max(1, int(len(self.card_pile) * penetration))
+
+        # Optional CardCounter, updated as each card is dealt and reset on each reshuffle.
+        self.counter = None
 
         # Initialize with a shuffled card pile so the shoe is ready to be played.
         self.reset_card_pile()
 
     def cards(self):
-        """Get all cards belonging to the shoe (through decks)."""
-        cards = []
-        for deck in self.decks:
-            for card in deck.cards:
-                cards.append(card)
-        return cards
-
-    def shuffled_cards(self):
-        """Shuffle the shoe's cards."""
-        cards = self.cards()
-        random.shuffle(cards)
-        return cards
+        """Get all cards belonging to the shoe."""
+        return [Card.from_code(code) for code in self.card_pile]
+
+    def cards_remaining(self):
+        """Get the number of cards left to be dealt before a reshuffle."""
+        return len(self.card_pile) - self.cursor
+
+    def past_cut_card(self):
+        """Check whether the cut card has been reached (so the shoe should be reshuffled before the next turn)."""
+        return self.cursor >= self.cut_card
 
     def reset_card_pile(self):
-        """Reset the shoe's card pile."""
-        self.card_pile = self.shuffled_cards()
+        """Reset the shoe's card pile by shuffling all of its cards in place."""
+        self.rng.shuffle(self.card_pile)
+        self.cursor = 0
+        if self.counter is not None:
+            self.counter.reset()
 
-    def deal_card(self):
-        """Deal a card from the shoe (reshuffle if pile exhausted)."""
-        if not self.card_pile:
+    def reset(self, rng=None):
+        """
+        Restore the shoe to how it was built (canonical card order, no CardCounter) and shuffle it with a new RNG,
+        so it can be reused for another game exactly as if it were a new Shoe.
+        """
+        self.rng = rng or random
+        self.card_pile[:] = self._canonical_pile
+        self.counter = None
+        self.reset_card_pile()
+
+    def attach_counter(self, counter):
+        """Keep a CardCounter's count of the cards dealt from this shoe, starting from the current position in the pile."""
+        self.counter = counter
+        counter.reset()
+        for code in self.card_pile[:self.cursor]:
+            counter.count(code)
+
+    def true_count(self):
+        """Get the true count of the attached CardCounter."""
+        return self.counter.true_count(self.cards_remaining())
+
+    def reveal_cards(self):
+        """Count any cards dealt face down now that they're revealed (if a CardCounter is attached)."""
+        if self.counter is not None:
+            self.counter.reveal()
+
+    def deal_card_code(self, face_down=False):
+        """Deal a card from the shoe as an integer code (reshuffle if pile exhausted)."""
+        if self.cursor == len(self.card_pile):
             self.reset_card_pile()
-        return self.card_pile.pop()
+        code = self.card_pile[self.cursor]
+        self.cursor += 1
+        if self.counter is not None:
+            if face_down:
+                self.counter.hide(code)
+            else:
+                self.counter.count(code)
+        return code
+
+    def deal_card(self, face_down=False):
+        """Deal a card from the shoe (reshuffle if pile exhausted). Cards dealt face down aren't counted until revealed."""
+        return Card.from_code(self.deal_card_code(face_down))
 
     def deal_n_cards(self, num_cards):
         """Deal a set number of cards from the shoe."""
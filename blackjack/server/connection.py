@@ -0,0 +1,38 @@
+import json
+
+from blackjack.exc import SessionError
+
+
+class Connection:
+    """
+    A client connection exchanging messages over an asyncio stream (e.g. a TCP socket).
+    Messages are JSON objects, one per line in both directions.
+    """
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    async def send(self, message):
+        """Send a message (a JSON-serializable dict)."""
+        self.writer.write(json.dumps(message).encode() + b'\n')
+        await self.writer.drain()
+
+    async def receive(self):
+        """Wait for the next message. Lines that aren't valid JSON are received as None."""
+        line = await self.reader.readline()
+        if not line:
+            raise SessionError('Connection closed')
+
+        try:
+            return json.loads(line)
+        except ValueError:
+            return None
+
+    async def close(self):
+        """Close the connection (ignoring errors from a connection that's already gone)."""
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
@@ -0,0 +1,92 @@
+import asyncio
+
+from blackjack.analytics.multi_game_analyzer import MultiGameAnalyzer
+from blackjack.controllers.async_game_controller import AsyncGameController
+from blackjack.exc import SessionError
+from blackjack.models.dealer import Dealer
+from blackjack.models.gambler import Gambler
+from blackjack.models.shoe import Shoe
+from blackjack.server.connection import Connection
+
+
+def raise_open_file_limit():
+    """
+    Raise this process's soft limit on open files to its hard limit, as every client connection holds a socket open
+    (the default soft limit is often 1024). Does nothing on platforms without the `resource` module (e.g. Windows).
+    """
+    try:
+        import resource
+    except ImportError:
+        return
+
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft != hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+def setup_async_game(config, connection, rng=None, pace=0.0):
+    """
+    Set up an AsyncGameController for a remote client from a configuration dictionary (see `get_server_configuration()`).
+    The configured strategy (e.g. RemoteStrategy) makes its decisions over the client's Connection, which the state of the
+    table is also sent to. The dealer's plays are paced by `pace` seconds.
+    """
+    # This lives apart from `game_setup` so that simulations don't pay for importing asyncio.
+    name = config['gambler']['name']
+    bankroll = config['gambler']['bankroll']
+    auto_wager = config['gambler']['auto_wager']
+    number_of_decks = config['shoe']['number_of_decks']
+    penetration = config['shoe']['penetration']
+    strategy = config['gameplay']['strategy']
+    max_turns = config['gameplay']['max_turns']
+
+    gambler = Gambler(name, bankroll=bankroll, auto_wager=auto_wager)
+    dealer = Dealer()
+    shoe = Shoe(number_of_decks, rng=rng, penetration=penetration)
+
+    return AsyncGameController(gambler, dealer, shoe, strategy(connection), max_turns=max_turns, pace=pace,
+                               notify=connection.send)
+
+
+class GameServer:
+    """
+    Hosts interactive games for remote clients, all on one asyncio event loop.
+
+    Every client connection plays its own game (an AsyncGameController, deciding with the configured RemoteStrategy),
+    exchanging one JSON message per line (see Connection and RemoteStrategy for the protocol). The summaries of
+    completed games are aggregated in a MultiGameAnalyzer.
+    """
+
+    def __init__(self, configuration, pace=0.0):
+        self.configuration = configuration
+        self.pace = pace
+
+        self.active_sessions = 0
+        self.analyzer = MultiGameAnalyzer()
+
+    async def handle_connection(self, reader, writer):
+        """Play a game with a newly connected client, until it's over or the client goes away."""
+        connection = Connection(reader, writer)
+        game = setup_async_game(self.configuration, connection, pace=self.pace)
+
+        self.active_sessions += 1
+        try:
+            await connection.send({
+                'type': 'welcome',
+                'bankroll': game.gambler.bankroll,
+                'auto_wager': game.gambler.auto_wager,
+                'number_of_decks': game.shoe.num_decks,
+                'max_turns': game.max_turns
+            })
+            await game.play()
+            self.analyzer.add_game(game.metric_tracker.summarize_metrics())
+        except (SessionError, ConnectionError):
+            pass  # The client disconnected (or stopped responding sensibly). Abandoned games aren't analyzed.
+        finally:
+            self.active_sessions -= 1
+            await connection.close()
+
+    async def serve(self, host, port, backlog=1024):
+        """Accept client connections until cancelled (e.g. with a keyboard interrupt)."""
+        server = await asyncio.start_server(self.handle_connection, host, port, backlog=backlog)
+        async with server:
+            await server.serve_forever()
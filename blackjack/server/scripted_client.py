@@ -0,0 +1,43 @@
+import asyncio
+import json
+import random
+from time import perf_counter
+
+
+def scripted_response(prompt):
+    """Respond to a prompt like a cautious player: hit below 17 (like the dealer), and decline everything else."""
+    if prompt['prompt'] == 'action':
+        return 'h' if prompt['hand']['total'] < 17 else 's'
+    return 'n'
+
+
+async def play_scripted_game(host, port, respond=scripted_response, think=0.0, on_latency=None):
+    """
+    Connect to a GameServer and play a game to completion, responding to each prompt with `respond(prompt)` after
+    thinking it over for a random (exponentially distributed) `think` seconds on average. Returns the server's final ('game_over') message. If given, `on_latency` is called with the seconds between each
+    response and the server's next message (i.e. the latency of each action, as seen by the client).
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        sent_at = None
+        while True:
+            line = await reader.readline()
+            if not line:
+                raise ConnectionError('The server closed the connection before the game was over')
+
+            if sent_at is not None:
+                if on_latency is not None:
+                    on_latency(perf_counter() - sent_at)
+                sent_at = None
+
+            message = json.loads(line)
+            if message['type'] == 'prompt':
+                if think:
+                    await asyncio.sleep(random.expovariate(1 / think))
+                writer.write(json.dumps({'response': respond(message)}).encode() + b'\n')
+                await writer.drain()
+                sent_at = perf_counter()
+            elif message['type'] == 'game_over':
+                return message
+    finally:
+        writer.close()
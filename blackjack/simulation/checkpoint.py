@@ -0,0 +1,59 @@
+import os
+import pickle
+from time import monotonic
+
+
+class Checkpoint:
+    """
+    Periodically saved progress of a simulation run in a local file, so that the run can be resumed if it's interrupted.
+
+    The saved state is whatever the run needs to carry on, e.g. its root seed, the number of games played and the
+    aggregated results (a MultiGameAnalyzer, which pickles as is). Games are aggregated in order and each game's shuffles
+    are derived from the root seed and its number, so playing on from game N reproduces an uninterrupted run exactly.
+    The parameters of the run are saved alongside the state, to refuse resuming a run with different parameters.
+    Checkpoints are pickles, so only load ones you trust.
+    """
+
+    def __init__(self, path, parameters, interval=60.0):
+        self.path = path
+        self.parameters = parameters
+        self.interval = interval  # Minimum number of seconds between saves (unless forced)
+        self._last_saved = monotonic()
+
+    def exists(self):
+        """Check whether the checkpoint file exists."""
+        return os.path.exists(self.path)
+
+    def load(self):
+        """Load the saved state of the run. Raises a ValueError if it was saved by a run with different parameters."""
+        with open(self.path, 'rb') as checkpoint_file:
+            checkpoint = pickle.load(checkpoint_file)
+
+        differences = [
+            f"{name} (saved: {checkpoint['parameters'].get(name)!r}, now: {value!r})"
+            for name, value in self.parameters.items() if checkpoint['parameters'].get(name) != value
+        ]
+        if differences:
+            raise ValueError(f"Checkpoint was saved by a run with different parameters: {', '.join(differences)}")
+        return checkpoint['state']
+
+    def save(self, state, force=False):
+        """
+        Save the state of the run if `interval` seconds have passed since the last save (or if forced).
+        The file is replaced atomically, so an interruption or error mid-save leaves the previous checkpoint intact.
+        """
+        if not force and monotonic() - self._last_saved < self.interval:
+            return
+
+        temporary_path = f"{self.path}.tmp"
+        try:
+            with open(temporary_path, 'wb') as checkpoint_file:
+                pickle.dump({'parameters': self.parameters, 'state': state}, checkpoint_file)
+                checkpoint_file.flush()
+                os.fsync(checkpoint_file.fileno())
+            os.replace(temporary_path, self.path)
+        finally:
+            # Don't leave a partial file behind if the save failed (e.g. the state couldn't be pickled)
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+        self._last_saved = monotonic()
@@ -0,0 +1,213 @@
+import os
+from collections import deque
+from multiprocessing import AuthenticationError, Pipe, Process
+from multiprocessing.connection import Client, Listener, wait
+from queue import Empty, SimpleQueue
+from threading import Thread
+from time import monotonic, sleep
+
+
+# Environment variable holding the key that coordinators and workers authenticate each other with
+AUTHKEY_VARIABLE = 'BLACKJACK_AUTHKEY'
+
+
+def parse_address(address):
+    """Parse a 'host:port' string into a (host, port) address."""
+    host, _, port = address.rpartition(':')
+    return host or '127.0.0.1', int(port)
+
+
+def get_authkey():
+    """Get the authentication key from the environment (see AUTHKEY_VARIABLE), or None if it isn't set."""
+    authkey = os.environ.get(AUTHKEY_VARIABLE)
+    return authkey.encode() if authkey else None
+
+
+def run_worker(address, authkey, connect_timeout=60.0):
+    """
+    Worker loop: connect to a Coordinator, and play the jobs it leases out until told to stop or disconnected.
+    Each lease carries the function to call with the job (e.g. `play_job`), and the result is sent back.
+    Connecting is retried for up to `connect_timeout` seconds, so workers can be started before the coordinator.
+    """
+    deadline = monotonic() + connect_timeout
+    while True:
+        try:
+            connection = Client(address, authkey=authkey)
+            break
+        except ConnectionRefusedError:
+            if monotonic() >= deadline:
+                raise
+            sleep(0.5)
+
+    with connection:
+        while True:
+            try:
+                lease = connection.recv()
+            except (EOFError, OSError):
+                return  # The coordinator went away
+            if lease is None:
+                return
+
+            # Errors are sent back to be raised by the coordinator, like a Pool's
+            key, function, job = lease
+            try:
+                reply = (key, function(job), None)
+            except Exception as err:
+                reply = (key, None, err)
+
+            try:
+                connection.send(reply)
+            except OSError:
+                return
+
+
+class Coordinator:
+    """
+    Hands out jobs to worker processes over TCP, as a stand-in for a multiprocessing Pool's `imap()`, so that games can be
+    played by workers on any number of hosts (see `run_worker()` and `worker.py`). Workers can come and go at any time.
+
+    Messages are pickled, and both ends authenticate with a shared key (see `get_authkey()`). Each job is leased to one
+    worker at a time, with up to `prefetch` leases per worker so workers aren't left idle waiting on the network. When a
+    worker disconnects, or one of its leases has been out for over `lease_timeout` seconds (e.g. its host went down),
+    the worker is dropped and its jobs are leased to others. Results are yielded in job order, exactly like `imap()`.
+    """
+
+    def __init__(self, address, authkey, prefetch=2, lease_timeout=600.0):
+        self.listener = Listener(address, authkey=authkey)
+        self.authkey = authkey
+        self.prefetch = prefetch
+        self.lease_timeout = lease_timeout
+
+        # Connected workers, with their leases ({(batch, job index): time the worker started on it, or was sent it})
+        self.workers = {}
+        self.lost_workers = 0
+        self.local_workers = []
+
+        # Each `imap()` call is a batch of jobs, so results of leases from an abandoned batch are recognized
+        self._batch = 0
+
+        # New connections are accepted in a thread, and handed over through a queue (with a pipe to wake up `wait()`)
+        self._new_connections = SimpleQueue()
+        self._wakeup_reader, self._wakeup_writer = Pipe(duplex=False)
+        Thread(target=self._accept_connections, daemon=True).start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def address(self):
+        """The (host, port) the coordinator is listening on."""
+        return self.listener.address
+
+    def _accept_connections(self):
+        """Accept connections from workers until the listener is closed."""
+        while True:
+            try:
+                connection = self.listener.accept()
+            except (AuthenticationError, EOFError, ConnectionError):
+                continue  # Not a worker (or it hung up mid-handshake)
+            except OSError:
+                return  # The listener was closed
+            self._new_connections.put(connection)
+            self._wakeup_writer.send(None)
+
+    def start_local_workers(self, num_workers):
+        """Start worker processes on this host (e.g. to use its cores too, or to test with)."""
+        host, port = self.address
+        address = ('127.0.0.1' if host in ('', '0.0.0.0') else host, port)
+        for _ in range(num_workers):
+            process = Process(target=run_worker, args=(address, self.authkey), daemon=True)
+            process.start()
+            self.local_workers.append(process)
+
+    def imap(self, function, jobs):
+        """Call `function` with each job on the workers, yielding the results in job order."""
+        self._batch += 1
+        jobs = list(jobs)
+        pending = deque(range(len(jobs)))  # Indexes of the jobs that aren't leased out
+        results = {}
+        next_index = 0
+
+        while next_index < len(jobs):
+            self._lease_jobs(function, jobs, pending)
+
+            for connection in wait([self._wakeup_reader, *self.workers], timeout=1.0):
+                if connection is self._wakeup_reader:
+                    self._add_workers()
+                    continue
+
+                try:
+                    (batch, job_index), result, error = connection.recv()
+                except (EOFError, OSError):
+                    self._drop_worker(connection, pending)
+                    continue
+
+                # The worker starts on its next lease now
+                leases = self.workers[connection]
+                del leases[batch, job_index]
+                for key in leases:
+                    leases[key] = monotonic()
+
+                if batch == self._batch:
+                    if error is not None:
+                        raise error
+                    results[job_index] = result
+
+            self._expire_leases(pending)
+
+            while next_index in results:
+                yield results.pop(next_index)
+                next_index += 1
+
+    def _add_workers(self):
+        """Add the newly accepted worker connections."""
+        self._wakeup_reader.recv()
+        try:
+            while True:
+                self.workers[self._new_connections.get_nowait()] = {}
+        except Empty:
+            pass
+
+    def _lease_jobs(self, function, jobs, pending):
+        """Lease pending jobs to workers with room for more."""
+        for connection, leases in list(self.workers.items()):
+            while pending and len(leases) < self.prefetch:
+                job_index = pending.popleft()
+                try:
+                    connection.send(((self._batch, job_index), function, jobs[job_index]))
+                except OSError:
+                    pending.appendleft(job_index)
+                    self._drop_worker(connection, pending)
+                    break
+                leases[self._batch, job_index] = monotonic()
+
+    def _drop_worker(self, connection, pending):
+        """Drop a lost worker, returning its leased jobs (of the current batch) to the front of the pending queue."""
+        leases = self.workers.pop(connection)
+        pending.extendleft(sorted((job_index for batch, job_index in leases if batch == self._batch), reverse=True))
+        self.lost_workers += 1
+        connection.close()
+
+    def _expire_leases(self, pending):
+        """Drop workers that have been holding a lease for longer than the lease timeout."""
+        now = monotonic()
+        for connection, leases in list(self.workers.items()):
+            if any(now - leased_at > self.lease_timeout for leased_at in leases.values()):
+                self._drop_worker(connection, pending)
+
+    def close(self):
+        """Tell the workers to stop, and stop accepting connections."""
+        for connection in self.workers:
+            try:
+                connection.send(None)
+                connection.close()
+            except OSError:
+                pass
+        self.workers = {}
+        self.listener.close()
+
+        for process in self.local_workers:
+            process.join(timeout=5)
@@ -0,0 +1,110 @@
+from math import ceil
+
+from blackjack.analytics.hand_log import HandRecorder
+from blackjack.controllers.vectorized_controller import VectorizedGameController
+from blackjack.game_setup import setup_game, setup_table
+from blackjack.models.shoe import Shoe
+from blackjack.simulation.seeding import game_rng, game_seed_sequence
+
+
+# Shoes built by this (worker) process, by number of decks and penetration. A worker plays one game at a time, so
+# each game resets and reuses a shoe rather than building a new one.
+_shoes = {}
+
+
+def cached_shoe(configuration):
+    """Get this process's reusable Shoe for a configuration, building it on first use."""
+    number_of_decks = configuration['shoe']['number_of_decks']
+    penetration = configuration['shoe']['penetration']
+    if (number_of_decks, penetration) not in _shoes:
+        _shoes[number_of_decks, penetration] = Shoe(number_of_decks, penetration=penetration)
+    return _shoes[number_of_decks, penetration]
+
+
+def make_jobs(engine, configuration, seed, num_games, chunk_size, hand_log=None, first_game=0):
+    """
+    Split a simulation into lightweight job descriptions for workers. Each job covers a range of game indexes
+    [start, stop) and carries only what's needed to build those games locally (not the games themselves).
+    Games are numbered from `first_game` on, so a simulation can be extended with more batches of games.
+    Every game gets its own RNG stream derived from the root seed and its index (see `blackjack.simulation.seeding`).
+    If a hand log directory is given, every played hand is recorded to files in it (object engine only).
+    """
+    return [
+        {
+            'engine': engine,
+            'configuration': configuration,
+            'seed': seed,
+            'hand_log': hand_log,
+            'start': start,
+            'stop': min(start + chunk_size, first_game + num_games)
+        }
+        for start in range(first_game, first_game + num_games, chunk_size)
+    ]
+
+
+def default_chunk_size(num_games, concurrency):
+    """Chunk size giving each worker a few jobs, so work stays balanced and progress stays visible."""
+    return max(1, ceil(num_games / (concurrency * 4)))
+
+
+def play_job(job, phase_timer=None):
+    """
+    Multiprocess worker function to build and play the games of a job, returning a compact summary of each game.
+    If a PhaseTimer is given, the phases of every game's turns are timed with it (object engine only, without seats).
+    """
+    configuration = job['configuration']
+    seed = job['seed']
+    game_indexes = range(job['start'], job['stop'])
+
+    # Play the whole chunk of games in lockstep
+    if job['engine'] == 'vectorized':
+        seed_sequences = [game_seed_sequence(seed, game_index) for game_index in game_indexes]
+        controller = VectorizedGameController(configuration, len(game_indexes), seed_sequences=seed_sequences)
+        controller.play()
+        return controller.summarize_metrics()
+
+    # Record every played hand to files named after the job (so they're unique per job) if applicable
+    hand_recorder = HandRecorder(job['hand_log'], f"{job['start']:09d}") if job['hand_log'] else None
+
+    # Play the games one at a time (as tables of several seats if configured, summarizing each seat as a game)
+    summaries = []
+    for game_index in game_indexes:
+        if configuration['table']['seats'] > 1:
+            table = setup_table(configuration, rng=game_rng(seed, game_index), shoe=cached_shoe(configuration))
+            table.play()
+            summaries.extend(table.summarize_metrics())
+            continue
+
+        if hand_recorder:
+            hand_recorder.start_game(game_index)
+        game = setup_game(configuration, rng=game_rng(seed, game_index), hand_recorder=hand_recorder, phase_timer=phase_timer,
+                          shoe=cached_shoe(configuration))
+        game.play()
+        summaries.append(game.metric_tracker.summarize_metrics())
+
+    if hand_recorder:
+        hand_recorder.flush()
+    return summaries
+
+
+def make_comparison_jobs(engine, configurations, seed, num_games, chunk_size, first_game=0):
+    """
+    Split a comparison of strategies into jobs (see `make_jobs()`), each carrying a configuration per strategy name.
+    Every strategy plays the same game indexes, and so the same shuffles (common random numbers).
+    """
+    return [
+        dict(job, configurations=configurations)
+        for job in make_jobs(engine, None, seed, num_games, chunk_size, first_game=first_game)
+    ]
+
+
+def compare_job(job):
+    """
+    Multiprocess worker function to play the games of a comparison job once per strategy, on identical shoes.
+    Return a dict of {strategy name: summary} per game.
+    """
+    summaries = {
+        name: play_job(dict(job, configuration=configuration))
+        for name, configuration in job['configurations'].items()
+    }
+    return [dict(zip(summaries, game_summaries)) for game_summaries in zip(*summaries.values())]
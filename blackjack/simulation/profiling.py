@@ -0,0 +1,70 @@
+import cProfile
+import pstats
+
+from blackjack.analytics.phase_timer import PhaseTimer
+from blackjack.simulation.jobs import play_job
+
+
+class RawStats:
+    """Picklable holder of a profiler's raw stats, in the form `pstats.Stats` loads them from (like a `cProfile.Profile`)."""
+
+    def __init__(self, stats):
+        self.stats = stats
+
+    def create_stats(self):
+        """Stats are already created (as `pstats.Stats` expects of a profiler)."""
+        pass
+
+
+def profile_job(job):
+    """
+    Multiprocess worker function to play a job (see `play_job()`) under cProfile, with the phases of each turn timed.
+    Return the game summaries, along with the raw profiler stats and the PhaseTimer for merging in the parent process.
+    """
+    phase_timer = PhaseTimer()
+    profiler = cProfile.Profile()
+    profiler.enable()
+    summaries = play_job(job, phase_timer=phase_timer)
+    profiler.disable()
+    profiler.create_stats()
+    return summaries, RawStats(profiler.stats), phase_timer
+
+
+class PoolProfile:
+    """
+    Merges the profiler stats and phase timings of jobs played across a pool of subprocesses.
+    It pickles (e.g. into a Checkpoint) with its merged stats as raw stats, as a `pstats.Stats` holds its output stream.
+    """
+
+    def __init__(self):
+        self.stats = None
+        self.phase_timer = PhaseTimer()
+
+    def __getstate__(self):
+        """Pickle the profile with the merged stats reduced to their raw stats."""
+        state = self.__dict__.copy()
+        if self.stats is not None:
+            state['stats'] = RawStats(self.stats.stats)
+        return state
+
+    def __setstate__(self, state):
+        """Restore a pickled profile, loading its raw stats back into a `pstats.Stats`."""
+        self.__dict__.update(state)
+        if self.stats is not None:
+            self.stats = pstats.Stats(self.stats)
+
+    def add_job(self, raw_stats, phase_timer):
+        """Merge in the profile of a job (as returned by `profile_job()`)."""
+        if self.stats is None:
+            self.stats = pstats.Stats(raw_stats)
+        else:
+            self.stats.add(raw_stats)
+        self.phase_timer.merge(phase_timer)
+
+    def print_summary(self, num_functions=25):
+        """Print the merged phase timings (if any phases were timed) and the most expensive functions across the pool."""
+        if self.phase_timer.total_calls():
+            self.phase_timer.print_summary()
+            print()
+        if self.stats is not None:
+            self.stats.strip_dirs().sort_stats('cumulative').print_stats(num_functions)
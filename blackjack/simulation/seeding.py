@@ -0,0 +1,23 @@
+import random
+
+import numpy as np
+
+
+def root_seed(seed=None):
+    """Get the root seed of a simulation: the given seed, or fresh OS entropy (so that any run can be reproduced)."""
+    return seed if seed is not None else np.random.SeedSequence().entropy
+
+
+def game_seed_sequence(seed, game_index):
+    """
+    Get the seed sequence of a game, equivalent to the `game_index`-th child spawned from the root seed's sequence
+    (i.e. `SeedSequence(seed).spawn(n)[game_index]`). Each game's stream only depends on the root seed and the
+    game's index, not on which process plays it or in which order.
+    """
+    return np.random.SeedSequence(seed, spawn_key=(game_index,))
+
+
+def game_rng(seed, game_index):
+    """Get a `random.Random` for a game (e.g. for its Shoe), seeded from the game's seed sequence."""
+    state = game_seed_sequence(seed, game_index).generate_state(4)  # 128 bits
+    return random.Random(int.from_bytes(state.tobytes(), 'little'))
@@ -1,8 +1,9 @@
+import csv
 import os
-
-from pandas import read_csv
+from functools import lru_cache
 
 from blackjack.strategies.base_strategy import BaseStrategy
+from blackjack.strategies.strategy_table import ACTIONS, DOUBLE, HIT, StrategyTable
 
 
 DIRECTORY = os.path.dirname(os.path.realpath(__file__))
@@ -16,36 +17,36 @@ class BaseStaticStrategy(BaseStrategy):
 
     def __init__(self, strategy_name):
         super().__init__()
-        self.split_df = self._load_df(strategy_name, 'split')
-        self.soft_df = self._load_df(strategy_name, 'soft')
-        self.hard_df = self._load_df(strategy_name, 'hard')
+        self.table = self.load_table(strategy_name)
 
     @staticmethod
-    def _load_df(strategy_name, csv_type):
-        """Load a DataFrame from a CSV for determining actions."""
+    def _load_rows(strategy_name, csv_type):
+        """Load the rows of a CSV for determining actions, as a dict of {row label: {dealer upcard label: decision}}."""
         csv_path = f"{DIRECTORY}/csv/{strategy_name}/{csv_type}.csv"
-        return read_csv(csv_path, index_col=0)
+        with open(csv_path, newline='') as csv_file:
+            reader = csv.reader(csv_file)
+            upcards = next(reader)[1:]  # Header row (the first column holds the row labels)
+            return {row[0]: dict(zip(upcards, row[1:])) for row in reader if row}
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def load_table(strategy_name):
+        """Load the CSVs for determining actions and compile them into a StrategyTable (once per strategy name)."""
+        split_rows, soft_rows, hard_rows = (
+            BaseStaticStrategy._load_rows(strategy_name, csv_type) for csv_type in ('split', 'soft', 'hard')
+        )
+        return StrategyTable(split_rows, soft_rows, hard_rows)
 
     def get_hand_action(self, hand, options, dealer_upcard):
         """Get the action to take on the hand ('Hit', 'Stand', etc.)"""
-        # Get the dealer value by which to look up the correct action
-        column = dealer_upcard.csv_format()
-
-        # If splitting is an option, check if that action should be taken first.
-        if 'Split' in options.values():
-            row = hand.cards[0].csv_format()
-            if self.split_df.at[row, column] == 'Yes':
-                return 'Split'
-
-        # Use the appropriate 'soft' or 'hard' hand DataFrame to decide which action should be taken.
-        row = hand.final_total()
-        if hand.is_soft():
-            action = self.soft_df.at[row, column]
-        else:
-            action = self.hard_df.at[row, column]
+        # If splitting is an option, the table checks whether that action should be taken first.
+        pair = hand.cards[0].hard_value if 'Split' in options.values() else 0
+
+        # Look up the action by the hand total, whether it's soft, the pair and the dealer's upcard.
+        code = self.table.action_code(hand.final_total(), hand.is_soft(), pair, dealer_upcard.hard_value)
 
         # Handle the edge case where doubling is the recommended action, but the user doesn't have enough money to do so.
-        if action == 'Double' and 'Double' not in options.values():
-            return 'Hit'
-        
-        return action
+        if code == DOUBLE and 'Double' not in options.values():
+            code = HIT
+
+        return ACTIONS[code]
@@ -4,6 +4,9 @@ from abc import ABC, abstractmethod
 class BaseStrategy(ABC):
     """Abstract base class that lays out the methods that must be implemented by all Strategies for in-game decisions."""
 
+    def attach(self, gambler, shoe):
+        """Hook for a strategy to keep a reference to the gambler and shoe of the game it's used in (does nothing by default)."""
+
     @abstractmethod
     def wants_to_change_wager(self):
         """Get a yes/no response (bool) for whether the gambler wants to change their auto-wager."""
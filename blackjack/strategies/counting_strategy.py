@@ -0,0 +1,64 @@
+from blackjack.models.card_counter import HI_LO, CardCounter
+from blackjack.strategies.default_static_strategy import DefaultStaticStrategy
+
+
+class CountingStrategy(DefaultStaticStrategy):
+    """
+    Same hand play as the optimal DefaultStaticStrategy, with wagers and insurance decided by counting cards.
+
+    A CardCounter with the class's rank WEIGHTS (Hi-Lo by default) is attached to the game's shoe, which keeps its
+    running count up to date as cards are dealt. Wagers follow BET_RAMP, a list of (minimum true count, number of betting
+    units) pairs where a betting unit is the gambler's initial auto-wager. Insurance (and even money) is taken from
+    INSURANCE_TRUE_COUNT up. Subclass and override the class attributes to count with other weights or ramps.
+    """
+
+    WEIGHTS = HI_LO
+    BET_RAMP = ((2, 2), (3, 4), (4, 6), (5, 8))
+    INSURANCE_TRUE_COUNT = 3
+
+    def __init__(self):
+        super().__init__()
+        self.counter = CardCounter(self.WEIGHTS)
+        self.gambler = None
+        self.shoe = None
+        self.betting_unit = None
+
+    def attach(self, gambler, shoe):
+        """Start counting the cards dealt from the game's shoe, betting in units of the gambler's initial auto-wager."""
+        self.gambler = gambler
+        self.shoe = shoe
+        self.betting_unit = gambler.auto_wager
+
+        # Seats at a table share their shoe's count (a shoe keeps a single count, so their weights must match)
+        if shoe.counter is None:
+            shoe.attach_counter(self.counter)
+        elif shoe.counter.weights == self.counter.weights:
+            self.counter = shoe.counter
+        else:
+            raise ValueError('A shoe can only be counted with one set of weights')
+
+    def wager(self):
+        """Get the wager for the true count, capped at the gambler's bankroll."""
+        true_count = self.shoe.true_count()
+        units = 1
+        for min_true_count, ramp_units in self.BET_RAMP:
+            if true_count >= min_true_count:
+                units = ramp_units
+        return min(units * self.betting_unit, self.gambler.bankroll)
+
+    def wants_to_change_wager(self):
+        """Get a yes/no response (bool) for whether the gambler wants to change their auto-wager."""
+        return self.wager() != self.gambler.auto_wager
+
+    def get_new_auto_wager(self):
+        """Get a new auto-wager amount (float)."""
+        return self.wager()
+
+    def wants_even_money(self):
+        """Get a yes/no response (bool) for whether a the gambler wants to take even money for a blackjack when facing an Ace."""
+        # Even money on a blackjack is equivalent to insuring it.
+        return self.wants_insurance()
+
+    def wants_insurance(self):
+        """Get a yes/no response (bool) for whether a user wants to make an insurance bet when facing an Ace."""
+        return self.shoe.true_count() >= self.INSURANCE_TRUE_COUNT
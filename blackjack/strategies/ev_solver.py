@@ -0,0 +1,166 @@
+"""
+Solver that computes the expected value (EV) of each action for every cell of the strategy CSVs, and writes the
+best actions as a strategy that any StaticStrategy can load.
+
+EVs are in units of the initial wager and follow the rules GameController implements (see RULES). They are
+composition-dependent to the extent of the cards known when a cell's decision is made: the dealer's upcard is
+removed from the shoe for every cell, and both paired cards are removed for split decisions. Cards drawn to a
+hand are not tracked (the usual "total-dependent" approximation), and split hands are not resplit.
+"""
+import csv
+import hashlib
+import os
+
+from blackjack.analytics.dealer_outcomes import BUST, OUTCOMES, dealer_outcome_probabilities, remove_cards, shoe_composition
+from blackjack.strategies.base_static_strategy import DIRECTORY
+
+
+# Rules implemented by GameController that the solution depends on
+RULES = {
+    'blackjack_payout': 1.5,
+    'dealer_hits_soft_17': True,
+    'dealer_peeks_ace_and_ten': True,
+    'double_any_two_cards': True,
+    'double_after_split': True,
+    'split_aces_one_card': True,
+    'split_twenty_one_is_blackjack': True
+}
+
+# Strategy CSV labels for card values 1 (Ace) through 10
+LABELS = {value: 'A' if value == 1 else str(value) for value in range(1, 11)}
+UPCARD_ORDER = list(range(2, 11)) + [1]  # CSV column order: 2-10, then Ace
+PAIR_ORDER = [1] + list(range(10, 1, -1))  # Split CSV row order: Ace, then 10-2
+
+
+class HandSolver:
+    """EVs of standing, hitting and doubling hands against a dealer upcard, drawing from a fixed composition."""
+
+    def __init__(self, composition, dealer_probabilities):
+        remaining = sum(composition)
+        self.draws = [(index + 1, count / remaining) for index, count in enumerate(composition) if count]
+        self.dealer_probabilities = dealer_probabilities
+        self._hit_evs = {}
+
+    @staticmethod
+    def total(hard_total, has_ace):
+        """Get the final total of a hand (same as `Hand.final_total()`)."""
+        return hard_total + 10 if has_ace and hard_total + 10 <= 21 else hard_total
+
+    def stand(self, hard_total, has_ace):
+        """EV of standing (a busted hand loses)."""
+        total = self.total(hard_total, has_ace)
+        if total > 21:
+            return -1.0
+
+        # The gambler wins if the dealer busts or finishes lower, pushes if equal, and loses otherwise.
+        ev = self.dealer_probabilities[BUST]
+        for outcome, probability in zip(OUTCOMES, self.dealer_probabilities):
+            if outcome.isdigit():
+                dealer_total = int(outcome)
+                if total > dealer_total:
+                    ev += probability
+                elif total < dealer_total:
+                    ev -= probability
+        return ev
+
+    def hit(self, hard_total, has_ace):
+        """EV of hitting, then playing on optimally (standing or hitting)."""
+        key = (hard_total, has_ace)
+        if key not in self._hit_evs:
+            ev = 0.0
+            for value, probability in self.draws:
+                next_total, next_has_ace = hard_total + value, has_ace or value == 1
+                if next_total > 21:
+                    ev -= probability
+                else:
+                    ev += probability * max(self.stand(next_total, next_has_ace), self.hit(next_total, next_has_ace))
+            self._hit_evs[key] = ev
+        return self._hit_evs[key]
+
+    def double(self, hard_total, has_ace):
+        """EV of doubling the wager and taking exactly one more card."""
+        return 2 * sum(probability * self.stand(hard_total + value, has_ace or value == 1) for value, probability in self.draws)
+
+    def action_evs(self, hard_total, has_ace):
+        """EVs of the actions available on a two-card hand."""
+        return {
+            'Hit': self.hit(hard_total, has_ace),
+            'Stand': self.stand(hard_total, has_ace),
+            'Double': self.double(hard_total, has_ace)
+        }
+
+    def split(self, pair_value):
+        """EV of splitting a pair (two hands, each dealt one more card, played without resplitting)."""
+        ev = 0.0
+        for value, probability in self.draws:
+            # A split hand making 21 with two cards is a blackjack (an automatic 3:2 win, as the dealer has been checked).
+            if {pair_value, value} == {1, 10}:
+                ev += probability * RULES['blackjack_payout']
+            # Split Aces only get 1 more card.
+            elif pair_value == 1:
+                ev += probability * self.stand(1 + value, True)
+            else:
+                ev += probability * max(self.action_evs(pair_value + value, value == 1).values())
+        return 2 * ev
+
+
+def solve(number_of_decks):
+    """
+    Solve the strategy for a number of decks.
+    Return the rows of the split, soft and hard CSVs, each as a dict of {row label: {upcard label: decision}}.
+    """
+    split_rows, soft_rows, hard_rows = {}, {}, {}
+    full_shoe = shoe_composition(number_of_decks)
+
+    for upcard in UPCARD_ORDER:
+        # Gambler decisions are only made once the dealer is known not to have blackjack.
+        composition = remove_cards(full_shoe, upcard)
+        solver = HandSolver(composition, dealer_outcome_probabilities(upcard, composition, peeked=True))
+
+        # Hard totals, then soft totals (an Ace counted as 11), taking the action with the highest EV.
+        for total in range(21, 3, -1):
+            evs = solver.action_evs(total, False)
+            hard_rows.setdefault(total, {})[LABELS[upcard]] = max(evs, key=evs.get)
+        for total in range(21, 11, -1):
+            evs = solver.action_evs(total - 10, True)
+            soft_rows.setdefault(total, {})[LABELS[upcard]] = max(evs, key=evs.get)
+
+        # Pairs: split if it beats the best alternative, with both paired cards removed from the shoe.
+        for pair in PAIR_ORDER:
+            pair_composition = remove_cards(composition, pair, pair)
+            pair_solver = HandSolver(pair_composition, dealer_outcome_probabilities(upcard, pair_composition, peeked=True))
+            best_ev = max(pair_solver.action_evs(2 * pair, pair == 1).values())
+            decision = 'Yes' if pair_solver.split(pair) > best_ev else 'No'
+            split_rows.setdefault(LABELS[pair], {})[LABELS[upcard]] = decision
+
+    return split_rows, soft_rows, hard_rows
+
+
+def strategy_name(number_of_decks):
+    """Get the name (CSV directory) of a solved strategy, keyed by the rule set and number of decks."""
+    rules_key = hashlib.sha1(repr(sorted(RULES.items())).encode()).hexdigest()[:8]
+    return f"solved-{number_of_decks}-decks-{rules_key}"
+
+
+def solve_strategy(number_of_decks):
+    """
+    Solve the strategy for a number of decks and write its CSVs (in the format `BaseStaticStrategy` loads), unless
+    they've already been solved for these rules. Return the strategy name to load them with.
+    """
+    name = strategy_name(number_of_decks)
+    directory = f"{DIRECTORY}/csv/{name}"
+    csv_types = ('split', 'soft', 'hard')
+
+    # Solutions are cached on disk
+    if all(os.path.exists(f"{directory}/{csv_type}.csv") for csv_type in csv_types):
+        return name
+
+    os.makedirs(directory, exist_ok=True)
+    for csv_type, rows in zip(csv_types, solve(number_of_decks)):
+        with open(f"{directory}/{csv_type}.csv", 'w', newline='') as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow([''] + [LABELS[upcard] for upcard in UPCARD_ORDER])
+            for row, decisions in rows.items():
+                writer.writerow([row] + [decisions[LABELS[upcard]] for upcard in UPCARD_ORDER])
+
+    return name
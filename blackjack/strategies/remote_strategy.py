@@ -0,0 +1,71 @@
+from functools import partial
+
+from blackjack.exc import SessionError
+from blackjack.strategies.base_strategy import BaseStrategy
+from blackjack.user_input import INVALID_RESPONSE, choice_response, positive_float_response, yes_no_response
+
+
+class RemoteStrategy(BaseStrategy):
+    """
+    Strategy that makes decisions via a remote client's responses to prompts, sent over a Connection.
+
+    This is the asynchronous counterpart of UserInputStrategy, for the AsyncGameController: every decision method is a
+    coroutine. Prompts are messages like `{"type": "prompt", "prompt": "insurance", ...}`, and the client answers with
+    `{"response": "y"}`, where responses are what a user would type at the command line prompt.
+    """
+
+    def __init__(self, connection, retries=3):
+        self.connection = connection
+        self.retries = retries
+        self.gambler = None
+
+    def attach(self, gambler, shoe):
+        """Keep a reference to the gambler, to show the client their bankroll and hands in prompts."""
+        self.gambler = gambler
+
+    async def get_response(self, prompt, parsing_func, **details):
+        """Prompt the client for a response and ensure it's valid (the remote version of `get_user_input()`)."""
+        message = {'type': 'prompt', 'prompt': prompt, **details}
+
+        for attempt in range(self.retries):
+            if attempt > 0:
+                message['error'] = 'Invalid response. Please try again.'
+            await self.connection.send(message)
+
+            reply = await self.connection.receive()
+            response = reply.get('response') if isinstance(reply, dict) else None
+            if response is not None:
+                response = parsing_func(str(response))
+                if response != INVALID_RESPONSE:
+                    return response
+
+        raise SessionError('Maximum retries reached')
+
+    async def wants_to_change_wager(self):
+        """Get a yes/no response (bool) for whether the gambler wants to change their auto-wager."""
+        return await self.get_response(
+            'change_wager', yes_no_response, bankroll=self.gambler.bankroll, auto_wager=self.gambler.auto_wager
+        )
+
+    async def get_new_auto_wager(self):
+        """Get a new auto-wager amount (float). Amounts that aren't finite and positive (e.g. -5, 0, nan or inf) are re-prompted."""
+        return await self.get_response('auto_wager', positive_float_response, bankroll=self.gambler.bankroll)
+
+    async def get_hand_action(self, hand, options, dealer_upcard):
+        """Get the action to take on the hand ('Hit', 'Stand', etc.), offering the client the options' abbreviations."""
+        response = await self.get_response(
+            'action',
+            partial(choice_response, choices=options.keys()),
+            hand=hand.serialize(),
+            dealer_upcard=str(dealer_upcard),
+            options=options
+        )
+        return options[response]
+
+    async def wants_even_money(self):
+        """Get a yes/no response (bool) for whether the gambler wants to take even money for a blackjack when facing an Ace."""
+        return await self.get_response('even_money', yes_no_response, hand=self.gambler.first_hand().serialize())
+
+    async def wants_insurance(self):
+        """Get a yes/no response (bool) for whether the gambler wants to make an insurance bet when facing an Ace."""
+        return await self.get_response('insurance', yes_no_response, hand=self.gambler.first_hand().serialize())
@@ -0,0 +1,73 @@
+from array import array
+
+
+# Hand actions as integer codes (indexes into ACTIONS)
+HIT, STAND, DOUBLE, SPLIT = range(4)
+ACTIONS = ('Hit', 'Stand', 'Double', 'Split')
+
+# Table dimensions: pair card value (0 when splitting is not an option), soft flag, hand total, dealer upcard value.
+# Card values count Aces as 1, so index 0 of the value dimensions is unused except to mean "no pair".
+SHAPE = (11, 2, 22, 11)
+
+
+def card_value(label):
+    """Get the card value (Aces counted as 1) of a Strategy CSV row or column label."""
+    return 1 if str(label) == 'A' else int(label)
+
+
+class StrategyTable:
+    """
+    Strategy CSVs (split, soft and hard) compiled into a dense table of action codes, so that a decision
+    is a single O(1) lookup keyed by (hand total, soft flag, pair value, dealer upcard value).
+
+    The codes are stored in a flat, row-major array of signed chars of dimensions SHAPE, which other engines
+    can wrap without copying (e.g. `numpy.frombuffer(table.codes, dtype=numpy.int8).reshape(SHAPE)`).
+    Missing cells (e.g. hard totals below 4) are -1.
+    """
+
+    def __init__(self, split_rows, soft_rows, hard_rows):
+        """
+        Each argument maps a CSV row label to a dict of {dealer upcard label: decision}, i.e. the CSV as read
+        into a dict of rows (see `BaseStaticStrategy._load_rows()`).
+        """
+        num_pairs, num_soft, num_totals, num_upcards = SHAPE
+        self.codes = array('b', [-1]) * (num_pairs * num_soft * num_totals * num_upcards)
+
+        # Actions by hand total, without splitting.
+        for soft, rows in ((0, hard_rows), (1, soft_rows)):
+            for total, decisions in rows.items():
+                for upcard, decision in decisions.items():
+                    self.codes[self.index(int(total), soft, 0, card_value(upcard))] = ACTIONS.index(decision)
+
+        # Actions for pairs that can be split: split if the split CSV says so, otherwise act on the hand total.
+        for pair, decisions in split_rows.items():
+            for upcard, decision in decisions.items():
+                for soft in range(num_soft):
+                    for total in range(num_totals):
+                        fallback = self.codes[self.index(total, soft, 0, card_value(upcard))]
+                        code = SPLIT if decision == 'Yes' else fallback
+                        self.codes[self.index(total, soft, card_value(pair), card_value(upcard))] = code
+
+    @staticmethod
+    def index(total, soft, pair, upcard):
+        """Get the position of a table cell in the flat array of action codes."""
+        _, num_soft, num_totals, num_upcards = SHAPE
+        return ((pair * num_soft + soft) * num_totals + total) * num_upcards + upcard
+
+    def action_code(self, total, soft, pair, upcard):
+        """
+        Get the action code for a hand.
+
+        total - Final hand total
+        soft - Whether the hand is soft (bool or 0/1)
+        pair - Value of the paired cards if splitting is an option, otherwise 0
+        upcard - Value of the dealer's upcard (Aces counted as 1)
+        """
+        code = self.codes[self.index(total, soft, pair, upcard)]
+        if code < 0:
+            raise KeyError(f"No action for total {total} (soft: {bool(soft)}, pair: {pair}) against upcard {upcard}")
+        return code
+
+    def action(self, total, soft, pair, upcard):
+        """Get the action ('Hit', 'Stand', etc.) for a hand. See `action_code()`."""
+        return ACTIONS[self.action_code(total, soft, pair, upcard)]
@@ -1,3 +1,6 @@
+from math import isfinite
+
+
 INVALID_RESPONSE = 'invalid'
 
 
@@ -22,6 +25,14 @@ def float_response(response):
         return INVALID_RESPONSE
 
 
+def positive_float_response(response):
+    """Check whether a user's keyboard input is a valid float that's finite and positive, and cast it as such."""
+    response = float_response(response)
+    if response == INVALID_RESPONSE or not (isfinite(response) and response > 0):
+        return INVALID_RESPONSE
+    return response
+
+
 def int_response(response):
     """Check whether a user's keyboard input is a valid integer, and cast it as such."""
     try:
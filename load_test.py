@@ -0,0 +1,68 @@
+"""Script for playing many concurrent scripted clients against a game server, and reporting the per-action latency."""
+
+import asyncio
+from argparse import ArgumentParser
+from time import perf_counter
+
+from blackjack.analytics.streaming_stats import QuantileSketch, RunningStats
+from blackjack.configuration import get_server_configuration
+from blackjack.server.game_server import GameServer, raise_open_file_limit
+from blackjack.server.scripted_client import play_scripted_game
+
+
+async def run_clients(args):
+    """Play every client's game concurrently (against a local server on the same event loop, with `--local`)."""
+    if args.local:
+        configuration = get_server_configuration(args.bankroll, args.auto_wager, args.decks, max_turns=args.turns)
+        server = GameServer(configuration)
+        local_server = await asyncio.start_server(server.handle_connection, args.host, args.port, backlog=args.clients)
+
+    latency_stats = RunningStats()
+    latency_sketch = QuantileSketch()
+
+    def on_latency(seconds):
+        latency_stats.add(seconds)
+        latency_sketch.add(seconds)
+
+    start = perf_counter()
+    results = await asyncio.gather(
+        *(play_scripted_game(args.host, args.port, think=args.think, on_latency=on_latency) for _ in range(args.clients)),
+        return_exceptions=True
+    )
+    elapsed = perf_counter() - start
+
+    if args.local:
+        local_server.close()
+        await local_server.wait_closed()
+
+    return results, elapsed, latency_stats, latency_sketch
+
+
+if __name__ == '__main__':
+
+    # Command line args
+    parser = ArgumentParser()
+    parser.add_argument('-a', '--auto-wager', help='Initial Gambler auto-wager (with --local)', type=float, default=100.0)
+    parser.add_argument('-b', '--bankroll', help='Initial Gambler bankroll (with --local)', type=float, default=1000.0)
+    parser.add_argument('-c', '--clients', help='Number of clients to play concurrently', type=int, default=1000)
+    parser.add_argument('-d', '--decks', help='Number of decks to play with (with --local)', type=int, default=3)
+    parser.add_argument('-H', '--host', help='Address of the server', default='127.0.0.1')
+    parser.add_argument('-l', '--local', help='Host the games in this process, rather than connecting to a running serve.py', action='store_true')
+    parser.add_argument('-p', '--port', help='Port of the server', type=int, default=8765)
+    parser.add_argument('-k', '--think', help='Average seconds each client takes to respond to a prompt', type=float, default=0.0)
+    parser.add_argument('-t', '--turns', help='Max number of turns to play per game (with --local)', type=int, default=100)
+    args = parser.parse_args()
+
+    raise_open_file_limit()
+    results, elapsed, latency_stats, latency_sketch = asyncio.run(run_clients(args))
+
+    # Report the completed games and the latency of each action
+    errors = [result for result in results if isinstance(result, BaseException)]
+    turns = sum(result['turns'] for result in results if not isinstance(result, BaseException))
+    print(f"Games: {len(results) - len(errors)} completed, {len(errors)} failed ({turns} turns in {elapsed:.2f}s)")
+    if errors:
+        print(f"First failure: {errors[0]!r}")
+    if latency_stats.count:
+        percentiles = '  '.join(f"p{q * 100:g}: {latency_sketch.quantile(q) * 1000:.2f}ms" for q in (0.5, 0.9, 0.99))
+        print(f"Actions: {latency_stats.count} ({latency_stats.count / elapsed:,.0f}/s)")
+        print(f"Latency: mean: {latency_stats.mean * 1000:.2f}ms  {percentiles}  max: {latency_stats.maximum * 1000:.2f}ms")
@@ -13,13 +13,16 @@ if __name__ == '__main__':
     # Command line args
     parser = ArgumentParser()
     parser.add_argument('-d', '--default', help='Use the default game setup instead of manually configuring', action='store_true')
+    parser.add_argument('-n', '--penetration', help='Fraction of the shoe dealt before reshuffling between turns', type=float, default=1.0)
     args = parser.parse_args()
+    if not 0 < args.penetration <= 1:
+        parser.error('--penetration must be greater than 0 and at most 1')
 
     # Clear the terminal screen.
     clear()
 
     # Load the game configuration (in this case, the 'interactive' configuration).
-    configuration = get_interactive_configuration(args.default)
+    configuration = get_interactive_configuration(args.default, penetration=args.penetration)
 
     # Set up the game using the loaded configuration.
     game = setup_game(configuration)
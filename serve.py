@@ -0,0 +1,41 @@
+"""Script for hosting interactive Blackjack games for remote clients, many at once on one event loop."""
+
+import asyncio
+from argparse import ArgumentParser
+
+from blackjack.configuration import get_server_configuration
+from blackjack.display_utils import header
+from blackjack.server.game_server import GameServer, raise_open_file_limit
+
+
+if __name__ == '__main__':
+
+    # Command line args
+    parser = ArgumentParser()
+    parser.add_argument('-a', '--auto-wager', help='Initial Gambler auto-wager', type=float, default=100.0)
+    parser.add_argument('-b', '--bankroll', help='Initial Gambler bankroll', type=float, default=1000.0)
+    parser.add_argument('-d', '--decks', help='Number of decks to play with', type=int, default=3)
+    parser.add_argument('-H', '--host', help='Address to listen on', default='127.0.0.1')
+    parser.add_argument('-n', '--penetration', help='Fraction of the shoe dealt before reshuffling between turns', type=float, default=0.75)
+    parser.add_argument('-p', '--port', help='Port to listen on', type=int, default=8765)
+    parser.add_argument('-t', '--turns', help='Max number of turns to play per game (default: no limit)', type=int)
+    parser.add_argument('-w', '--pace', help='Seconds to pause before each of the dealer\'s plays', type=float, default=0.0)
+    args = parser.parse_args()
+    if not 0 < args.penetration <= 1:
+        parser.error('--penetration must be greater than 0 and at most 1')
+
+    # Every client plays its own game with the same configuration.
+    configuration = get_server_configuration(args.bankroll, args.auto_wager, args.decks, max_turns=args.turns, penetration=args.penetration)
+    server = GameServer(configuration, pace=args.pace)
+
+    raise_open_file_limit()
+    print(f"Serving games on {args.host}:{args.port} (Ctrl+C to stop)...")
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+    # Analyze the results of the completed games.
+    if server.analyzer.initial_bankroll is not None:
+        print(header('ANALYTICS'))
+        server.analyzer.print_summary()
@@ -1,28 +1,153 @@
 """Script for analyzing how a strategy performs in repeated simulations of a set number of turns."""
 
 import multiprocessing as mp
+import secrets
 from argparse import ArgumentParser
 
 from tqdm import tqdm
 
 from blackjack.analytics.multi_game_analyzer import MultiGameAnalyzer
-from blackjack.configuration import get_simulation_configuration
+from blackjack.analytics.paired_comparison import PairedComparison
+from blackjack.analytics.trajectory_analyzer import TrajectoryAnalyzer
+from blackjack.configuration import STRATEGY_MAP, get_simulation_configuration
 from blackjack.display_utils import clear, header
-from blackjack.game_setup import setup_game
-from blackjack.strategies.default_static_strategy import DefaultStaticStrategy
-from blackjack.strategies.insurance_static_strategy import InsuranceStaticStrategy
+from blackjack.simulation.checkpoint import Checkpoint
+from blackjack.simulation.coordinator import AUTHKEY_VARIABLE, Coordinator, get_authkey, parse_address
+from blackjack.simulation.jobs import compare_job, default_chunk_size, make_comparison_jobs, make_jobs, play_job
+from blackjack.simulation.profiling import PoolProfile, profile_job
+from blackjack.simulation.seeding import root_seed
 
 
-STRATEGY_MAP = {
-    'default': DefaultStaticStrategy,
-    'insurance': InsuranceStaticStrategy
-}
+# Arguments that determine a run's results, which a checkpointed run can only be resumed with the same values of
+RUN_PARAMETERS = (
+    'auto_wager', 'bankroll', 'bankroll_stride', 'compare', 'decks', 'engine', 'games', 'max_games', 'penetration', 'precision', 'seats',
+    'strategy', 'turns'
+)
 
 
-def worker(game):
-    """Multiprocess worker function to run a configured game to completion and return its tracked metrics."""
-    game.play()
-    return game.metric_tracker
+def get_configuration(args, strategy):
+    """Load the game configuration (in this case, the 'simulation' configuration) for a strategy."""
+    return get_simulation_configuration(args.bankroll, args.auto_wager, args.decks, strategy, args.turns, penetration=args.penetration,
+                                        seats=args.seats, bankroll_stride=args.bankroll_stride)
+
+
+def make_pool(args):
+    """
+    Get the pool to play jobs with: local subprocesses or, with a coordinator address, a Coordinator that leases jobs out
+    to workers on any host (see `worker.py`), as well as to `--concurrency` local worker processes.
+    """
+    if not args.coordinator:
+        return mp.Pool(args.concurrency)
+
+    # Remote workers need the coordinator's key, so a random one is made (and shown) if none is set
+    authkey = get_authkey()
+    if authkey is None:
+        authkey = secrets.token_hex(16).encode()
+        print(f"Workers can join with: {AUTHKEY_VARIABLE}={authkey.decode()} python worker.py {args.coordinator}\n")
+
+    coordinator = Coordinator(parse_address(args.coordinator), authkey)
+    coordinator.start_local_workers(args.concurrency)
+    return coordinator
+
+
+def simulation_finished(args, analyzer, num_played):
+    """Check whether a simulation has played all its games (with a target precision: batches of games until it's reached)."""
+    if args.precision is None:
+        return num_played >= args.games
+    if args.max_games and num_played >= args.max_games:
+        return True
+
+    # The precision is checked at the end of each batch
+    return num_played > 0 and num_played % args.games == 0 and analyzer.house_edge_stats.confidence_half_width() * 100.0 <= args.precision
+
+
+def run_simulation(args, seed, chunk_size, checkpoint=None, state=None):
+    """
+    Simulate games with the requested strategy, then print analytics and create plots.
+    With a Checkpoint, progress is saved periodically, and the run carries on from the saved state if one is given.
+    """
+    configuration = get_configuration(args, STRATEGY_MAP[args.strategy])
+
+    # Multiprocess game execution, aggregating summaries of each simulated game as they arrive (with a progress bar!)
+    # With a target precision, batches of games are played until the house edge confidence interval is tight enough.
+    print(f"Running Game Simulations (seed: {seed})...\n")
+    # Bankroll progressions are only kept (in memory growing with the number of games) for the risk analytics
+    analyzer = state['analyzer'] if state else MultiGameAnalyzer(keep_progressions=args.bankroll_stride > 0)
+    pool_profile = (state and state.get('pool_profile') or PoolProfile()) if args.profile else None
+    num_played = state['num_played'] if state else 0
+    with make_pool(args) as pool, tqdm(total=args.max_games if args.precision else args.games, initial=num_played) as progress_bar:
+        while not simulation_finished(args, analyzer, num_played):
+
+            # Play the rest of the current batch (all of it, unless resuming part way through)
+            batch_end = (num_played // args.games + 1) * args.games
+            if args.max_games:
+                batch_end = min(batch_end, args.max_games)
+            jobs = make_jobs(args.engine, configuration, seed, batch_end - num_played, chunk_size, hand_log=args.hand_log,
+                             first_game=num_played)
+
+            for result in pool.imap(profile_job if args.profile else play_job, jobs):
+                summaries = result
+                if args.profile:
+                    summaries, raw_stats, phase_timer = result
+                    pool_profile.add_job(raw_stats, phase_timer)
+                analyzer.add_games(summaries)
+                num_played += len(summaries) // args.seats  # Each seat is summarized as a game
+                progress_bar.update(len(summaries) // args.seats)
+                if checkpoint is not None:
+                    checkpoint.save({'seed': seed, 'num_played': num_played, 'analyzer': analyzer, 'pool_profile': pool_profile})
+
+            if args.precision is not None:
+                progress_bar.set_postfix_str(f"house edge 95% CI ±{analyzer.house_edge_stats.confidence_half_width() * 100.0:.3f}%")
+
+    if checkpoint is not None:
+        checkpoint.save({'seed': seed, 'num_played': num_played, 'analyzer': analyzer, 'pool_profile': pool_profile}, force=True)
+
+    if args.precision is not None:
+        half_width = analyzer.house_edge_stats.confidence_half_width() * 100.0
+        reached = 'Reached' if half_width <= args.precision else 'Did not reach'
+        print(f"\n{reached} the target house edge 95% CI of ±{args.precision}% after {num_played} games (±{half_width:.3f}%).")
+
+    # Analyze the results of the games
+    print(header('ANALYTICS'))
+    analyzer.print_summary()
+    trajectory_analyzer = None
+    if analyzer.num_progressions:
+        print(header('RISK'))
+        trajectory_analyzer = TrajectoryAnalyzer.from_analyzer(analyzer)
+        trajectory_analyzer.print_summary()
+    if args.profile:
+        print(header('PROFILE'))
+        pool_profile.print_summary()
+    if trajectory_analyzer is not None:
+        trajectory_analyzer.create_plots(show=False)  # Shown along with the analyzer's plots
+    analyzer.create_plots()
+
+
+def run_comparison(args, seed, chunk_size, strategy_names, checkpoint=None, state=None):
+    """
+    Simulate the same games (identical shoes) with each strategy, then print their paired comparison.
+    Progress is checkpointed and resumed as with `run_simulation()`.
+    """
+    configurations = {name: get_configuration(args, STRATEGY_MAP[name]) for name in strategy_names}
+    comparison = state['comparison'] if state else PairedComparison(strategy_names)
+    num_played = state['num_played'] if state else 0
+    jobs = make_comparison_jobs(args.engine, configurations, seed, args.games - num_played, chunk_size, first_game=num_played)
+
+    # Multiprocess game execution, aggregating the summaries of each game (played by every strategy) as they arrive
+    print(f"Running Game Simulations (seed: {seed})...\n")
+    with make_pool(args) as pool, tqdm(total=args.games, initial=num_played) as progress_bar:
+        for game_summaries in pool.imap(compare_job, jobs):
+            comparison.add_games(game_summaries)
+            num_played += len(game_summaries) // args.seats
+            progress_bar.update(len(game_summaries) // args.seats)
+            if checkpoint is not None:
+                checkpoint.save({'seed': seed, 'num_played': num_played, 'comparison': comparison})
+
+    if checkpoint is not None:
+        checkpoint.save({'seed': seed, 'num_played': num_played, 'comparison': comparison}, force=True)
+
+    print(header('COMPARISON'))
+    comparison.print_summary()
 
 
 if __name__ == '__main__':
@@ -33,27 +158,75 @@ if __name__ == '__main__':
     parser.add_argument('-b', '--bankroll', help='Initial Gambler bankroll', type=float, default=1000.0)
     parser.add_argument('-c', '--concurrency', help='Number of game subprocesses to run simultaneously', type=int, default=4)
     parser.add_argument('-d', '--decks', help='Number of decks to play with', type=int, default=3)
-    parser.add_argument('-g', '--games', help='Number of games to simulate', type=int, default=100)
+    parser.add_argument('-e', '--engine', help='Game engine to simulate with', default='object', choices=['object', 'vectorized'])
+    parser.add_argument('-f', '--checkpoint', help='File to periodically save the run\'s progress to (see --resume)')
+    parser.add_argument('-g', '--games', help='Number of games to simulate (per batch, with a target precision)', type=int, default=100)
+    parser.add_argument('-i', '--checkpoint-interval', help='Minimum number of seconds between checkpoint saves', type=float, default=60.0)
+    parser.add_argument('-j', '--bankroll-stride', help='Number of turns between each game\'s tracked bankrolls, to plot (default: 0, none)', type=int, default=0)
+    parser.add_argument('-k', '--chunk-size', help='Number of games per subprocess job (default: a few jobs per subprocess)', type=int)
+    parser.add_argument('-l', '--hand-log', help='Directory to record every played hand to (object engine only)')
+    parser.add_argument('-m', '--max-games', help='Max number of games to simulate with a target precision (default: no limit)', type=int)
+    parser.add_argument('-n', '--penetration', help='Fraction of the shoe dealt before reshuffling between turns', type=float, default=1.0)
+    parser.add_argument('-p', '--profile', help='Profile the subprocesses (with per-phase timings) and print a merged report', action='store_true')
+    parser.add_argument('-q', '--precision', help='Target house edge 95%% CI half-width (in %%) to play batches of games until', type=float)
+    parser.add_argument('-r', '--seed', help='Root random seed, for reproducible results (default: random)', type=int)
     parser.add_argument('-s', '--strategy', help='Name of the gameplay strategy to use', default='default', choices=STRATEGY_MAP.keys())
     parser.add_argument('-t', '--turns', help='Max number of turns to play per game', type=int, default=100)
+    parser.add_argument('-u', '--seats', help='Number of gamblers (seats) at each game\'s table, sharing the dealer and shoe', type=int, default=1)
+    parser.add_argument('-w', '--coordinator', help='Address (host:port) to coordinate worker.py processes on any host from, rather than only local subprocesses')
+    parser.add_argument('-x', '--compare', help='Compare strategies on identical shoes (default: all strategies)', nargs='*', choices=STRATEGY_MAP.keys())
+    parser.add_argument('-z', '--resume', help='Resume the run saved to the --checkpoint file, skipping its completed games', action='store_true')
     args = parser.parse_args()
+    if args.hand_log and args.engine != 'object':
+        parser.error('--hand-log is only supported by the object engine')
+    if args.precision is not None and args.precision <= 0:
+        parser.error('--precision must be greater than 0')
+    if args.max_games and args.precision is None:
+        parser.error('--max-games requires --precision')
+    if not 0 < args.penetration <= 1:
+        parser.error('--penetration must be greater than 0 and at most 1')
+    if args.bankroll_stride < 0:
+        parser.error('--bankroll-stride must be at least 0')
+    strategy_names = (args.compare or list(STRATEGY_MAP)) if args.compare is not None else [args.strategy]
+    if args.engine == 'vectorized' and 'counting' in strategy_names:
+        parser.error('The counting strategy is only supported by the object engine')
+    if args.seats < 1:
+        parser.error('--seats must be at least 1')
+    if args.seats > 1 and (args.engine != 'object' or args.hand_log or args.profile):
+        parser.error('--seats is only supported by the object engine, without --hand-log or --profile')
+    if args.compare is not None and (args.hand_log or args.precision is not None or args.profile):
+        parser.error('--compare does not support --hand-log, --precision or --profile')
+
+    if args.concurrency < 0 or (args.concurrency == 0 and not args.coordinator):
+        parser.error('--concurrency must be at least 1 (or 0 with --coordinator, for remote workers only)')
+    if args.resume and not args.checkpoint:
+        parser.error('--resume requires --checkpoint')
+
+    # Load the progress of the run to resume if applicable (a fresh run won't overwrite an existing checkpoint)
+    checkpoint = None
+    state = None
+    if args.checkpoint:
+        checkpoint = Checkpoint(args.checkpoint, {name: getattr(args, name) for name in RUN_PARAMETERS}, interval=args.checkpoint_interval)
+        if args.resume:
+            try:
+                state = checkpoint.load()
+            except (OSError, ValueError) as err:
+                parser.error(f"Cannot resume from {args.checkpoint}: {err}")
+            if args.seed is not None and args.seed != state['seed']:
+                parser.error(f"--seed does not match the checkpoint's seed ({state['seed']})")
+        elif checkpoint.exists():
+            parser.error(f"{args.checkpoint} already exists (pass --resume to resume its run)")
 
     # Clear the terminal screen.
     clear()
 
-    # Get the requested gameplay strategy
-    strategy = STRATEGY_MAP[args.strategy]
-
-    # Load the game configuration (in this case, the 'simulation' configuration).
-    configuration = get_simulation_configuration(args.bankroll, args.auto_wager, args.decks, strategy, args.turns)
+    # Split the games into jobs that subprocesses build and play locally.
+    chunk_size = args.chunk_size or default_chunk_size(args.games, max(args.concurrency, 1))
+    seed = state['seed'] if state else root_seed(args.seed)
 
-    # Multiprocess game execution and collect MetricTrackers from each simulated game (with a progress bar!)
-    print('Running Game Simulations...\n')
-    with mp.Pool(args.concurrency) as pool:
-        results = list(tqdm(pool.imap(worker, (setup_game(configuration) for _ in range(args.games))), total=args.games))
+    # Simulate the strategy, or compare strategies on the same games
+    if args.compare is not None:
+        run_comparison(args, seed, chunk_size, strategy_names, checkpoint=checkpoint, state=state)
+    else:
+        run_simulation(args, seed, chunk_size, checkpoint=checkpoint, state=state)
 
-    # Analyze the results of the games
-    print(header('ANALYTICS'))
-    analyzer = MultiGameAnalyzer(results)
-    analyzer.print_summary()
-    analyzer.create_plots()
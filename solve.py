@@ -0,0 +1,18 @@
+"""Script for solving the optimal static strategy CSVs for a number of decks."""
+
+from argparse import ArgumentParser
+
+from blackjack.strategies.ev_solver import solve_strategy
+
+
+if __name__ == '__main__':
+
+    # Command line args
+    parser = ArgumentParser()
+    parser.add_argument('-d', '--decks', help='Number of decks to solve the strategy for', type=int, default=3)
+    args = parser.parse_args()
+
+    # Solve the strategy (or find it already solved) and report where its CSVs are.
+    name = solve_strategy(args.decks)
+    print(f"Strategy CSVs are in: blackjack/strategies/csv/{name}/")
+    print(f"Load them in a StaticStrategy with: super().__init__(strategy_name='{name}')")
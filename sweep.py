@@ -0,0 +1,101 @@
+"""Script for simulating every combination (cell) of a grid of game parameters, and tabulating the results."""
+
+import csv
+import multiprocessing as mp
+from argparse import ArgumentParser
+from itertools import product
+
+from tqdm import tqdm
+
+from blackjack.analytics.multi_game_analyzer import MultiGameAnalyzer
+from blackjack.configuration import STRATEGY_MAP, get_simulation_configuration
+from blackjack.simulation.jobs import default_chunk_size, make_jobs, play_job
+from blackjack.simulation.seeding import root_seed
+
+
+# Columns of the results table: the grid parameters of each cell, then its results
+COLUMNS = (
+    'strategy', 'decks', 'bankroll', 'auto_wager', 'games', 'hands', 'avg_winnings', 'avg_amount_wagered',
+    'house_edge_pct', 'house_edge_ci_pct', 'min_final_bankroll', 'max_final_bankroll'
+)
+
+
+def get_cells(args):
+    """Get the parameters of every cell of the grid, as dicts."""
+    return [
+        {'strategy': strategy, 'decks': decks, 'bankroll': bankroll, 'auto_wager': auto_wager}
+        for strategy, decks, bankroll, auto_wager in product(args.strategy, args.decks, args.bankroll, args.auto_wager)
+    ]
+
+
+def tabulate(cell, analyzer):
+    """Get the row of the results table for a cell."""
+    return dict(
+        cell,
+        games=analyzer.final_bankroll_stats.count,
+        hands=analyzer.wins + analyzer.losses + analyzer.pushes + analyzer.insurance_wins,
+        avg_winnings=round(analyzer.final_bankroll_stats.mean - analyzer.initial_bankroll, 2),
+        avg_amount_wagered=round(analyzer.house_edge_stats.denominator_mean, 2),
+        house_edge_pct=round(analyzer.house_edge_stats.ratio() * 100.0, 4),
+        house_edge_ci_pct=round(analyzer.house_edge_stats.confidence_half_width() * 100.0, 4),
+        min_final_bankroll=analyzer.final_bankroll_stats.minimum,
+        max_final_bankroll=analyzer.final_bankroll_stats.maximum
+    )
+
+
+if __name__ == '__main__':
+
+    # Command line args (grid parameters take any number of values)
+    parser = ArgumentParser()
+    parser.add_argument('-a', '--auto-wager', help='Initial Gambler auto-wagers', type=float, nargs='+', default=[100.0])
+    parser.add_argument('-b', '--bankroll', help='Initial Gambler bankrolls', type=float, nargs='+', default=[1000.0])
+    parser.add_argument('-c', '--concurrency', help='Number of game subprocesses to run simultaneously', type=int, default=4)
+    parser.add_argument('-d', '--decks', help='Numbers of decks to play with', type=int, nargs='+', default=[3])
+    parser.add_argument('-e', '--engine', help='Game engine to simulate with', default='object', choices=['object', 'vectorized'])
+    parser.add_argument('-g', '--games', help='Number of games to simulate per cell', type=int, default=100)
+    parser.add_argument('-k', '--chunk-size', help='Number of games per subprocess job (default: a few jobs per subprocess per cell)', type=int)
+    parser.add_argument('-n', '--penetration', help='Fraction of the shoe dealt before reshuffling between turns', type=float, default=1.0)
+    parser.add_argument('-o', '--output', help='Path to write the results table to as a CSV')
+    parser.add_argument('-r', '--seed', help='Root random seed, for reproducible results (default: random)', type=int)
+    parser.add_argument('-s', '--strategy', help='Names of the gameplay strategies to use', nargs='+', default=['default'], choices=STRATEGY_MAP.keys())
+    parser.add_argument('-t', '--turns', help='Max number of turns to play per game', type=int, default=100)
+    args = parser.parse_args()
+    if not 0 < args.penetration <= 1:
+        parser.error('--penetration must be greater than 0 and at most 1')
+    if args.engine == 'vectorized' and 'counting' in args.strategy:
+        parser.error('The counting strategy is only supported by the object engine')
+
+    # Split every cell's games into jobs, tagged with the cell they belong to. Every cell plays the same game numbers
+    # off the same root seed, so cells with the same number of decks are dealt the same shoes.
+    cells = get_cells(args)
+    chunk_size = args.chunk_size or default_chunk_size(args.games, args.concurrency)
+    seed = root_seed(args.seed)
+    jobs = []
+    for index, cell in enumerate(cells):
+        configuration = get_simulation_configuration(
+            cell['bankroll'], cell['auto_wager'], cell['decks'], STRATEGY_MAP[cell['strategy']], args.turns, penetration=args.penetration
+        )
+        jobs.extend(dict(job, cell=index) for job in make_jobs(args.engine, configuration, seed, args.games, chunk_size))
+
+    # Run all cells through one pool of subprocesses, which keep their loaded strategies and built shoes between jobs.
+    print(f"Sweeping {len(cells)} cells of {args.games} games (seed: {seed})...\n")
+    analyzers = [MultiGameAnalyzer() for _ in cells]
+    with mp.Pool(args.concurrency) as pool, tqdm(total=len(cells) * args.games) as progress_bar:
+        for job, summaries in zip(jobs, pool.imap(play_job, jobs)):
+            analyzers[job['cell']].add_games(summaries)
+            progress_bar.update(len(summaries))
+
+    # Tidy results table: one row per cell
+    rows = [tabulate(cell, analyzer) for cell, analyzer in zip(cells, analyzers)]
+    widths = {column: max(len(column), *(len(str(row[column])) for row in rows)) for column in COLUMNS}
+    print()
+    print('  '.join(column.rjust(widths[column]) for column in COLUMNS))
+    for row in rows:
+        print('  '.join(str(row[column]).rjust(widths[column]) for column in COLUMNS))
+
+    if args.output:
+        with open(args.output, 'w', newline='') as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=COLUMNS)
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"\nResults table written to: {args.output}")
@@ -0,0 +1,31 @@
+import pytest
+
+from benchmarks.run import bench_game_controller_play, bench_get_hand_action, bench_shoe_deal_card, compare, result
+
+
+@pytest.fixture
+def baseline():
+    return {
+        'deal': result(1000.0, 'cards/s'),
+        'decide': result(2.0, 'us/call', higher_is_better=False),
+    }
+
+
+def test_regressions_are_flagged_past_the_threshold(baseline):
+    results = {'deal': result(850.0, 'cards/s'), 'decide': result(2.1, 'us/call', higher_is_better=False)}
+    assert compare(results, baseline, 0.1) == ['deal']
+
+
+def test_lower_is_better_results_regress_when_they_grow(baseline):
+    results = {'deal': result(1200.0, 'cards/s'), 'decide': result(2.5, 'us/call', higher_is_better=False)}
+    assert compare(results, baseline, 0.1) == ['decide']
+
+
+def test_benchmarks_missing_from_the_baseline_are_skipped(baseline):
+    assert compare({'new': result(1.0, 's', higher_is_better=False)}, baseline, 0.1) == []
+
+
+def test_benchmarks_report_their_results():
+    assert bench_shoe_deal_card(1, num_cards=1000)['unit'] == 'cards/s'
+    assert bench_get_hand_action(1, num_hands=100)['higher_is_better'] is False
+    assert bench_game_controller_play(1, num_games=2, max_turns=10)['value'] > 0
@@ -0,0 +1,84 @@
+import os
+import pickle
+
+import pytest
+
+from blackjack.analytics.multi_game_analyzer import MultiGameAnalyzer
+from blackjack.configuration import get_simulation_configuration
+from blackjack.simulation.checkpoint import Checkpoint
+from blackjack.simulation.jobs import make_jobs, play_job
+from blackjack.strategies.default_static_strategy import DefaultStaticStrategy
+
+
+PARAMETERS = {'games': 40, 'decks': 2, 'strategy': 'default'}
+
+
+def play_into(analyzer, seed, num_games, first_game=0):
+    """Play seeded games (numbered from `first_game` on) and aggregate them into an analyzer, as simulate.py does."""
+    configuration = get_simulation_configuration(200.0, 10.0, 2, DefaultStaticStrategy, 30)
+    for job in make_jobs('object', configuration, seed, num_games, 8, first_game=first_game):
+        analyzer.add_games(play_job(job))
+
+
+def test_round_trip(tmp_path):
+    path = os.fspath(tmp_path / 'run.checkpoint')
+    checkpoint = Checkpoint(path, PARAMETERS)
+    assert not checkpoint.exists()
+
+    analyzer = MultiGameAnalyzer()
+    play_into(analyzer, 7, 10)
+    checkpoint.save({'seed': 7, 'num_played': 10, 'analyzer': analyzer}, force=True)
+    assert checkpoint.exists()
+    assert not os.path.exists(f"{path}.tmp")
+
+    state = Checkpoint(path, dict(PARAMETERS)).load()
+    assert (state['seed'], state['num_played']) == (7, 10)
+    assert pickle.dumps(state['analyzer']) == pickle.dumps(analyzer)
+
+
+def test_resumed_run_matches_uninterrupted_run(tmp_path):
+    path = os.fspath(tmp_path / 'run.checkpoint')
+    uninterrupted = MultiGameAnalyzer()
+    play_into(uninterrupted, 7, 40)
+
+    interrupted = MultiGameAnalyzer()
+    play_into(interrupted, 7, 24)
+    Checkpoint(path, PARAMETERS).save({'num_played': 24, 'analyzer': interrupted}, force=True)
+
+    state = Checkpoint(path, PARAMETERS).load()
+    resumed = state['analyzer']
+    play_into(resumed, 7, 40 - state['num_played'], first_game=state['num_played'])
+    assert pickle.dumps(resumed) == pickle.dumps(uninterrupted)
+
+
+def test_saves_wait_for_the_interval(tmp_path):
+    path = os.fspath(tmp_path / 'run.checkpoint')
+    checkpoint = Checkpoint(path, PARAMETERS, interval=3600.0)
+    checkpoint.save({'num_played': 1})
+    assert not checkpoint.exists()
+
+    checkpoint.save({'num_played': 2}, force=True)
+    checkpoint.save({'num_played': 3})
+    assert checkpoint.load() == {'num_played': 2}
+
+
+def test_parameter_mismatch_raises(tmp_path):
+    path = os.fspath(tmp_path / 'run.checkpoint')
+    Checkpoint(path, PARAMETERS).save({'num_played': 10}, force=True)
+
+    with pytest.raises(ValueError) as error:
+        Checkpoint(path, dict(PARAMETERS, decks=6, strategy='insurance')).load()
+    assert 'decks (saved: 2, now: 6)' in str(error.value)
+    assert "strategy (saved: 'default', now: 'insurance')" in str(error.value)
+    assert 'games' not in str(error.value)
+
+
+def test_failed_saves_leave_no_temporary_file(tmp_path):
+    path = os.fspath(tmp_path / 'run.checkpoint')
+    checkpoint = Checkpoint(path, PARAMETERS)
+    checkpoint.save({'num_played': 1}, force=True)
+
+    with open(os.devnull) as stream, pytest.raises(TypeError):
+        checkpoint.save({'num_played': 2, 'stream': stream}, force=True)
+    assert not os.path.exists(f"{path}.tmp")
+    assert checkpoint.load() == {'num_played': 1}
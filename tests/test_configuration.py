@@ -0,0 +1,24 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from blackjack.configuration import get_interactive_configuration
+
+
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+
+def test_interactive_play_deals_the_whole_shoe_by_default():
+    assert get_interactive_configuration(True)['shoe']['penetration'] == 1.0
+    assert get_interactive_configuration(True, penetration=0.75)['shoe']['penetration'] == 0.75
+
+
+@pytest.mark.parametrize('penetration', ['0', '1.5'])
+def test_invalid_interactive_penetration_is_rejected(penetration):
+    process = subprocess.run(
+        [sys.executable, 'play.py', '--default', '--penetration', penetration], cwd=ROOT_DIRECTORY, capture_output=True, text=True
+    )
+    assert process.returncode == 2
+    assert '--penetration must be greater than 0 and at most 1' in process.stderr
@@ -0,0 +1,79 @@
+import os
+from time import sleep
+
+import pytest
+
+from blackjack.simulation.coordinator import Coordinator, parse_address
+
+
+AUTHKEY = b'test'
+NUM_JOBS = 20
+
+
+def square(job):
+    return job * job
+
+
+def fail_on_five(job):
+    if job == 5:
+        raise ValueError(f"Bad job: {job}")
+    return job * job
+
+
+def exit_once(job):
+    """Kill the worker process on job 3, the first time it's played (a marker file remembers it was)."""
+    value, marker = job
+    if value == 3 and not os.path.exists(marker):
+        open(marker, 'w').close()
+        os._exit(1)
+    return value * value
+
+
+def hang_once(job):
+    """Stall the worker on job 3 (past the lease timeout), the first time it's played."""
+    value, marker = job
+    if value == 3 and not os.path.exists(marker):
+        open(marker, 'w').close()
+        sleep(1.5)
+    return value * value
+
+
+@pytest.fixture
+def coordinator():
+    with Coordinator(('127.0.0.1', 0), AUTHKEY) as coordinator:
+        coordinator.start_local_workers(2)
+        yield coordinator
+
+
+def test_results_are_in_job_order(coordinator):
+    assert list(coordinator.imap(square, range(NUM_JOBS))) == [job * job for job in range(NUM_JOBS)]
+    # Later batches are played by the same workers
+    assert list(coordinator.imap(square, range(5))) == [0, 1, 4, 9, 16]
+    assert coordinator.lost_workers == 0
+
+
+def test_jobs_of_a_lost_worker_are_leased_again(coordinator, tmp_path):
+    marker = os.fspath(tmp_path / 'exited')
+    jobs = [(value, marker) for value in range(NUM_JOBS)]
+    assert list(coordinator.imap(exit_once, jobs)) == [value * value for value in range(NUM_JOBS)]
+    assert os.path.exists(marker)
+    assert coordinator.lost_workers == 1
+
+
+def test_jobs_of_a_stalled_worker_are_leased_again(tmp_path):
+    marker = os.fspath(tmp_path / 'stalled')
+    jobs = [(value, marker) for value in range(NUM_JOBS)]
+    with Coordinator(('127.0.0.1', 0), AUTHKEY, lease_timeout=0.5) as coordinator:
+        coordinator.start_local_workers(2)
+        assert list(coordinator.imap(hang_once, jobs)) == [value * value for value in range(NUM_JOBS)]
+        assert coordinator.lost_workers == 1
+
+
+def test_worker_errors_are_raised(coordinator):
+    with pytest.raises(ValueError, match='Bad job: 5'):
+        list(coordinator.imap(fail_on_five, range(NUM_JOBS)))
+
+
+@pytest.mark.parametrize('address, expected', [('10.0.0.2:5000', ('10.0.0.2', 5000)), (':5000', ('127.0.0.1', 5000))])
+def test_parse_address(address, expected):
+    assert parse_address(address) == expected
@@ -0,0 +1,114 @@
+import random
+
+import pytest
+
+from blackjack.configuration import get_simulation_configuration
+from blackjack.game_setup import setup_game
+from blackjack.models.card import FLYWEIGHTS, Card
+from blackjack.models.card_counter import HI_LO, CardCounter
+from blackjack.models.shoe import Shoe
+from blackjack.strategies.counting_strategy import CountingStrategy
+
+
+def hi_lo(codes):
+    """Hand-count the Hi-Lo running count of cards (by code): 2-6 count +1, 10s and Aces count -1."""
+    count = 0
+    for code in codes:
+        card = Card.from_code(code)
+        if card.is_ace() or card.value == 10:
+            count -= 1
+        elif card.value <= 6:
+            count += 1
+    return count
+
+
+class RecordingCountingStrategy(CountingStrategy):
+    """CountingStrategy that records its view of the count at every decision, along with what it should be."""
+
+    def __init__(self):
+        super().__init__()
+        self.dealer = None
+        self.decisions = []
+
+    def get_hand_action(self, hand, options, dealer_upcard):
+        # The hole card is dealt, but not counted until it's revealed at the end of the turn
+        seen = self.shoe.card_pile[:self.shoe.cursor]
+        hole_card = self.dealer.hand.cards[1]
+        self.decisions.append((self.counter.running_count, hi_lo(seen) - hi_lo([FLYWEIGHTS.index(hole_card)])))
+        return super().get_hand_action(hand, options, dealer_upcard)
+
+    def wants_to_change_wager(self):
+        # Between turns, every dealt card has been revealed
+        self.decisions.append((self.counter.running_count, hi_lo(self.shoe.card_pile[:self.shoe.cursor])))
+        return super().wants_to_change_wager()
+
+
+def test_hi_lo_weights_balance_over_a_deck():
+    assert sum(HI_LO) == 0
+    assert hi_lo(range(52)) == 0
+
+
+def test_running_and_true_counts_of_a_seeded_shoe():
+    shoe = Shoe(2, rng=random.Random(3))
+    counter = CardCounter()
+    shoe.attach_counter(counter)
+    for dealt in range(1, 60):
+        shoe.deal_card()
+        assert counter.running_count == hi_lo(shoe.card_pile[:dealt])
+        assert shoe.true_count() == pytest.approx(counter.running_count * 52 / (104 - dealt))
+
+
+def test_attaching_counts_the_cards_already_dealt():
+    shoe = Shoe(2, rng=random.Random(3))
+    shoe.deal_n_cards(10)
+    counter = CardCounter()
+    shoe.attach_counter(counter)
+    assert counter.running_count == hi_lo(shoe.card_pile[:10])
+
+
+def test_face_down_cards_are_counted_when_revealed():
+    shoe = Shoe(1, rng=random.Random(4))
+    counter = CardCounter()
+    shoe.attach_counter(counter)
+    shoe.deal_n_cards(3)
+    shoe.deal_card(face_down=True)
+    assert counter.running_count == hi_lo(shoe.card_pile[:3])
+    shoe.reveal_cards()
+    assert counter.running_count == hi_lo(shoe.card_pile[:4])
+
+
+def test_count_resets_on_reshuffle():
+    shoe = Shoe(1, rng=random.Random(5))
+    counter = CardCounter()
+    shoe.attach_counter(counter)
+    shoe.deal_n_cards(52)
+    assert counter.running_count == 0  # A whole deck balances out
+    shoe.deal_n_cards(5)  # Reshuffles, then deals 5 cards of the new pile
+    assert counter.running_count == hi_lo(shoe.card_pile[:5])
+
+
+@pytest.mark.parametrize('number_of_decks, penetration', [(6, 1.0), (1, 0.5)])
+def test_games_count_every_card_and_the_hole_card_on_reveal(number_of_decks, penetration):
+    # Half a deck is reshuffled at the cut card every few turns (without running out mid-turn), which resets the count
+    configuration = get_simulation_configuration(1000.0, 10.0, number_of_decks, RecordingCountingStrategy, 30, penetration=penetration)
+    game = setup_game(configuration, rng=random.Random(6))
+    game.strategy.dealer = game.dealer
+    game.play()
+
+    assert len(game.strategy.decisions) > 30
+    for running_count, expected in game.strategy.decisions:
+        assert running_count == expected
+
+
+@pytest.mark.parametrize('true_count, units', [(-3, 1), (1.9, 1), (2, 2), (3.5, 4), (4, 6), (5, 8), (12, 8)])
+def test_wagers_follow_the_bet_ramp(true_count, units):
+    strategy = CountingStrategy()
+    game = setup_game(get_simulation_configuration(1000.0, 10.0, 1, lambda: strategy, 10), rng=random.Random(7))
+    cards_remaining = game.shoe.cards_remaining()
+    strategy.counter.running_count = true_count * cards_remaining / 52
+    assert strategy.wager() == pytest.approx(units * 10.0)
+    assert strategy.wants_insurance() == (true_count >= CountingStrategy.INSURANCE_TRUE_COUNT)
+
+    # Wagers are capped at the bankroll
+    game.gambler.bankroll = 15.0
+    assert strategy.wager() == min(units * 10.0, 15.0)
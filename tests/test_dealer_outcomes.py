@@ -0,0 +1,78 @@
+import pytest
+
+from blackjack.analytics import dealer_outcomes
+from blackjack.analytics.dealer_outcomes import (
+    BLACKJACK, OUTCOMES, clear_cache, dealer_outcome_probabilities, remove_cards, shoe_composition
+)
+
+
+# Known dealer outcome probabilities for an infinite deck when the dealer hits soft 17 (H17), without peeking,
+# by upcard (Aces counted as 1) and ordered like OUTCOMES
+H17_INFINITE_DECK = {
+    1: (0.0575, 0.1432, 0.1432, 0.1432, 0.0663, 0.1389, 0.3077),
+    2: (0.1301, 0.1365, 0.1313, 0.1257, 0.1196, 0.3567, 0.0),
+    3: (0.1263, 0.1320, 0.1271, 0.1218, 0.1162, 0.3767, 0.0),
+    4: (0.1224, 0.1273, 0.1228, 0.1179, 0.1126, 0.3971, 0.0),
+    5: (0.1184, 0.1229, 0.1184, 0.1138, 0.1089, 0.4177, 0.0),
+    6: (0.1148, 0.1148, 0.1148, 0.1103, 0.1057, 0.4395, 0.0),
+    7: (0.3686, 0.1378, 0.0786, 0.0786, 0.0741, 0.2623, 0.0),
+    8: (0.1286, 0.3593, 0.1286, 0.0694, 0.0694, 0.2447, 0.0),
+    9: (0.1200, 0.1200, 0.3508, 0.1200, 0.0608, 0.2284, 0.0),
+    10: (0.1114, 0.1114, 0.1114, 0.3422, 0.0345, 0.2121, 0.0769),
+}
+
+UPCARDS = sorted(H17_INFINITE_DECK)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    yield
+    clear_cache()
+
+
+@pytest.mark.parametrize('number_of_decks', [1, 8])
+@pytest.mark.parametrize('peeked', [False, True])
+@pytest.mark.parametrize('upcard', UPCARDS)
+def test_probabilities_sum_to_one(number_of_decks, peeked, upcard):
+    probabilities = dealer_outcome_probabilities(upcard, remove_cards(shoe_composition(number_of_decks), upcard), peeked)
+    assert len(probabilities) == len(OUTCOMES)
+    assert all(probability >= 0 for probability in probabilities)
+    assert sum(probabilities) == pytest.approx(1.0)
+    if peeked:
+        assert probabilities[BLACKJACK] == 0
+
+
+@pytest.mark.parametrize('upcard', UPCARDS)
+def test_large_shoe_matches_infinite_deck_table(upcard):
+    # A large enough shoe is practically an infinite deck (the table is rounded to 4 places)
+    probabilities = dealer_outcome_probabilities(upcard, remove_cards(shoe_composition(64), upcard))
+    assert probabilities == pytest.approx(H17_INFINITE_DECK[upcard], abs=2e-3)
+
+
+@pytest.mark.parametrize('upcard', [1, 10])
+def test_peeking_conditions_on_no_blackjack(upcard):
+    composition = remove_cards(shoe_composition(2), upcard)
+    unpeeked = dealer_outcome_probabilities(upcard, composition)
+    peeked = dealer_outcome_probabilities(upcard, composition, peeked=True)
+    no_blackjack = 1.0 - unpeeked[BLACKJACK]
+    expected = [probability / no_blackjack for probability in unpeeked[:BLACKJACK]]
+    assert peeked[:BLACKJACK] == pytest.approx(expected)
+
+
+def test_dealer_draws_from_the_given_composition():
+    # Only 10s left: a 7 upcard always makes hard 17, and a 6 upcard hits 16 and busts
+    only_tens = (0,) * 9 + (5,)
+    assert dealer_outcome_probabilities(7, only_tens) == tuple(float(outcome == '17') for outcome in OUTCOMES)
+    assert dealer_outcome_probabilities(6, only_tens) == tuple(float(outcome == 'Bust') for outcome in OUTCOMES)
+
+    # Soft 17 is hit: with a 4 and a 6 left, an Ace upcard makes soft 17 and draws to 21, or soft 15 and draws to 21
+    assert dealer_outcome_probabilities(1, (0, 0, 0, 1, 0, 1, 0, 0, 0, 0)) == tuple(float(outcome == '21') for outcome in OUTCOMES)
+
+
+def test_caches_are_bounded():
+    composition = shoe_composition(8)
+    for upcard in UPCARDS:
+        dealer_outcome_probabilities(upcard, remove_cards(composition, upcard))
+    assert dealer_outcomes._final_outcomes.cache_info().maxsize == dealer_outcomes.FINAL_OUTCOMES_CACHE_SIZE
+    assert dealer_outcome_probabilities.cache_info().maxsize == dealer_outcomes.DEALER_OUTCOMES_CACHE_SIZE
+    assert 0 < dealer_outcomes._final_outcomes.cache_info().currsize <= dealer_outcomes.FINAL_OUTCOMES_CACHE_SIZE
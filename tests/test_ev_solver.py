@@ -0,0 +1,69 @@
+import csv
+import os
+
+import pytest
+
+from blackjack.analytics.dealer_outcomes import OUTCOMES, dealer_outcome_probabilities, remove_cards, shoe_composition
+from blackjack.strategies import ev_solver
+from blackjack.strategies.ev_solver import HandSolver, solve, solve_strategy
+
+
+# Known cells of 8-deck basic strategy when the dealer hits soft 17 (doubling after splits, no surrender)
+HARD_CELLS = [(16, '10', 'Hit'), (11, '6', 'Double'), (11, 'A', 'Double'), (12, '4', 'Stand'), (12, '2', 'Hit'),
+              (17, 'A', 'Stand'), (10, '10', 'Hit'), (9, '3', 'Double'), (9, '2', 'Hit')]
+SOFT_CELLS = [(18, '2', 'Double'), (18, '9', 'Hit'), (19, '6', 'Double'), (20, '6', 'Stand')]
+SPLIT_CELLS = [('A', 'A', 'Yes'), ('8', '10', 'Yes'), ('10', '6', 'No'), ('5', '6', 'No'), ('9', '7', 'No'), ('9', '8', 'Yes')]
+
+
+@pytest.fixture(scope='module')
+def solution():
+    return solve(8)
+
+
+def test_known_basic_strategy_cells(solution):
+    split_rows, soft_rows, hard_rows = solution
+    assert [hard_rows[total][upcard] for total, upcard, _ in HARD_CELLS] == [action for _, _, action in HARD_CELLS]
+    assert [soft_rows[total][upcard] for total, upcard, _ in SOFT_CELLS] == [action for _, _, action in SOFT_CELLS]
+    assert [split_rows[pair][upcard] for pair, upcard, _ in SPLIT_CELLS] == [decision for _, _, decision in SPLIT_CELLS]
+
+
+@pytest.mark.parametrize('upcard', range(1, 11))
+def test_stand_evs_match_dealer_outcomes(upcard):
+    composition = remove_cards(shoe_composition(8), upcard)
+    probabilities = dict(zip(OUTCOMES, dealer_outcome_probabilities(upcard, composition, peeked=True)))
+    solver = HandSolver(composition, tuple(probabilities.values()))
+
+    for total in range(4, 22):
+        dealer_totals = [int(outcome) for outcome in OUTCOMES if outcome.isdigit()]
+        expected = probabilities['Bust'] + sum(
+            probabilities[str(dealer_total)] * ((total > dealer_total) - (total < dealer_total)) for dealer_total in dealer_totals
+        )
+        assert solver.stand(total, False) == pytest.approx(expected)
+    assert solver.stand(22, False) == -1.0
+
+    # Soft hands stand on their high total
+    assert solver.stand(8, True) == pytest.approx(solver.stand(18, False))
+
+
+def test_hitting_never_beats_standing_on_hard_21():
+    composition = remove_cards(shoe_composition(8), 10)
+    solver = HandSolver(composition, dealer_outcome_probabilities(10, composition, peeked=True))
+    assert solver.hit(21, False) < solver.stand(21, False)
+    assert solver.double(21, False) < solver.stand(21, False)
+
+
+def test_solved_csvs_are_written_once(tmp_path, monkeypatch, solution):
+    monkeypatch.setattr(ev_solver, 'DIRECTORY', os.fspath(tmp_path))
+    name = solve_strategy(8)
+    assert name == ev_solver.strategy_name(8)
+
+    for csv_type, rows in zip(('split', 'soft', 'hard'), solution):
+        with open(tmp_path / 'csv' / name / f"{csv_type}.csv", newline='') as csv_file:
+            header, *csv_rows = csv.reader(csv_file)
+        assert header == ['', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'A']
+        assert {row[0]: dict(zip(header[1:], row[1:])) for row in csv_rows} == {str(label): decisions for label, decisions in rows.items()}
+
+    # Solutions are cached on disk
+    modified = os.path.getmtime(tmp_path / 'csv' / name / 'hard.csv')
+    assert solve_strategy(8) == name
+    assert os.path.getmtime(tmp_path / 'csv' / name / 'hard.csv') == modified
@@ -0,0 +1,107 @@
+import builtins
+import pickle
+import random
+
+import pytest
+
+from blackjack.configuration import get_simulation_configuration
+from blackjack.controllers import game_controller
+from blackjack.controllers.game_controller import GameController
+from blackjack.game_setup import setup_game
+from blackjack.strategies.insurance_static_strategy import InsuranceStaticStrategy
+
+
+@pytest.fixture
+def render_calls(monkeypatch):
+    """Count the renders of every game, without printing, pausing or waiting for input."""
+    calls = []
+    monkeypatch.setattr(GameController, 'render', lambda self: calls.append(self))
+    monkeypatch.setattr(GameController, 'render_game_over', lambda self: None)
+    monkeypatch.setattr(game_controller, 'sleep', lambda seconds: None)
+    monkeypatch.setattr(builtins, 'input', lambda prompt='': '')
+    return calls
+
+
+def make_game(verbose, seed):
+    """Set up a simulated game on a seeded shoe (8 decks last its 30 turns, so it never reshuffles)."""
+    configuration = get_simulation_configuration(300.0, 10.0, 8, InsuranceStaticStrategy, 30)
+    configuration['gameplay']['verbose'] = verbose
+    return setup_game(configuration, rng=random.Random(seed))
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_headless_play_matches_verbose_play(render_calls, seed):
+    verbose_game = make_game(True, seed)
+    verbose_game.play()
+    assert render_calls
+
+    render_calls.clear()
+    headless_game = make_game(False, seed)
+    headless_game.play()
+    assert not render_calls
+    assert not headless_game.activity
+    assert headless_game.metric_tracker.serialize_metrics() == verbose_game.metric_tracker.serialize_metrics()
+
+
+def test_headless_game_survives_pickling(render_calls):
+    game = make_game(False, 0)
+    unpickled_game = pickle.loads(pickle.dumps(game))
+    game.play()
+    unpickled_game.play()
+    assert not render_calls
+    assert unpickled_game.metric_tracker.serialize_metrics() == game.metric_tracker.serialize_metrics()
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_headless_play_never_renders_or_formats_messages(monkeypatch, seed):
+    def fail(*args):
+        raise AssertionError('Headless games must not render or format messages')
+
+    monkeypatch.setattr(GameController, 'render', fail)
+    monkeypatch.setattr(game_controller, 'money_format', fail)
+    game = make_game(False, seed)
+
+    # The rendered methods are bound without their `render_after` wrappers
+    for name in game_controller.RENDERED_METHODS:
+        assert getattr(game, name).__func__ is getattr(GameController, name).__wrapped__
+    game.play()
+    assert not game.activity
+
+
+class RecordingRandom(random.Random):
+    """Seeded RNG recording the shoe's dealing position whenever it's reshuffled."""
+
+    def __init__(self, seed):
+        super().__init__(seed)
+        self.shoe = None
+        self.reshuffled_at = []
+
+    def shuffle(self, cards):
+        if self.shoe is not None:
+            self.reshuffled_at.append(self.shoe.cursor)
+        super().shuffle(cards)
+
+
+@pytest.mark.parametrize('penetration', [0.5, 0.75])
+def test_shoe_is_reshuffled_between_turns_at_the_cut_card(penetration):
+    configuration = get_simulation_configuration(1000.0, 10.0, 1, InsuranceStaticStrategy, 100, penetration=penetration)
+    rng = RecordingRandom(8)
+    game = setup_game(configuration, rng=rng)
+    rng.shoe = game.shoe
+
+    # Record where each turn's deal starts
+    dealt_at = []
+    deal = game.deal
+
+    def recording_deal():
+        dealt_at.append(game.shoe.cursor)
+        deal()
+
+    game.deal = recording_deal
+    game.play()
+
+    # Turns are only dealt before the cut card, and the shoe is only reshuffled once it's reached (never mid-turn)
+    assert len(rng.reshuffled_at) > 5
+    assert all(cursor >= game.shoe.cut_card for cursor in rng.reshuffled_at)
+    assert all(cursor < game.shoe.cut_card for cursor in dealt_at)
+    assert dealt_at.count(0) == len(rng.reshuffled_at) + 1
@@ -0,0 +1,142 @@
+import asyncio
+import json
+import random
+
+import pytest
+
+from blackjack.configuration import get_server_configuration
+from blackjack.controllers.game_controller import GameController
+from blackjack.models.dealer import Dealer
+from blackjack.models.gambler import Gambler
+from blackjack.models.shoe import Shoe
+from blackjack.server.game_server import GameServer
+from blackjack.server.scripted_client import play_scripted_game, scripted_response
+from blackjack.strategies.base_strategy import BaseStrategy
+
+
+CONFIGURATION = get_server_configuration(500.0, 25.0, 2, max_turns=20)
+
+
+class ScriptedStrategy(BaseStrategy):
+    """The decisions of the scripted client (see `scripted_response()`), made locally."""
+
+    def wants_to_change_wager(self):
+        return False
+
+    def get_new_auto_wager(self):
+        raise AssertionError('The scripted client never changes its wager')
+
+    def get_hand_action(self, hand, options, dealer_upcard):
+        return 'Hit' if hand.final_total() < 17 else 'Stand'
+
+    def wants_even_money(self):
+        return False
+
+    def wants_insurance(self):
+        return False
+
+
+def run_with_server(client):
+    """Run a coroutine `client(server, port)` against a GameServer listening on an ephemeral local port."""
+    async def main():
+        server = GameServer(CONFIGURATION)
+        listener = await asyncio.start_server(server.handle_connection, '127.0.0.1', 0)
+        try:
+            return server, await client(server, listener.sockets[0].getsockname()[1])
+        finally:
+            listener.close()
+            await listener.wait_closed()
+
+    return asyncio.run(main())
+
+
+def play_local_game(seed):
+    """Play the scripted client's game with a GameController, on the same shoe as the server's seeded game."""
+    gambler = Gambler('Gambler', bankroll=500.0, auto_wager=25.0)
+    game = GameController(gambler, Dealer(), Shoe(2, rng=random.Random(seed), penetration=0.75), ScriptedStrategy(),
+                          verbose=False, max_turns=20, bankroll_stride=0)
+    game.play()
+    return game
+
+
+def test_scripted_games_play_like_local_games():
+    seeds = [3, 4, 5]
+
+    async def play_games(server, port):
+        results = []
+        for seed in seeds:
+            random.seed(seed)  # The server shuffles each game's shoe with the global RNG
+            results.append(await play_scripted_game('127.0.0.1', port))
+        return results
+
+    server, results = run_with_server(play_games)
+    for seed, result in zip(seeds, results):
+        game = play_local_game(seed)
+        assert result['turns'] == game.turn
+        assert result['bankroll'] == game.gambler.bankroll
+        assert result['summary'] == game.metric_tracker.summarize_metrics()
+    assert server.analyzer.final_bankroll_stats.count == len(seeds)
+    assert server.active_sessions == 0
+
+
+@pytest.mark.parametrize('invalid_wager', ['-5', '0', 'nan', 'inf', 'ten'])
+def test_invalid_auto_wagers_are_reprompted(invalid_wager):
+    prompts = []
+
+    def respond(prompt):
+        prompts.append(prompt)
+        if prompt['prompt'] == 'change_wager':
+            return 'y' if len(prompts) == 1 else 'n'
+        if prompt['prompt'] == 'auto_wager':
+            return '50' if 'error' in prompt else invalid_wager
+        return scripted_response(prompt)
+
+    server, result = run_with_server(lambda server, port: play_scripted_game('127.0.0.1', port, respond=respond))
+    assert [prompt['prompt'] for prompt in prompts[:3]] == ['change_wager', 'auto_wager', 'auto_wager']
+    assert prompts[2]['error'] == 'Invalid response. Please try again.'
+    assert next(prompt for prompt in prompts[3:] if prompt['prompt'] == 'change_wager')['auto_wager'] == 50.0
+    assert result['turns'] > 0
+    assert server.analyzer.final_bankroll_stats.count == 1
+
+
+async def receive(reader):
+    return json.loads(await reader.readline())
+
+
+@pytest.mark.parametrize('reply', [b'not json\n', b'{"response": "maybe"}\n', b'["y"]\n'])
+def test_invalid_responses_are_reprompted_then_abandoned(reply):
+    async def misbehave(server, port):
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        messages = [await receive(reader)]
+        while line := await reader.readline():
+            messages.append(json.loads(line))
+            if messages[-1]['type'] == 'prompt':
+                writer.write(reply)
+                await writer.drain()
+        writer.close()
+        return messages
+
+    server, messages = run_with_server(misbehave)
+    assert messages[0]['type'] == 'welcome'
+    prompts = [message for message in messages if message['type'] == 'prompt']
+    assert len(prompts) == 3
+    assert 'error' not in prompts[0]
+    assert all(prompt['error'] == 'Invalid response. Please try again.' for prompt in prompts[1:])
+
+    # The game is abandoned without being analyzed
+    assert server.analyzer.final_bankroll_stats.count == 0
+    assert server.active_sessions == 0
+
+
+def test_disconnected_games_are_abandoned():
+    async def disconnect(server, port):
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        await receive(reader)
+        await receive(reader)
+        writer.close()
+        await writer.wait_closed()
+        await asyncio.sleep(0.05)
+
+    server, _ = run_with_server(disconnect)
+    assert server.analyzer.final_bankroll_stats.count == 0
+    assert server.active_sessions == 0
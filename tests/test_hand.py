@@ -0,0 +1,59 @@
+import random
+
+import pytest
+
+from blackjack.models.card import FLYWEIGHTS
+from blackjack.models.hand import DealerHand, GamblerHand, Hand
+
+
+def reference_totals(cards):
+    """Compute a hand's (low, high) possible totals from its cards alone, counting at most one Ace as 11."""
+    low_total = sum(1 if card.is_ace() else card.value for card in cards)
+    if any(card.is_ace() for card in cards) and low_total + 10 <= 21:
+        return low_total, low_total + 10
+    return low_total, None
+
+
+def assert_totals_match(hand):
+    low_total, high_total = reference_totals(hand.cards)
+    assert hand.possible_totals() == (low_total, high_total)
+    assert hand.hard_total == low_total
+    assert hand.num_aces == sum(1 for card in hand.cards if card.is_ace())
+    assert hand.final_total() == (high_total or low_total)
+    assert hand.is_soft() == (high_total is not None)
+
+
+@pytest.mark.parametrize('hand_class', [Hand, GamblerHand, DealerHand])
+def test_running_totals_match_cards(hand_class):
+    rng = random.Random(0)
+    for _ in range(1000):
+        hand = hand_class(cards=rng.choices(FLYWEIGHTS, k=rng.randint(0, 2)))
+        assert_totals_match(hand)
+        for _ in range(rng.randint(1, 6)):
+            if hand.cards and rng.random() < 0.3:
+                index = rng.randrange(len(hand.cards))
+                expected = hand.cards[index]
+                assert hand.pop_card(index) is expected
+            else:
+                hand.add_card(rng.choice(FLYWEIGHTS))
+            assert_totals_match(hand)
+
+
+def test_split_keeps_totals_in_sync():
+    ace, five = (card for card in FLYWEIGHTS if card.name in ('Ace', '5') and card.suit == 'Spades')
+    hand = GamblerHand(cards=[ace, ace])
+    split_card = hand.pop_card()
+    assert split_card is ace
+    assert hand.possible_totals() == (1, 11)
+    hand.add_card(five)
+    assert hand.possible_totals() == (6, 16)
+    assert hand.is_soft()
+
+
+def test_cards_are_read_only():
+    hand = Hand(cards=FLYWEIGHTS[:2])
+    with pytest.raises(AttributeError):
+        hand.cards = []
+    with pytest.raises(AttributeError):
+        hand.cards.append(FLYWEIGHTS[2])
+    assert hand.cards == tuple(FLYWEIGHTS[:2])
@@ -0,0 +1,65 @@
+import os
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from blackjack.analytics.hand_log import HAND_DTYPE, OUTCOME_CODES, HandRecorder, load_hand_log
+from blackjack.configuration import get_simulation_configuration
+from blackjack.models.card import FLYWEIGHTS
+from blackjack.models.hand import ACTION_FLAGS, GamblerHand
+from blackjack.simulation.jobs import make_jobs, play_job
+from blackjack.strategies.default_static_strategy import DefaultStaticStrategy
+
+
+def settled_hand(card_codes, wager, outcome, earnings, actions=('Stand',)):
+    hand = GamblerHand(cards=[FLYWEIGHTS[code] for code in card_codes], wager=wager)
+    hand.outcome = outcome
+    hand.earnings = earnings
+    for action in actions:
+        hand.actions |= ACTION_FLAGS[action]
+    return hand
+
+
+def test_records_round_trip_through_npz_files(tmp_path):
+    recorder = HandRecorder(os.fspath(tmp_path), 'job', capacity=3)
+    expected = []
+    for game in range(3):
+        recorder.start_game(game)
+        for turn in range(1, 3):
+            hand = settled_hand([game, turn + 13], 10.0 * turn, 'Win', 20.0 * turn, actions=('Hit', 'Stand'))
+            recorder.record(turn, hand, FLYWEIGHTS[51])
+            expected.append((game, turn, 1, game, turn + 13, 51, 3, 10.0 * turn, 0.0, OUTCOME_CODES['Win'], 10.0 * turn))
+    recorder.flush()
+
+    # A full buffer is flushed to a new numbered file
+    assert sorted(os.listdir(tmp_path)) == ['hands-job-0000.npz', 'hands-job-0001.npz']
+    hands = load_hand_log(os.fspath(tmp_path))
+    assert hands.dtype == HAND_DTYPE
+    assert hands.tolist() == expected
+
+
+def test_empty_log_loads_as_no_records(tmp_path):
+    HandRecorder(os.fspath(tmp_path), 'job').flush()
+    assert load_hand_log(os.fspath(tmp_path)).size == 0
+
+
+def test_simulated_hands_account_for_every_game(tmp_path):
+    configuration = get_simulation_configuration(200.0, 10.0, 2, DefaultStaticStrategy, 30)
+    summaries = [
+        summary for job in make_jobs('object', configuration, 11, 20, 6, hand_log=os.fspath(tmp_path))
+        for summary in play_job(job)
+    ]
+    hands = load_hand_log(os.fspath(tmp_path))
+
+    # Each game's hands net out to its change in bankroll, and its outcomes add up to its counters
+    for game, summary in enumerate(summaries):
+        game_hands = hands[hands['game'] == game]
+        assert game_hands['net'].sum() == pytest.approx(summary['final_bankroll'] - summary['initial_bankroll'])
+        outcomes = Counter(game_hands['outcome'].tolist())
+        assert outcomes[OUTCOME_CODES['Loss']] == summary['losses']
+        assert outcomes[OUTCOME_CODES['Push']] == summary['pushes']
+
+        # Doubled hands (and only those) doubled the 10.00 wager
+        doubled = game_hands['actions'] & ACTION_FLAGS['Double'] > 0
+        assert np.array_equal(doubled, game_hands['wager'] == 20.0)
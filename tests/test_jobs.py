@@ -0,0 +1,61 @@
+import pickle
+
+import pytest
+
+from blackjack.configuration import get_simulation_configuration
+from blackjack.game_setup import setup_game
+from blackjack.simulation.jobs import default_chunk_size, make_jobs, play_job
+from blackjack.simulation.seeding import game_rng
+from blackjack.strategies.default_static_strategy import DefaultStaticStrategy
+
+
+SUMMARY_KEYS = {
+    'wins', 'losses', 'pushes', 'insurance_wins', 'insurance_losses', 'gambler_blackjacks', 'dealer_blackjacks',
+    'amount_wagered', 'turns', 'initial_bankroll', 'final_bankroll',
+}
+
+
+@pytest.fixture
+def configuration():
+    return get_simulation_configuration(200.0, 10.0, 2, DefaultStaticStrategy, 40)
+
+
+@pytest.mark.parametrize('num_games, chunk_size', [(10, 1), (10, 3), (10, 10), (10, 25)])
+def test_jobs_cover_every_game_once(configuration, num_games, chunk_size):
+    jobs = make_jobs('object', configuration, 0, num_games, chunk_size)
+    assert [game for job in jobs for game in range(job['start'], job['stop'])] == list(range(num_games))
+    assert all(job['stop'] - job['start'] <= chunk_size for job in jobs)
+
+
+def test_jobs_are_lightweight(configuration):
+    # Jobs describe their games rather than carry them, so they stay small however many games they cover
+    small_job, large_job = make_jobs('object', configuration, 0, 10, 1)[0], make_jobs('object', configuration, 0, 10000, 10000)[0]
+    assert len(pickle.dumps(large_job)) - len(pickle.dumps(small_job)) < 16
+    assert len(pickle.dumps(large_job)) < 1000
+
+
+@pytest.mark.parametrize('num_games, concurrency, expected', [(100, 4, 7), (3, 4, 1), (1000, 1, 250)])
+def test_default_chunk_size(num_games, concurrency, expected):
+    assert default_chunk_size(num_games, concurrency) == expected
+
+
+@pytest.mark.parametrize('engine', ['object', 'vectorized'])
+def test_play_job_summarizes_each_game(configuration, engine):
+    summaries = play_job(make_jobs(engine, configuration, 0, 12, 7)[1])
+    assert len(summaries) == 5
+    for summary in summaries:
+        assert set(summary) == SUMMARY_KEYS
+        assert summary['initial_bankroll'] == 200.0
+        assert summary['final_bankroll'] >= 0
+        assert summary['wins'] + summary['losses'] + summary['pushes'] > 0
+
+
+def test_reused_shoes_play_like_new_shoes(configuration):
+    # Workers reset and reuse one shoe per number of decks and penetration, rather than building one per game
+    job = make_jobs('object', configuration, 3, 8, 8)[0]
+    expected = []
+    for game_index in range(8):
+        game = setup_game(configuration, rng=game_rng(3, game_index))
+        game.play()
+        expected.append(game.metric_tracker.summarize_metrics())
+    assert play_job(job) == expected
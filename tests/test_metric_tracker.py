@@ -0,0 +1,31 @@
+import pickle
+
+import pytest
+
+from blackjack.analytics.metric_tracker import MetricTracker
+
+
+BANKROLLS = [100.0, 90.0, 110.0, 120.0, 100.0, 80.0, 95.0, 105.0]
+
+
+@pytest.mark.parametrize('bankroll_stride, expected', [(1, BANKROLLS), (3, [100.0, 120.0, 95.0]), (10, [100.0]), (0, [])])
+def test_progression_keeps_every_stride_th_bankroll(bankroll_stride, expected):
+    metric_tracker = MetricTracker(bankroll_stride=bankroll_stride)
+    for bankroll in BANKROLLS:
+        metric_tracker.append_bankroll(bankroll)
+
+    assert list(metric_tracker.bankroll_progression) == expected
+    summary = metric_tracker.summarize_metrics()
+    assert (summary['initial_bankroll'], summary['final_bankroll'], summary['turns']) == (100.0, 105.0, 7)
+    if bankroll_stride:
+        assert summary['bankroll_stride'] == bankroll_stride
+        assert list(summary['bankroll_progression']) == expected
+    else:
+        assert 'bankroll_stride' not in summary and 'bankroll_progression' not in summary
+
+
+def test_progression_pickles_compactly():
+    metric_tracker = MetricTracker()
+    for turn in range(10000):
+        metric_tracker.append_bankroll(float(turn))
+    assert len(pickle.dumps(metric_tracker.bankroll_progression)) < 8 * 10000 + 100
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from blackjack.analytics.multi_game_analyzer import MultiGameAnalyzer
+from blackjack.configuration import get_simulation_configuration
+from blackjack.simulation.jobs import make_jobs, play_job
+from blackjack.strategies.default_static_strategy import DefaultStaticStrategy
+
+
+COUNTERS = ('wins', 'losses', 'pushes', 'insurance_wins', 'insurance_losses', 'gambler_blackjacks', 'dealer_blackjacks')
+
+
+@pytest.fixture(scope='module')
+def summaries():
+    configuration = get_simulation_configuration(200.0, 10.0, 2, DefaultStaticStrategy, 40)
+    return [summary for job in make_jobs('object', configuration, 5, 300, 50) for summary in play_job(job)]
+
+
+def test_aggregates_match_summaries(summaries):
+    analyzer = MultiGameAnalyzer(summaries)
+    final_bankrolls = np.array([summary['final_bankroll'] for summary in summaries])
+
+    assert analyzer.initial_bankroll == 200.0
+    for counter in COUNTERS:
+        assert getattr(analyzer, counter) == sum(summary[counter] for summary in summaries)
+    assert analyzer.final_bankroll_stats.count == len(summaries)
+    assert analyzer.final_bankroll_stats.mean == pytest.approx(final_bankrolls.mean())
+    assert analyzer.final_bankroll_stats.std() == pytest.approx(final_bankrolls.std(ddof=1))
+    assert analyzer.final_bankroll_sketch.count == len(summaries)
+
+
+def test_incremental_aggregation_matches_all_at_once(summaries):
+    analyzer = MultiGameAnalyzer()
+    for start in range(0, len(summaries), 50):
+        analyzer.add_games(summaries[start:start + 50])
+
+    expected = MultiGameAnalyzer(summaries)
+    for counter in COUNTERS:
+        assert getattr(analyzer, counter) == getattr(expected, counter)
+    assert analyzer.final_bankroll_stats.mean == expected.final_bankroll_stats.mean
+    assert analyzer.final_bankroll_sketch.weighted_values() == expected.final_bankroll_sketch.weighted_values()
+
+
+def test_bankroll_progressions_are_kept_per_game_when_asked_to():
+    configuration = get_simulation_configuration(200.0, 10.0, 2, DefaultStaticStrategy, 40, bankroll_stride=4)
+    summaries = [summary for job in make_jobs('object', configuration, 5, 20, 20) for summary in play_job(job)]
+    analyzer = MultiGameAnalyzer(summaries, keep_progressions=True)
+
+    assert analyzer.bankroll_stride == 4
+    assert analyzer.num_progressions == len(summaries)
+    for index, summary in enumerate(summaries):
+        assert analyzer.get_bankroll_progression(index).tolist() == summary['bankroll_progression'].tolist()
+        assert analyzer.get_bankroll_progression(index)[0] == 200.0
+
+    # Otherwise they're dropped once aggregated
+    analyzer = MultiGameAnalyzer(summaries)
+    assert analyzer.num_progressions == 0
+    assert len(analyzer.bankroll_progressions) == 0
+    assert analyzer.final_bankroll_stats.count == len(summaries)
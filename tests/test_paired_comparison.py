@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from blackjack.analytics.paired_comparison import PairedComparison
+from blackjack.configuration import get_simulation_configuration
+from blackjack.controllers.vectorized_controller import VectorizedGameController
+from blackjack.game_setup import setup_game
+from blackjack.simulation import jobs
+from blackjack.simulation.jobs import compare_job, make_comparison_jobs, play_job
+from blackjack.strategies.default_static_strategy import DefaultStaticStrategy
+from blackjack.strategies.insurance_static_strategy import InsuranceStaticStrategy
+
+
+NUM_GAMES = 6
+
+
+def comparison_configurations():
+    return {
+        name: get_simulation_configuration(200.0, 10.0, 2, strategy, 20)
+        for name, strategy in (('default', DefaultStaticStrategy), ('insurance', InsuranceStaticStrategy))
+    }
+
+
+@pytest.fixture
+def initial_shoes(monkeypatch):
+    """Record the initially shuffled shoe of every game played, by either engine."""
+    shoes = []
+    controller_init = VectorizedGameController.__init__
+
+    def record_shoe(*args, **kwargs):
+        game = setup_game(*args, **kwargs)
+        shoes.append(list(game.shoe.card_pile))
+        return game
+
+    def record_shoes(self, *args, **kwargs):
+        controller_init(self, *args, **kwargs)
+        shoes.extend(shoe.tolist() for shoe in self.shoes)
+
+    monkeypatch.setattr(jobs, 'setup_game', record_shoe)
+    monkeypatch.setattr(VectorizedGameController, '__init__', record_shoes)
+    return shoes
+
+
+@pytest.mark.parametrize('engine', ['object', 'vectorized'])
+def test_strategies_play_identical_shoes(engine, initial_shoes):
+    configurations = comparison_configurations()
+    game_summaries = [summaries for job in make_comparison_jobs(engine, configurations, 5, NUM_GAMES, 4) for summaries in compare_job(job)]
+    assert len(game_summaries) == NUM_GAMES
+
+    # Each job plays its games once per strategy, in turn
+    assert len(initial_shoes) == 2 * NUM_GAMES
+    default_shoes = initial_shoes[:4] + initial_shoes[8:10]
+    insurance_shoes = initial_shoes[4:8] + initial_shoes[10:]
+    assert default_shoes == insurance_shoes
+    assert len({tuple(shoe) for shoe in default_shoes}) == NUM_GAMES
+
+
+@pytest.mark.parametrize('engine', ['object', 'vectorized'])
+def test_comparison_games_match_single_strategy_games(engine):
+    configurations = comparison_configurations()
+    for job in make_comparison_jobs(engine, configurations, 5, NUM_GAMES, 4):
+        game_summaries = compare_job(job)
+        for name, configuration in configurations.items():
+            expected = play_job(dict(job, configuration=configuration))
+            assert [summaries[name] for summaries in game_summaries] == expected
+
+
+def summary(net, amount_wagered=100.0):
+    return {'initial_bankroll': 200.0, 'final_bankroll': 200.0 + net, 'amount_wagered': amount_wagered}
+
+
+def test_paired_differences():
+    baseline_nets, other_nets = np.array([-30.0, 10.0, -50.0, 20.0]), np.array([-20.0, 10.0, -40.0, 40.0])
+    comparison = PairedComparison(['baseline', 'other'])
+    comparison.add_games(
+        {'baseline': summary(baseline_net), 'other': summary(other_net)}
+        for baseline_net, other_net in zip(baseline_nets, other_nets)
+    )
+
+    differences = other_nets - baseline_nets
+    assert comparison.net_stats['baseline'].mean == pytest.approx(baseline_nets.mean())
+    assert comparison.house_edge_stats['other'].ratio() == pytest.approx(-other_nets.sum() / 400.0)
+    assert comparison.difference_stats['other'].mean == pytest.approx(differences.mean())
+    assert comparison.difference_stats['other'].std() == pytest.approx(differences.std(ddof=1))
+    assert list(comparison.difference_stats) == ['other']
+
+
+def test_identical_strategies_do_not_differ(capsys):
+    configuration = get_simulation_configuration(200.0, 10.0, 2, DefaultStaticStrategy, 20)
+    comparison = PairedComparison(['first', 'second'])
+    for job in make_comparison_jobs('object', {'first': configuration, 'second': configuration}, 5, NUM_GAMES, 4):
+        comparison.add_games(compare_job(job))
+
+    assert comparison.difference_stats['second'].mean == 0.0
+    assert comparison.difference_stats['second'].std() == 0.0
+    comparison.print_summary()
+    assert 'n/a' in capsys.readouterr().out
@@ -0,0 +1,73 @@
+import pickle
+
+from blackjack.analytics.phase_timer import PHASES, PhaseTimer
+from blackjack.configuration import get_simulation_configuration
+from blackjack.game_setup import setup_game
+from blackjack.simulation.jobs import make_jobs, play_job
+from blackjack.simulation.profiling import PoolProfile, profile_job
+from blackjack.simulation.seeding import game_rng
+from blackjack.strategies.default_static_strategy import DefaultStaticStrategy
+
+
+CONFIGURATION = get_simulation_configuration(200.0, 10.0, 2, DefaultStaticStrategy, 25)
+
+
+def test_every_phase_is_timed_once_per_turn():
+    phase_timer = PhaseTimer()
+    timed_game = setup_game(CONFIGURATION, rng=game_rng(1, 0), phase_timer=phase_timer)
+    timed_game.play()
+
+    assert phase_timer.calls == dict.fromkeys(PHASES, timed_game.turn)
+    assert all(seconds > 0 for seconds in phase_timer.seconds.values())
+
+    # Timing doesn't change the game
+    game = setup_game(CONFIGURATION, rng=game_rng(1, 0))
+    game.play()
+    assert timed_game.metric_tracker.serialize_metrics() == game.metric_tracker.serialize_metrics()
+
+
+def test_phase_timers_merge():
+    phase_timers = [PhaseTimer(), PhaseTimer()]
+    for game_index, phase_timer in enumerate(phase_timers):
+        setup_game(CONFIGURATION, rng=game_rng(1, game_index), phase_timer=phase_timer).play()
+
+    merged = PhaseTimer()
+    for phase_timer in phase_timers:
+        merged.merge(phase_timer)
+    assert merged.total_calls() == sum(phase_timer.total_calls() for phase_timer in phase_timers)
+    assert merged.seconds['deal'] == sum(phase_timer.seconds['deal'] for phase_timer in phase_timers)
+
+
+def test_profiled_jobs_merge_into_a_pool_profile(capsys):
+    jobs = make_jobs('object', CONFIGURATION, 1, 6, 3)
+    pool_profile = PoolProfile()
+    for job in jobs:
+        # Profiles are sent back from subprocesses, so they must pickle
+        summaries, raw_stats, phase_timer = pickle.loads(pickle.dumps(profile_job(job)))
+        assert summaries == play_job(job)
+        pool_profile.add_job(raw_stats, phase_timer)
+
+    assert pool_profile.phase_timer.calls['deal'] == 6 * 25
+    assert any(function_name == 'play' for _, _, function_name in pool_profile.stats.stats)
+
+    pool_profile.print_summary()
+    output = capsys.readouterr().out
+    assert all(phase in output for phase in PHASES)
+    assert 'cumulative' in output
+
+
+def test_pool_profile_survives_pickling(capsys):
+    # Pool profiles are saved in checkpoints, and carry on merging jobs when resumed
+    jobs = make_jobs('object', CONFIGURATION, 1, 6, 3)
+    pool_profile = PoolProfile()
+    assert pickle.loads(pickle.dumps(pool_profile)).stats is None
+    pool_profile.add_job(*profile_job(jobs[0])[1:])
+
+    resumed_profile = pickle.loads(pickle.dumps(pool_profile))
+    assert resumed_profile.stats.stats == pool_profile.stats.stats
+    assert resumed_profile.stats.total_calls == pool_profile.stats.total_calls
+    resumed_profile.add_job(*profile_job(jobs[1])[1:])
+    assert resumed_profile.phase_timer.calls['deal'] == 6 * 25
+
+    resumed_profile.print_summary()
+    assert 'cumulative' in capsys.readouterr().out
@@ -0,0 +1,52 @@
+import multiprocessing as mp
+
+import pytest
+from numpy.random import SeedSequence
+
+from blackjack.configuration import get_simulation_configuration
+from blackjack.simulation.jobs import make_jobs, play_job
+from blackjack.simulation.seeding import game_rng, game_seed_sequence
+from blackjack.strategies.default_static_strategy import DefaultStaticStrategy
+
+
+NUM_GAMES = 60
+SEED = 20240601
+
+
+def play_games(engine, seed, chunk_size, pool=None, num_games=NUM_GAMES, first_game=0):
+    """Play a seeded simulation in jobs of `chunk_size` games (in worker processes if a pool is given)."""
+    configuration = get_simulation_configuration(200.0, 10.0, 2, DefaultStaticStrategy, 40)
+    jobs = make_jobs(engine, configuration, seed, num_games, chunk_size, first_game=first_game)
+    results = pool.imap(play_job, jobs) if pool else map(play_job, jobs)
+    return [summary for summaries in results for summary in summaries]
+
+
+@pytest.mark.parametrize('engine', ['object', 'vectorized'])
+def test_results_do_not_depend_on_chunking_or_concurrency(engine):
+    expected = play_games(engine, SEED, NUM_GAMES)
+    assert len(expected) == NUM_GAMES
+
+    for chunk_size in (1, 7, 25):
+        assert play_games(engine, SEED, chunk_size) == expected
+
+    with mp.Pool(2) as pool:
+        assert play_games(engine, SEED, 7, pool=pool) == expected
+
+
+@pytest.mark.parametrize('engine', ['object', 'vectorized'])
+def test_batches_extend_a_simulation(engine):
+    expected = play_games(engine, SEED, 10)
+    first_batch = play_games(engine, SEED, 10, num_games=NUM_GAMES // 2)
+    second_batch = play_games(engine, SEED, 10, num_games=NUM_GAMES // 2, first_game=NUM_GAMES // 2)
+    assert first_batch + second_batch == expected
+
+
+@pytest.mark.parametrize('engine', ['object', 'vectorized'])
+def test_different_seeds_play_different_games(engine):
+    assert play_games(engine, SEED, 10) != play_games(engine, SEED + 1, 10)
+
+
+def test_game_streams_are_independent_of_the_other_games():
+    assert game_rng(SEED, 3).random() == game_rng(SEED, 3).random()
+    assert game_rng(SEED, 3).random() != game_rng(SEED, 4).random()
+    assert game_seed_sequence(SEED, 3).generate_state(4).tolist() == SeedSequence(SEED).spawn(4)[3].generate_state(4).tolist()
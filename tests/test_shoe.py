@@ -0,0 +1,79 @@
+import random
+from collections import Counter
+
+import pytest
+
+from blackjack.models.card import FLYWEIGHTS, Card, card_code
+from blackjack.models.card_counter import CardCounter
+from blackjack.models.deck import Deck
+from blackjack.models.shoe import Shoe
+
+
+def test_card_codes_round_trip():
+    for suit_index, suit in enumerate(Card.SUITS):
+        for rank_index, (name, value) in enumerate(Card.RANKS):
+            card = Card.from_code(card_code(suit_index, rank_index))
+            assert (card.suit, card.name, card.value) == (suit, name, value)
+            assert FLYWEIGHTS[card_code(suit_index, rank_index)] is card
+
+
+def test_deck_has_every_card_once():
+    assert sorted(Deck.CODES) == list(range(52))
+    assert len({(card.suit, card.name) for card in Deck().cards()}) == 52
+
+
+def test_shoe_deals_every_card_once_per_shuffle():
+    shoe = Shoe(3)
+    assert shoe.cards_remaining() == 156
+
+    dealt = [shoe.deal_card() for _ in range(156)]
+    assert shoe.cards_remaining() == 0
+    # Dealt cards are the shared Card instances
+    assert Counter(FLYWEIGHTS.index(card) for card in dealt) == Counter({code: 3 for code in range(52)})
+
+    # An exhausted shoe is reshuffled (in place) before dealing on
+    card_pile = shoe.card_pile
+    shoe.deal_card()
+    assert shoe.card_pile is card_pile
+    assert shoe.cards_remaining() == 155
+    assert sorted(shoe.card_pile) == sorted(Deck.CODES * 3)
+
+
+def test_cards_are_dealt_in_pile_order():
+    shoe = Shoe(1)
+    assert shoe.deal_n_cards(10) == [Card.from_code(code) for code in shoe.card_pile[:10]]
+    assert shoe.cards() == [Card.from_code(code) for code in shoe.card_pile]
+
+
+def test_seeded_shoes_shuffle_alike():
+    shoes = [Shoe(2, rng=random.Random(7)) for _ in range(2)]
+    assert shoes[0].card_pile == shoes[1].card_pile
+    shoes[0].reset_card_pile()
+    shoes[1].reset_card_pile()
+    assert shoes[0].card_pile == shoes[1].card_pile
+    assert Shoe(2, rng=random.Random(8)).card_pile != shoes[0].card_pile
+
+
+def test_reset_shoe_shuffles_like_a_new_shoe():
+    shoe = Shoe(2, rng=random.Random(7), penetration=0.5)
+    shoe.attach_counter(CardCounter())
+    shoe.deal_n_cards(30)
+    shoe.reset(random.Random(8))
+    assert shoe.card_pile == Shoe(2, rng=random.Random(8)).card_pile
+    assert (shoe.cursor, shoe.cut_card, shoe.counter) == (0, 52, None)
+
+
+@pytest.mark.parametrize('penetration, cut_card', [(1.0, 104), (0.75, 78), (0.5, 52), (0.001, 1)])
+def test_cut_card_is_placed_by_penetration(penetration, cut_card):
+    shoe = Shoe(2, rng=random.Random(0), penetration=penetration)
+    assert shoe.cut_card == cut_card
+    shoe.deal_n_cards(cut_card - 1)
+    assert not shoe.past_cut_card()
+    shoe.deal_card()
+    assert shoe.past_cut_card()
+
+
+@pytest.mark.parametrize('penetration', [0, -0.5, 1.5])
+def test_invalid_penetration_raises(penetration):
+    with pytest.raises(ValueError):
+        Shoe(1, penetration=penetration)
@@ -0,0 +1,140 @@
+import os
+import pickle
+import re
+import subprocess
+import sys
+
+import pytest
+
+from blackjack.analytics.multi_game_analyzer import MultiGameAnalyzer
+from blackjack.configuration import get_simulation_configuration
+from blackjack.simulation.jobs import make_jobs, play_job
+from blackjack.strategies.default_static_strategy import DefaultStaticStrategy
+
+
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+ARGUMENTS = ['--seed', '11', '--turns', '20', '--games', '50', '--concurrency', '2']
+
+
+def run_simulate(*arguments, check=True):
+    """Run simulate.py (with plots rendered off screen), returning the completed process."""
+    return subprocess.run(
+        [sys.executable, 'simulate.py', *ARGUMENTS, *arguments], cwd=ROOT_DIRECTORY, env=dict(os.environ, MPLBACKEND='Agg'),
+        capture_output=True, text=True, check=check
+    )
+
+
+def batches_until(precision, max_games=None):
+    """Play the simulation's batches of games in process until the house edge CI is within the precision."""
+    configuration = get_simulation_configuration(1000.0, 100.0, 3, DefaultStaticStrategy, 20)
+    analyzer = MultiGameAnalyzer()
+    num_played = 0
+    while True:
+        num_games = min(50, max_games - num_played) if max_games else 50
+        for job in make_jobs('object', configuration, 11, num_games, 50, first_game=num_played):
+            analyzer.add_games(play_job(job))
+        num_played += num_games
+        half_width = analyzer.house_edge_stats.confidence_half_width() * 100.0
+        if half_width <= precision or num_played == max_games:
+            return num_played, half_width
+
+
+def stopping_report(output):
+    """Parse the early stopping report of simulate.py's output."""
+    match = re.search(r"(Reached|Did not reach) the target .* after (\d+) games \(±([\d.]+)%\)", output)
+    return match.group(1), int(match.group(2)), float(match.group(3))
+
+
+def test_stops_once_the_precision_is_reached():
+    num_played, half_width = batches_until(5.0)
+    assert num_played > 50  # Takes a few batches
+    assert stopping_report(run_simulate('--precision', '5').stdout) == ('Reached', num_played, round(half_width, 3))
+
+
+def test_stops_at_the_max_number_of_games():
+    num_played, half_width = batches_until(0.01, max_games=120)
+    assert num_played == 120
+    assert stopping_report(run_simulate('--precision', '0.01', '--max-games', '120').stdout) == (
+        'Did not reach', 120, round(half_width, 3)
+    )
+
+
+def test_compares_strategies():
+    output = run_simulate('--compare', 'default', 'insurance').stdout
+    assert "Paired Differences vs 'default' (50 games)" in output
+    assert 'insurance' in output
+
+
+def analytics(output):
+    """Get the analytics printed by simulate.py."""
+    return output[output.index('ANALYTICS'):]
+
+
+def test_resumed_run_matches_uninterrupted_run(tmp_path):
+    path = os.fspath(tmp_path / 'run.ckpt')
+    expected = run_simulate('--checkpoint', path).stdout
+
+    # Rewind the checkpoint to part way through the run, as if it had been interrupted
+    with open(path, 'rb') as checkpoint_file:
+        checkpoint = pickle.load(checkpoint_file)
+    configuration = get_simulation_configuration(1000.0, 100.0, 3, DefaultStaticStrategy, 20)
+    analyzer = MultiGameAnalyzer()
+    for job in make_jobs('object', configuration, 11, 20, 50):
+        analyzer.add_games(play_job(job))
+    checkpoint['state'].update(num_played=20, analyzer=analyzer)
+    with open(path, 'wb') as checkpoint_file:
+        pickle.dump(checkpoint, checkpoint_file)
+
+    assert analytics(run_simulate('--checkpoint', path, '--resume').stdout) == analytics(expected)
+
+
+def test_profiled_runs_are_checkpointed(tmp_path):
+    path = os.fspath(tmp_path / 'run.ckpt')
+    run_simulate('--profile', '--checkpoint', path)
+    assert not os.path.exists(f"{path}.tmp")
+
+    output = run_simulate('--profile', '--checkpoint', path, '--resume').stdout
+    assert 'PROFILE' in output and 'cumulative' in output
+
+
+def test_checkpoints_are_only_resumed_by_the_same_run(tmp_path):
+    path = os.fspath(tmp_path / 'run.ckpt')
+    run_simulate('--checkpoint', path)
+
+    process = run_simulate('--checkpoint', path, check=False)
+    assert process.returncode == 2
+    assert 'already exists' in process.stderr
+
+    process = run_simulate('--checkpoint', path, '--resume', '--decks', '6', check=False)
+    assert process.returncode == 2
+    assert 'decks (saved: 3, now: 6)' in process.stderr
+
+
+def test_coordinated_run_matches_local_run():
+    expected = run_simulate().stdout
+    assert analytics(run_simulate('--coordinator', '127.0.0.1:0').stdout) == analytics(expected)
+
+
+def test_risk_is_analyzed_from_tracked_bankrolls():
+    assert 'RISK' not in run_simulate().stdout
+    assert 'Games: 50 (bankrolls tracked every 5 turns)' in run_simulate('--bankroll-stride', '5').stdout
+
+
+@pytest.mark.parametrize('arguments', [
+    ['--max-games', '100'], ['--precision', '0'], ['--penetration', '1.5'], ['--compare', '--precision', '1'], ['--seats', '0'],
+    ['--seats', '2', '--engine', 'vectorized'], ['--resume'], ['--concurrency', '0'], ['--bankroll-stride', '-1'],
+])
+def test_invalid_arguments_are_rejected(arguments):
+    process = run_simulate(*arguments, check=False)
+    assert process.returncode == 2
+    assert 'error' in process.stderr
+
+
+@pytest.mark.parametrize('module', ['simulate', 'blackjack.simulation.jobs'])
+def test_startup_does_not_import_plotting(module):
+    # pandas is no longer used, and matplotlib is only imported once plots are created
+    process = subprocess.run(
+        [sys.executable, '-c', f"import sys, {module}; print(sorted(name for name in ('pandas', 'matplotlib') if name in sys.modules))"],
+        cwd=ROOT_DIRECTORY, capture_output=True, text=True, check=True
+    )
+    assert process.stdout.strip() == '[]'
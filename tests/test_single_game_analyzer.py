@@ -0,0 +1,15 @@
+from blackjack.analytics.metric_tracker import MetricTracker
+from blackjack.analytics.single_game_analyzer import SingleGameAnalyzer
+
+
+def test_summary_reports_the_house_edge(capsys):
+    metric_tracker = MetricTracker()
+    for bankroll in (1000.0, 900.0, 950.0):
+        metric_tracker.append_bankroll(bankroll)
+    metric_tracker.amount_wagered = 400.0
+    SingleGameAnalyzer(**metric_tracker.serialize_metrics()).print_summary()
+
+    output = capsys.readouterr().out
+    assert 'Turns Played: 2' in output
+    assert 'Amount Wagered: $400.00' in output
+    assert 'House Edge: +12.500%' in output
@@ -0,0 +1,94 @@
+import csv
+import itertools
+import os
+from collections import OrderedDict
+
+import pytest
+
+from blackjack.models.card import Card
+from blackjack.models.hand import GamblerHand
+from blackjack.strategies.base_static_strategy import DIRECTORY, BaseStaticStrategy
+from blackjack.strategies.default_static_strategy import DefaultStaticStrategy
+from blackjack.strategies.strategy_table import ACTIONS, SPLIT, card_value
+
+
+CSV_DIRECTORY = os.path.join(DIRECTORY, 'csv', 'default')
+
+# One card of each rank (the suit doesn't matter to strategies)
+CARDS = [Card('Spades', name, value) for name, value in Card.RANKS]
+
+
+def read_csv(csv_type):
+    """Read a default Strategy CSV as a list of (row label, dealer upcard label, decision) cells."""
+    with open(os.path.join(CSV_DIRECTORY, f"{csv_type}.csv"), newline='') as csv_file:
+        header, *rows = [row for row in csv.reader(csv_file) if row]
+    return [(row[0], upcard, decision) for row in rows for upcard, decision in zip(header[1:], row[1:])]
+
+
+def csv_action(hand, options, dealer_upcard):
+    """Decide on an action by checking the CSVs in turn, as static strategies did before they were compiled to tables."""
+    column = dealer_upcard.csv_format()
+    if 'Split' in options.values() and SPLIT_CELLS[hand.cards[0].csv_format(), column] == 'Yes':
+        return 'Split'
+    cells = SOFT_CELLS if hand.is_soft() else HARD_CELLS
+    action = cells[str(hand.final_total()), column]
+    if action == 'Double' and 'Double' not in options.values():
+        return 'Hit'
+    return action
+
+
+HARD_CELLS, SOFT_CELLS, SPLIT_CELLS = (
+    {(row, upcard): decision for row, upcard, decision in read_csv(csv_type)} for csv_type in ('hard', 'soft', 'split')
+)
+
+
+@pytest.fixture(scope='module')
+def table():
+    return BaseStaticStrategy.load_table('default')
+
+
+@pytest.mark.parametrize('soft, csv_type', [(0, 'hard'), (1, 'soft')])
+def test_totals_match_csv(table, soft, csv_type):
+    for total, upcard, decision in read_csv(csv_type):
+        assert table.action_code(int(total), soft, 0, card_value(upcard)) == ACTIONS.index(decision)
+
+
+def test_pairs_match_split_csv(table):
+    for pair, upcard, decision in read_csv('split'):
+        pair, upcard = card_value(pair), card_value(upcard)
+        # A pair of Aces is a soft 12, any other pair is a hard total
+        total, soft = (12, 1) if pair == 1 else (pair * 2, 0)
+        expected = SPLIT if decision == 'Yes' else table.action_code(total, soft, 0, upcard)
+        assert table.action_code(total, soft, pair, upcard) == expected
+
+
+def test_missing_cells_raise_key_error(table):
+    with pytest.raises(KeyError):
+        table.action_code(3, 0, 0, 10)
+
+
+@pytest.mark.parametrize('csv_type', ['split', 'soft', 'hard'])
+def test_rows_load_like_pandas(csv_type):
+    # Strategy CSVs used to be loaded with pandas, which reads numeric row labels as integers
+    pandas = pytest.importorskip('pandas')
+    expected = pandas.read_csv(os.path.join(CSV_DIRECTORY, f"{csv_type}.csv"), index_col=0).to_dict('index')
+    rows = BaseStaticStrategy._load_rows('default', csv_type)
+    assert {str(label): row for label, row in expected.items()} == rows
+
+
+@pytest.mark.parametrize('num_cards', [2, 3])
+def test_hand_actions_match_csv_lookups(num_cards):
+    strategy = DefaultStaticStrategy()
+    options_sets = [
+        OrderedDict([('h', 'Hit'), ('s', 'Stand')]),
+        OrderedDict([('h', 'Hit'), ('s', 'Stand'), ('d', 'Double')]),
+        OrderedDict([('h', 'Hit'), ('s', 'Stand'), ('d', 'Double'), ('x', 'Split')]),
+    ]
+    for cards in itertools.combinations_with_replacement(CARDS, num_cards):
+        hand = GamblerHand(cards=cards)
+        if hand.final_total() > 21:
+            continue
+        for options, dealer_upcard in itertools.product(options_sets, CARDS):
+            if 'Split' in options.values() and not hand.is_splittable():
+                continue
+            assert strategy.get_hand_action(hand, options, dealer_upcard) == csv_action(hand, options, dealer_upcard)
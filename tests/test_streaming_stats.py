@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+from blackjack.analytics.streaming_stats import QuantileSketch, RatioStats, RunningStats
+
+
+QUANTILES = np.linspace(0, 1, 101)
+
+
+@pytest.fixture
+def values():
+    return np.random.default_rng(0).normal(loc=-5.0, scale=40.0, size=10000)
+
+
+def test_running_stats_match_numpy(values):
+    stats = RunningStats()
+    for value in values:
+        stats.add(float(value))
+
+    assert stats.count == values.size
+    assert stats.mean == pytest.approx(values.mean())
+    assert stats.variance() == pytest.approx(values.var(ddof=1))
+    assert stats.std() == pytest.approx(values.std(ddof=1))
+    assert stats.minimum == values.min()
+    assert stats.maximum == values.max()
+
+
+def test_running_stats_of_few_values():
+    stats = RunningStats()
+    assert stats.variance() == 0.0
+    stats.add(3.0)
+    assert (stats.mean, stats.variance(), stats.minimum, stats.maximum) == (3.0, 0.0, 3.0, 3.0)
+
+
+def test_quantile_sketch_is_exact_below_capacity(values):
+    sketch = QuantileSketch(capacity=256)
+    for value in values[:255]:
+        sketch.add(float(value))
+
+    expected = np.quantile(values[:255], QUANTILES, method='inverted_cdf')
+    assert [sketch.quantile(q) for q in QUANTILES] == list(expected)
+    assert sketch.weighted_values() == [(value, 1) for value in sorted(values[:255])]
+
+
+@pytest.mark.parametrize('distribution', ['normal', 'exponential', 'sorted'])
+def test_quantile_sketch_ranks_are_close(distribution):
+    rng = np.random.default_rng(1)
+    values = {
+        'normal': rng.normal(size=100000),
+        'exponential': rng.exponential(size=100000),
+        'sorted': np.arange(100000.0),
+    }[distribution]
+    sketch = QuantileSketch(capacity=256)
+    for value in values:
+        sketch.add(float(value))
+
+    # Memory only grows with the logarithm of the stream's length, and every value is accounted for
+    assert sum(len(items) for items in sketch.levels) < 1000
+    assert sum(weight for _, weight in sketch.weighted_values()) == sketch.count == values.size
+
+    # Each quantile's rank among the values is within 2% of the requested one
+    sorted_values = np.sort(values)
+    for q in QUANTILES:
+        rank = np.searchsorted(sorted_values, sketch.quantile(q)) / values.size
+        assert rank == pytest.approx(q, abs=0.02)
+
+
+def test_quantile_sketch_is_deterministic(values):
+    sketches = [QuantileSketch(capacity=64), QuantileSketch(capacity=64)]
+    for sketch in sketches:
+        for value in values:
+            sketch.add(float(value))
+    assert sketches[0].weighted_values() == sketches[1].weighted_values()
+
+
+def test_empty_quantile_sketch_raises():
+    with pytest.raises(ValueError):
+        QuantileSketch().quantile(0.5)
+
+
+def test_ratio_stats_match_numpy():
+    rng = np.random.default_rng(2)
+    wagered = rng.integers(10, 100, size=5000).astype(float)
+    lost = wagered * rng.normal(loc=0.01, scale=1.0, size=wagered.size)
+    stats = RatioStats()
+    for numerator, denominator in zip(lost, wagered):
+        stats.add(float(numerator), float(denominator))
+
+    # Delta method: the standard error of the mean residual of the ratio, over the mean denominator
+    ratio = lost.sum() / wagered.sum()
+    residuals = lost - ratio * wagered
+    standard_error = np.sqrt(residuals.var(ddof=1) / wagered.size) / wagered.mean()
+    assert stats.ratio() == pytest.approx(ratio)
+    assert stats.standard_error() == pytest.approx(standard_error)
+    assert stats.confidence_half_width() == pytest.approx(1.96 * standard_error)
+
+
+def test_ratio_stats_of_few_values():
+    stats = RatioStats()
+    assert stats.ratio() == 0.0
+    stats.add(1.0, 10.0)
+    assert stats.ratio() == pytest.approx(0.1)
+    assert stats.standard_error() == float('inf')
@@ -0,0 +1,45 @@
+import csv
+import os
+import subprocess
+import sys
+
+from blackjack.analytics.multi_game_analyzer import MultiGameAnalyzer
+from blackjack.configuration import STRATEGY_MAP, get_simulation_configuration
+from blackjack.simulation.jobs import make_jobs, play_job
+from sweep import COLUMNS, tabulate
+
+
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+
+def test_sweep_tabulates_every_cell(tmp_path):
+    output = tmp_path / 'sweep.csv'
+    subprocess.run(
+        [sys.executable, 'sweep.py', '--seed', '3', '--games', '20', '--turns', '20', '--concurrency', '2',
+         '--decks', '1', '6', '--bankroll', '500', '1000', '--strategy', 'default', 'insurance', '--output', str(output)],
+        cwd=ROOT_DIRECTORY, capture_output=True, check=True
+    )
+    with open(output, newline='') as csv_file:
+        reader = csv.DictReader(csv_file)
+        assert tuple(reader.fieldnames) == COLUMNS
+        rows = list(reader)
+
+    # Every cell's row matches the same games simulated on their own
+    assert [(row['strategy'], row['decks'], row['bankroll']) for row in rows] == [
+        (strategy, decks, bankroll) for strategy in ('default', 'insurance') for decks in ('1', '6') for bankroll in ('500.0', '1000.0')
+    ]
+    for row in rows:
+        cell = {'strategy': row['strategy'], 'decks': int(row['decks']), 'bankroll': float(row['bankroll']), 'auto_wager': 100.0}
+        configuration = get_simulation_configuration(cell['bankroll'], 100.0, cell['decks'], STRATEGY_MAP[cell['strategy']], 20)
+        analyzer = MultiGameAnalyzer()
+        for job in make_jobs('object', configuration, 3, 20, 20):
+            analyzer.add_games(play_job(job))
+        assert row == {column: str(value) for column, value in tabulate(cell, analyzer).items()}
+
+
+def test_sweep_does_not_import_the_simulate_script():
+    process = subprocess.run(
+        [sys.executable, '-c', "import sys, sweep; print('simulate' in sys.modules)"], cwd=ROOT_DIRECTORY, capture_output=True,
+        text=True, check=True
+    )
+    assert process.stdout.strip() == 'False'
@@ -0,0 +1,77 @@
+import random
+
+import pytest
+
+from blackjack.configuration import get_simulation_configuration
+from blackjack.controllers.table_controller import TableController
+from blackjack.game_setup import setup_game, setup_table
+from blackjack.models.card import Card
+from blackjack.models.dealer import Dealer
+from blackjack.models.shoe import Shoe
+from blackjack.simulation.jobs import make_jobs, play_job
+from blackjack.simulation.seeding import game_rng
+from blackjack.strategies.default_static_strategy import DefaultStaticStrategy
+from blackjack.strategies.insurance_static_strategy import InsuranceStaticStrategy
+
+
+@pytest.mark.parametrize('strategy', [DefaultStaticStrategy, InsuranceStaticStrategy])
+@pytest.mark.parametrize('seed, penetration', [(0, 1.0), (1, 0.75), (2, 0.5)])
+def test_single_seat_table_plays_like_a_game(strategy, seed, penetration):
+    configuration = get_simulation_configuration(300.0, 10.0, 1, strategy, 60, penetration=penetration, bankroll_stride=1)
+    game = setup_game(configuration, rng=random.Random(seed))
+    game.play()
+    table = setup_table(configuration, rng=random.Random(seed))
+    table.play()
+
+    seat_metrics = table.seats[0].metric_tracker
+    assert seat_metrics.bankroll_progression == game.metric_tracker.bankroll_progression
+    assert seat_metrics.serialize_metrics() == game.metric_tracker.serialize_metrics()
+    assert table.summarize_metrics() == [game.metric_tracker.summarize_metrics()]
+
+
+def test_seats_share_the_shoe_and_dealer():
+    configuration = get_simulation_configuration(1000.0, 10.0, 2, DefaultStaticStrategy, 1, seats=3)
+    table = setup_table(configuration, rng=random.Random(4))
+    assert all(seat.shoe is table.shoe and seat.dealer is table.dealer for seat in table.seats)
+    assert len({id(seat.gambler) for seat in table.seats}) == len({id(seat.strategy) for seat in table.seats}) == 3
+
+    # Cards are dealt one to each seat then the dealer, twice
+    pile = [Card.from_code(code) for code in table.shoe.card_pile[:8]]
+    table.deal(table.seats)
+    assert [seat.gambler.hands[0].cards for seat in table.seats] == [(pile[0], pile[4]), (pile[1], pile[5]), (pile[2], pile[6])]
+    assert table.dealer.hand.cards == (pile[3], pile[7])
+    assert all(seat.gambler.hands[0].wager == 10.0 for seat in table.seats)
+
+
+def test_seats_play_against_the_same_dealer_hands():
+    configuration = get_simulation_configuration(10000.0, 10.0, 6, DefaultStaticStrategy, 200, penetration=0.75, seats=4,
+                                                 bankroll_stride=1)
+    table = setup_table(configuration, rng=random.Random(5))
+    table.play()
+
+    # Every seat plays every round (none runs out of money), so each sees every dealer blackjack, but its own hands
+    summaries = table.summarize_metrics()
+    assert table.turn == 200
+    assert all(len(seat.metric_tracker.bankroll_progression) == 201 for seat in table.seats)
+    assert len({summary['dealer_blackjacks'] for summary in summaries}) == 1
+    assert summaries[0]['dealer_blackjacks'] > 0
+    assert len({summary['final_bankroll'] for summary in summaries}) > 1
+
+
+def test_seats_must_share_the_dealer_and_shoe():
+    configuration = get_simulation_configuration(1000.0, 10.0, 2, DefaultStaticStrategy, 1)
+    game = setup_game(configuration)
+    with pytest.raises(ValueError):
+        TableController([game], Dealer(), game.shoe)
+    with pytest.raises(ValueError):
+        TableController([game], game.dealer, Shoe(2))
+
+
+def test_jobs_summarize_every_seat_as_a_game():
+    configuration = get_simulation_configuration(300.0, 10.0, 2, DefaultStaticStrategy, 20, seats=3)
+    job = make_jobs('object', configuration, 6, 4, 4)[0]
+    summaries = play_job(job)
+    assert len(summaries) == 12
+    table = setup_table(configuration, rng=game_rng(6, 1))
+    table.play()
+    assert summaries[3:6] == table.summarize_metrics()
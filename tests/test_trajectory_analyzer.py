@@ -0,0 +1,74 @@
+from array import array
+
+import numpy as np
+import pytest
+
+from blackjack.analytics.multi_game_analyzer import MultiGameAnalyzer
+from blackjack.analytics.trajectory_analyzer import PERCENTILES, TrajectoryAnalyzer
+from blackjack.configuration import get_simulation_configuration
+from blackjack.simulation.jobs import make_jobs, play_job
+from blackjack.strategies.default_static_strategy import DefaultStaticStrategy
+
+
+def game_summary(turns, final_bankroll, bankroll_progression, bankroll_stride):
+    """Summarize a game (only its bankroll progression is analyzed)."""
+    return {
+        'wins': 0, 'losses': 0, 'pushes': 0, 'insurance_wins': 0, 'insurance_losses': 0, 'gambler_blackjacks': 0,
+        'dealer_blackjacks': 0, 'amount_wagered': 1.0, 'initial_bankroll': bankroll_progression[0], 'turns': turns,
+        'final_bankroll': final_bankroll, 'bankroll_stride': bankroll_stride, 'bankroll_progression': array('d', bankroll_progression),
+    }
+
+
+def reference_trajectories(analyzer):
+    """Build the trajectory matrix game by game: each progression, its final bankroll if off-stride, then padding."""
+    stride = analyzer.bankroll_stride
+    rows = []
+    for index in range(analyzer.num_progressions):
+        row = list(analyzer.get_bankroll_progression(index))
+        if analyzer.progression_turns[index] % stride:
+            row.append(analyzer.progression_final_bankrolls[index])
+        rows.append(row)
+    width = max(len(row) for row in rows)
+    return np.array([row + [row[-1]] * (width - len(row)) for row in rows])
+
+
+@pytest.mark.parametrize('engine, bankroll_stride, max_turns', [('object', 7, 95), ('vectorized', 1, 60), ('vectorized', 10, 100)])
+def test_analytics_match_game_by_game_reference(engine, bankroll_stride, max_turns):
+    configuration = get_simulation_configuration(500.0, 100.0, 3, DefaultStaticStrategy, max_turns, bankroll_stride=bankroll_stride)
+    analyzer = MultiGameAnalyzer(keep_progressions=True)
+    for job in make_jobs(engine, configuration, 3, 200, 50):
+        analyzer.add_games(play_job(job))
+    trajectories = reference_trajectories(analyzer)
+    trajectory_analyzer = TrajectoryAnalyzer.from_analyzer(analyzer)
+
+    first_ruined = [next((column for column, bankroll in enumerate(row) if bankroll <= 0), None) for row in trajectories]
+    ruined = [column for column in first_ruined if column is not None]
+    assert trajectory_analyzer.num_ruined == len(ruined) > 0
+    assert sorted(trajectory_analyzer.ruin_turns) == sorted(column * bankroll_stride for column in ruined)
+    for column in range(trajectories.shape[1]):
+        expected = sum(1 for ruined_column in ruined if ruined_column <= column) / len(trajectories)
+        assert trajectory_analyzer.ruin_probabilities[column] == pytest.approx(expected)
+
+    max_drawdowns = (np.maximum.accumulate(trajectories, axis=1) - trajectories).max(axis=1)
+    assert trajectory_analyzer.max_drawdowns == pytest.approx(max_drawdowns)
+    assert trajectory_analyzer.bands == pytest.approx(np.percentile(trajectories, PERCENTILES, axis=0))
+
+
+def test_games_ending_off_stride_get_a_final_column():
+    analyzer = MultiGameAnalyzer(keep_progressions=True)
+    # Ended on turn 7 with the same bankroll as on turn 5, which must still count as a column (not as turn 5)
+    analyzer.add_game(game_summary(7, 8.0, [10.0, 8.0], 5))
+    analyzer.add_game(game_summary(10, 0.0, [10.0, 12.0, 0.0], 5))
+    trajectory_analyzer = TrajectoryAnalyzer.from_analyzer(analyzer)
+
+    assert list(trajectory_analyzer.turns) == [0, 5, 10]
+    assert list(trajectory_analyzer.max_drawdowns) == [2.0, 12.0]
+    assert list(trajectory_analyzer.ruin_turns) == [10]
+    assert list(trajectory_analyzer.ruin_probabilities) == [0.0, 0.0, 0.5]
+
+
+def test_no_progressions_raise():
+    with pytest.raises(ValueError):
+        TrajectoryAnalyzer.from_analyzer(MultiGameAnalyzer())
+    with pytest.raises(ValueError):
+        TrajectoryAnalyzer(np.empty((0, 3)), 1)
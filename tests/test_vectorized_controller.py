@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from blackjack.configuration import get_simulation_configuration
+from blackjack.controllers.vectorized_controller import VectorizedGameController
+from blackjack.game_setup import setup_game
+from blackjack.models.card import Card
+from blackjack.simulation.seeding import game_rng
+from blackjack.strategies.default_static_strategy import DefaultStaticStrategy
+from blackjack.strategies.insurance_static_strategy import InsuranceStaticStrategy
+
+
+NUM_GAMES = 200
+
+
+class KeepOrder:
+    """Stand-in RNG that leaves shoes in order when they're reshuffled, so both engines keep dealing the same cards."""
+
+    def shuffle(self, cards):
+        pass
+
+
+def play_both_engines(configuration, reshuffle_in_order=False):
+    """Play the same games (on identical shoes) with the object engine and the vectorized engine."""
+    vectorized = VectorizedGameController(configuration, NUM_GAMES)
+    if reshuffle_in_order:
+        vectorized.rngs = [KeepOrder()] * NUM_GAMES
+    games = []
+    for lane in range(NUM_GAMES):
+        game = setup_game(configuration, rng=game_rng(1234, lane))
+        if reshuffle_in_order:
+            game.shoe.rng = KeepOrder()
+        vectorized.shoes[lane] = np.array(game.shoe.card_pile, dtype=np.int8) % len(Card.RANKS)
+        games.append(game)
+
+    vectorized.play()
+    for game in games:
+        game.play()
+    return games, vectorized
+
+
+@pytest.mark.parametrize('strategy', [DefaultStaticStrategy, InsuranceStaticStrategy])
+@pytest.mark.parametrize('bankroll_stride', [0, 1, 3])
+def test_vectorized_engine_matches_object_engine(strategy, bankroll_stride):
+    # 8 decks last the 30 turns, so neither engine reshuffles
+    configuration = get_simulation_configuration(300.0, 10.0, 8, strategy, 30, bankroll_stride=bankroll_stride)
+    games, vectorized = play_both_engines(configuration)
+
+    for game, tracker, summary in zip(games, vectorized.metric_trackers(), vectorized.summarize_metrics()):
+        assert tracker.serialize_metrics() == game.metric_tracker.serialize_metrics()
+        assert summary == game.metric_tracker.summarize_metrics()
+
+
+@pytest.mark.parametrize('penetration', [0.5, 0.75, 1.0])
+def test_vectorized_engine_matches_object_engine_across_reshuffles(penetration):
+    configuration = get_simulation_configuration(3000.0, 10.0, 1, DefaultStaticStrategy, 100, penetration=penetration)
+    games, vectorized = play_both_engines(configuration, reshuffle_in_order=True)
+
+    assert vectorized.summarize_metrics() == [game.metric_tracker.summarize_metrics() for game in games]
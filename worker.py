@@ -0,0 +1,28 @@
+"""Script for running simulation worker processes on this host for a coordinating `simulate.py --coordinator` run."""
+
+import multiprocessing as mp
+from argparse import ArgumentParser
+
+from blackjack.simulation.coordinator import AUTHKEY_VARIABLE, get_authkey, parse_address, run_worker
+
+
+if __name__ == '__main__':
+
+    # Command line args
+    parser = ArgumentParser()
+    parser.add_argument('coordinator', help='Address (host:port) of the coordinating simulate.py run')
+    parser.add_argument('-c', '--concurrency', help='Number of worker processes to run simultaneously', type=int, default=mp.cpu_count())
+    parser.add_argument('-w', '--wait', help='Seconds to keep retrying to connect to the coordinator', type=float, default=60.0)
+    args = parser.parse_args()
+    authkey = get_authkey()
+    if authkey is None:
+        parser.error(f"The {AUTHKEY_VARIABLE} environment variable must be set to the coordinator's key")
+
+    # Each worker process plays the jobs leased to it until the coordinator is done
+    address = parse_address(args.coordinator)
+    print(f"Running {args.concurrency} workers for the coordinator at {address[0]}:{address[1]}...")
+    workers = [mp.Process(target=run_worker, args=(address, authkey, args.wait)) for _ in range(args.concurrency)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()